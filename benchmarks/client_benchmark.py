@@ -0,0 +1,203 @@
+"""Throughput and latency benchmark of the Content Understanding clients against the local mock service.
+
+Scenarios:
+    sequential    begin_analyze + poll_result, one document at a time (the notebook pattern)
+    analyze_many  AzureContentUnderstandingClient.analyze_many with --concurrency operations in flight
+    async         AsyncContentUnderstandingClient with --concurrency tasks in flight
+
+Each scenario runs in a fresh subprocess so its peak RSS is reported in isolation
+(the in-process mock service is included in that figure).
+
+Usage:
+    python benchmarks/client_benchmark.py --documents 200 --concurrency 32 --delay 1.0
+    python benchmarks/client_benchmark.py --scenario analyze_many --throttle-rps 50 --json
+"""
+import argparse
+import asyncio
+import json
+import math
+import resource
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT_DIR))
+
+from benchmarks.mock_service import MockContentUnderstandingService, MockServiceConfig  # noqa: E402
+
+API_VERSION = "2024-12-01-preview"
+ANALYZER_ID = "benchmark-analyzer"
+SCENARIOS = ("sequential", "analyze_many", "async")
+
+
+def percentile(values, fraction):
+    """Returns the nearest-rank percentile of the values."""
+    if not values:
+        return float("nan")
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+def peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS.
+    return peak / (1 << 20) if sys.platform == "darwin" else peak / 1024
+
+
+def run_sequential(endpoint, payloads, args):
+    from python.content_understanding_client import AzureContentUnderstandingClient
+
+    latencies, errors = [], 0
+    with AzureContentUnderstandingClient(endpoint, API_VERSION, subscription_key="benchmark") as client:
+        for payload in payloads:
+            start = time.perf_counter()
+            try:
+                response = client.begin_analyze(ANALYZER_ID, payload)
+                client.poll_result(response, timeout_seconds=args.timeout)
+                latencies.append(time.perf_counter() - start)
+            except Exception:
+                errors += 1
+    return latencies, errors
+
+
+def run_analyze_many(endpoint, payloads, args):
+    from python.content_understanding_client import AzureContentUnderstandingClient
+
+    latencies, errors = [], 0
+    with AzureContentUnderstandingClient(
+        endpoint, API_VERSION, subscription_key="benchmark", pool_maxsize=args.concurrency
+    ) as client:
+        for item in client.analyze_many(
+            ANALYZER_ID, payloads, max_in_flight=args.concurrency, timeout_seconds=args.timeout
+        ):
+            if item.succeeded:
+                latencies.append(item.elapsed_seconds)
+            else:
+                errors += 1
+    return latencies, errors
+
+
+def run_async(endpoint, payloads, args):
+    from python.content_understanding_async_client import AsyncContentUnderstandingClient
+
+    async def run():
+        latencies, errors = [], 0
+        limit = asyncio.Semaphore(args.concurrency)
+        async with AsyncContentUnderstandingClient(
+            endpoint, API_VERSION, subscription_key="benchmark", max_concurrency=args.concurrency
+        ) as client:
+
+            async def analyze(payload):
+                nonlocal errors
+                async with limit:
+                    start = time.perf_counter()
+                    try:
+                        response = await client.begin_analyze(ANALYZER_ID, payload)
+                        await client.poll_result(response, timeout_seconds=args.timeout)
+                        latencies.append(time.perf_counter() - start)
+                    except Exception:
+                        errors += 1
+
+            await asyncio.gather(*(analyze(payload) for payload in payloads))
+        return latencies, errors
+
+    return asyncio.run(run())
+
+
+def run_scenario(scenario, args):
+    config = MockServiceConfig(
+        processing_seconds=args.delay,
+        processing_jitter=args.jitter,
+        failure_rate=args.failure_rate,
+        error_rate=args.error_rate,
+        throttle_rps=args.throttle_rps,
+    )
+    payload = b"\0" * (args.payload_kb * 1024)
+    payloads = [payload] * args.documents
+    runner = {"sequential": run_sequential, "analyze_many": run_analyze_many, "async": run_async}[scenario]
+    with MockContentUnderstandingService(config) as service:
+        start = time.perf_counter()
+        latencies, errors = runner(service.endpoint, payloads, args)
+        wall_seconds = time.perf_counter() - start
+        stats = dict(service.stats)
+    requests = sum(count for name, count in stats.items() if name not in ("throttled", "errors"))
+    analyses = stats.get("analyze", 0)
+    return {
+        "scenario": scenario,
+        "documents": args.documents,
+        "succeeded": len(latencies),
+        "failed": errors,
+        "wall_seconds": wall_seconds,
+        "documents_per_second": len(latencies) / wall_seconds,
+        "requests_per_second": requests / wall_seconds,
+        "latency_p50": percentile(latencies, 0.50),
+        "latency_p95": percentile(latencies, 0.95),
+        "latency_p99": percentile(latencies, 0.99),
+        "status_polls": stats.get("get_result", 0),
+        "polls_per_document": stats.get("get_result", 0) / analyses if analyses else 0,
+        "throttled": stats.get("throttled", 0),
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def print_table(results):
+    columns = [
+        ("scenario", "{:<13}"), ("succeeded", "{:>9}"), ("failed", "{:>6}"),
+        ("documents_per_second", "{:>9.1f}"), ("requests_per_second", "{:>9.1f}"),
+        ("latency_p50", "{:>7.2f}"), ("latency_p95", "{:>7.2f}"), ("latency_p99", "{:>7.2f}"),
+        ("status_polls", "{:>7}"), ("polls_per_document", "{:>8.2f}"), ("throttled", "{:>9}"),
+        ("peak_rss_mb", "{:>8.1f}"),
+    ]
+    headers = ["scenario", "succeeded", "failed", "docs/s", "req/s", "p50 s", "p95 s", "p99 s",
+               "polls", "polls/doc", "throttled", "RSS MB"]
+    widths = [len(fmt.format(results[0][name])) if results else len(header) for (name, fmt), header in zip(columns, headers)]
+    print("  ".join(header.rjust(max(width, len(header))) for header, width in zip(headers, widths)))
+    for result in results:
+        print("  ".join(
+            fmt.format(result[name]).rjust(max(width, len(header)))
+            for (name, fmt), header, width in zip(columns, headers, widths)
+        ))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenario", choices=SCENARIOS + ("all",), default="all")
+    parser.add_argument("--documents", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--payload-kb", type=int, default=64, help="size of each uploaded document")
+    parser.add_argument("--delay", type=float, default=1.0, help="mock processing seconds per document")
+    parser.add_argument("--jitter", type=float, default=0.5, help="relative spread of the processing time")
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rps", type=float, default=None)
+    parser.add_argument("--timeout", type=float, default=120)
+    parser.add_argument("--json", action="store_true", help="print results as JSON lines")
+    args = parser.parse_args()
+
+    if args.scenario != "all":
+        result = run_scenario(args.scenario, args)
+        if args.json:
+            print(json.dumps(result))
+        else:
+            print_table([result])
+        return
+
+    results = []
+    forwarded = [arg for arg in sys.argv[1:] if arg != "--json"]
+    for scenario in SCENARIOS:
+        output = subprocess.run(
+            [sys.executable, __file__, *forwarded, "--scenario", scenario, "--json"],
+            check=True, capture_output=True, text=True,
+        ).stdout
+        results.append(json.loads(output.strip().splitlines()[-1]))
+    if args.json:
+        for result in results:
+            print(json.dumps(result))
+    else:
+        print_table(results)
+
+
+if __name__ == "__main__":
+    main()
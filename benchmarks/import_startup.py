@@ -0,0 +1,117 @@
+"""Cold-start import benchmark of the client package, with an enforced time budget.
+
+Each sample runs in a fresh interpreter and times the import statement alone
+(interpreter startup is excluded), so it reflects what a serverless worker pays
+on every cold start.
+
+Scenarios:
+    package  import python
+    client   from python import AzureContentUnderstandingClient, then construct a client
+    eager    import every module of the package up front, as before the lazy layout
+
+The client scenario must stay under --budget-ms (median of --repeat samples)
+and must not load any of the heavy optional modules listed in HEAVY_MODULES;
+the script exits with status 1 otherwise, so it can run as a CI check.
+
+Usage:
+    python benchmarks/import_startup.py [--repeat 15] [--budget-ms 250] [--profile]
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+# Modules a synchronous client must not pull in at import or construction time.
+HEAVY_MODULES = (
+    "aiohttp", "azure.identity", "PIL", "pyarrow", "numpy", "pypdf",
+    "opentelemetry", "sqlite3", "multiprocessing", "wave",
+)
+
+EAGER_MODULES = (
+    "content_understanding_client", "content_understanding_async_client", "analyze_result",
+    "chunking", "client_base", "credentials", "instrumentation", "job_journal", "polling", "rate_limiter",
+    "result_cache", "result_export", "training_preflight",
+    "extension.json_stream", "extension.transcripts_processor",
+)
+
+SCENARIOS = {
+    "package": "import python",
+    "client": (
+        "from python import AzureContentUnderstandingClient\n"
+        "AzureContentUnderstandingClient('https://example.invalid', '2024-12-01-preview', subscription_key='key')"
+    ),
+    "eager": "\n".join(f"import python.{module}" for module in EAGER_MODULES),
+}
+
+# Runs in the child interpreter: times the scenario code and reports the heavy modules it loaded.
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+exec(compile({code!r}, "<scenario>", "exec"))
+elapsed_ms = (time.perf_counter() - start) * 1000
+heavy = [name for name in {heavy!r} if name in sys.modules]
+print(json.dumps({{"elapsed_ms": elapsed_ms, "heavy_modules": heavy}}))
+"""
+
+
+def run_sample(code, extra_args=()):
+    completed = subprocess.run(
+        [sys.executable, *extra_args, "-c", _PROBE.format(code=code, heavy=HEAVY_MODULES)],
+        cwd=ROOT_DIR, check=True, capture_output=True, text=True,
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1]), completed.stderr
+
+
+def print_profile(code, top):
+    """Prints the modules with the largest cumulative import time, from `python -X importtime`."""
+    _, stderr = run_sample(code, ("-X", "importtime"))
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, self_us, cumulative_us, name = (part.strip() for part in line.replace("import time:", "|").split("|"))
+        rows.append((int(cumulative_us), int(self_us), name))
+    print(f"\n{'cumulative ms':>13} {'self ms':>8}  module")
+    for cumulative_us, self_us, name in sorted(rows, reverse=True)[:top]:
+        print(f"{cumulative_us / 1000:>13.1f} {self_us / 1000:>8.1f}  {name}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=15, help="fresh interpreters per scenario")
+    parser.add_argument("--budget-ms", type=float, default=250, help="median budget of the client scenario")
+    parser.add_argument("--profile", action="store_true", help="print the slowest imports of the client scenario")
+    args = parser.parse_args()
+
+    medians = {}
+    failures = []
+    print(f"{'scenario':<9} {'median ms':>10} {'min ms':>8} {'max ms':>8}  heavy modules loaded")
+    for name, code in SCENARIOS.items():
+        samples = [run_sample(code)[0] for _ in range(args.repeat)]
+        times = [sample["elapsed_ms"] for sample in samples]
+        heavy = samples[-1]["heavy_modules"]
+        medians[name] = statistics.median(times)
+        print(
+            f"{name:<9} {medians[name]:>10.1f} {min(times):>8.1f} {max(times):>8.1f}  "
+            f"{', '.join(heavy) or '-'}"
+        )
+        if name == "client" and heavy:
+            failures.append(f"the client loaded heavy modules: {', '.join(heavy)}")
+    print(f"\nclient vs eager: {medians['eager'] - medians['client']:.1f} ms saved per cold start "
+          f"({medians['eager'] / medians['client']:.1f}x faster)")
+
+    if medians["client"] > args.budget_ms:
+        failures.append(f"the client took {medians['client']:.1f} ms, over the {args.budget_ms:.0f} ms budget")
+    if args.profile:
+        print_profile(SCENARIOS["client"], top=20)
+    for failure in failures:
+        print(f"FAILED: {failure}", file=sys.stderr)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
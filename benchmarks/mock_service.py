@@ -0,0 +1,382 @@
+"""Local stand-in for the Content Understanding service, for benchmarks and offline runs.
+
+Emulates the endpoints used by AzureContentUnderstandingClient:
+    PUT/GET/DELETE /contentunderstanding/analyzers/{id}
+    GET            /contentunderstanding/analyzers (paginated with nextLink)
+    POST           /contentunderstanding/analyzers/{id}:analyze
+    GET            /contentunderstanding/analyzerResults/{operation id}
+    GET            /contentunderstanding/analyzerResults/{operation id}/images/{image id}
+with configurable processing delays, failure rates and 429 throttling.
+
+Usage:
+    python benchmarks/mock_service.py --port 8080 --delay 1.5 --throttle-rps 50
+"""
+import argparse
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+_ANALYZER_PATH = re.compile(r"^/contentunderstanding/analyzers/([^/:]+)$")
+_ANALYZE_PATH = re.compile(r"^/contentunderstanding/analyzers/([^/:]+):analyze$")
+_RESULT_PATH = re.compile(r"^/contentunderstanding/analyzerResults/([^/]+)$")
+_IMAGE_PATH = re.compile(r"^/contentunderstanding/analyzerResults/([^/]+)/images/([^/]+)$")
+
+# JPEG-framed placeholder bytes (SOI ... EOI), served for every image id.
+_JPEG_PLACEHOLDER = b"\xff\xd8\xff\xe0" + bytes(1020) + b"\xff\xd9"
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    # The default backlog of 5 resets connections when many clients connect at once.
+    request_queue_size = 1024
+
+
+class MockServiceConfig:
+    """Behaviour of the mock service.
+
+    Attributes:
+        queue_seconds (float): How long an operation reports "NotStarted" before it starts running.
+        processing_seconds (float): The base duration of an analyze operation, once running.
+        processing_seconds_per_mb (float): The extra duration per uploaded megabyte.
+        processing_jitter (float): The relative random spread of the duration, e.g. 0.5 for +/-50%.
+        failure_rate (float): The probability that an operation ends with status "Failed".
+        error_rate (float): The probability that any request is answered with HTTP 500.
+        throttle_rps (float): The request rate above which requests get 429; None disables throttling.
+        retry_after_seconds (int): The Retry-After value sent with 429 responses, in whole seconds
+            as required by HTTP.
+        page_size (int): The number of analyzers per page of the analyzer list.
+        image_count (int): The number of keyframes reported in each result.
+    """
+
+    def __init__(
+        self,
+        processing_seconds: float = 1.0,
+        queue_seconds: float = 0.0,
+        processing_seconds_per_mb: float = 0.0,
+        processing_jitter: float = 0.5,
+        failure_rate: float = 0.0,
+        error_rate: float = 0.0,
+        throttle_rps: float = None,
+        retry_after_seconds: int = 1,
+        page_size: int = 50,
+        image_count: int = 4,
+    ):
+        self.processing_seconds = processing_seconds
+        self.queue_seconds = queue_seconds
+        self.processing_seconds_per_mb = processing_seconds_per_mb
+        self.processing_jitter = processing_jitter
+        self.failure_rate = failure_rate
+        self.error_rate = error_rate
+        self.throttle_rps = throttle_rps
+        self.retry_after_seconds = retry_after_seconds
+        self.page_size = page_size
+        self.image_count = image_count
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    service = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, body=b"", content_type="application/json", headers=None):
+        if isinstance(body, (dict, list)):
+            body = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if body:
+            self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def _read_body(self):
+        """Reads the request body in blocks and returns its size and the decoded JSON, if any."""
+        size = 0
+        blocks = []
+        if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+            while True:
+                length = int(self.rfile.readline().split(b";")[0].strip(), 16)
+                if length == 0:
+                    self.rfile.readline()
+                    break
+                block = self.rfile.read(length)
+                self.rfile.readline()
+                size += len(block)
+                if size <= 1 << 20:
+                    blocks.append(block)
+        else:
+            remaining = int(self.headers.get("Content-Length") or 0)
+            while remaining:
+                block = self.rfile.read(min(remaining, 1 << 20))
+                if not block:
+                    break
+                remaining -= len(block)
+                size += len(block)
+                if size <= 1 << 20:
+                    blocks.append(block)
+        body = None
+        if "json" in (self.headers.get("Content-Type") or "") and blocks:
+            body = json.loads(b"".join(blocks))
+        return size, body
+
+    def _handle(self, method):
+        service = self.service
+        url = urlparse(self.path)
+        route = self._route(method, url.path)
+        service._count(route)
+        size, body = self._read_body() if method in ("POST", "PUT") else (0, None)
+        throttled_for = service._throttle()
+        if throttled_for:
+            service._count("throttled")
+            return self._send(
+                429,
+                {"error": {"code": "429", "message": "Rate limit exceeded."}},
+                headers={"Retry-After": str(throttled_for)},
+            )
+        if random.random() < service.config.error_rate:
+            service._count("errors")
+            return self._send(500, {"error": {"code": "InternalServerError", "message": "Injected failure."}})
+        handler = getattr(self, f"_{route}", None)
+        if handler is None:
+            return self._send(404, {"error": {"code": "NotFound", "message": url.path}})
+        return handler(url, size, body)
+
+    def _route(self, method, path):
+        if method == "POST" and _ANALYZE_PATH.match(path):
+            return "analyze"
+        if method == "GET" and _IMAGE_PATH.match(path):
+            return "get_image"
+        if method == "GET" and _RESULT_PATH.match(path):
+            return "get_result"
+        if path == "/contentunderstanding/analyzers" and method == "GET":
+            return "list_analyzers"
+        if _ANALYZER_PATH.match(path):
+            return {"GET": "get_analyzer", "PUT": "put_analyzer", "DELETE": "delete_analyzer"}.get(method, "unknown")
+        return "unknown"
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+    def do_PUT(self):
+        self._handle("PUT")
+
+    def do_DELETE(self):
+        self._handle("DELETE")
+
+    def do_HEAD(self):
+        self.service._count("head")
+        self._send(200, headers={"ETag": f'"{uuid.uuid5(uuid.NAMESPACE_URL, self.path)}"'})
+
+    def _operation_location(self, operation_id):
+        api_version = parse_qs(urlparse(self.path).query).get("api-version", [""])[0]
+        return f"{self.service.endpoint}/contentunderstanding/analyzerResults/{operation_id}?api-version={api_version}"
+
+    def _put_analyzer(self, url, size, body):
+        analyzer_id = _ANALYZER_PATH.match(url.path).group(1)
+        definition = dict(body or {})
+        definition.update(analyzerId=analyzer_id, status="ready", createdAt=time.strftime("%Y-%m-%dT%H:%M:%SZ"))
+        operation_id = self.service._add_operation(analyzer_id, 0, {"analyzer": definition})
+        with self.service._lock:
+            self.service.analyzers[analyzer_id] = definition
+        self._send(201, definition, headers={"Operation-Location": self._operation_location(operation_id)})
+
+    def _get_analyzer(self, url, size, body):
+        definition = self.service.analyzers.get(_ANALYZER_PATH.match(url.path).group(1))
+        if definition is None:
+            return self._send(404, {"error": {"code": "NotFound", "message": "Analyzer not found."}})
+        self._send(200, definition)
+
+    def _delete_analyzer(self, url, size, body):
+        with self.service._lock:
+            self.service.analyzers.pop(_ANALYZER_PATH.match(url.path).group(1), None)
+        self._send(204)
+
+    def _list_analyzers(self, url, size, body):
+        query = parse_qs(url.query)
+        skip = int(query.get("skip", ["0"])[0])
+        page_size = self.service.config.page_size
+        with self.service._lock:
+            analyzers = list(self.service.analyzers.values())
+        page = {"value": analyzers[skip:skip + page_size]}
+        if skip + page_size < len(analyzers):
+            api_version = query.get("api-version", [""])[0]
+            page["nextLink"] = (
+                f"{self.service.endpoint}/contentunderstanding/analyzers"
+                f"?api-version={api_version}&skip={skip + page_size}"
+            )
+        self._send(200, page)
+
+    def _analyze(self, url, size, body):
+        analyzer_id = _ANALYZE_PATH.match(url.path).group(1)
+        operation_id = self.service._add_operation(analyzer_id, size, body)
+        self._send(202, {"id": operation_id, "status": "Running"}, headers={"Operation-Location": self._operation_location(operation_id)})
+
+    def _get_result(self, url, size, body):
+        operation = self.service.operations.get(_RESULT_PATH.match(url.path).group(1))
+        if operation is None:
+            return self._send(404, {"error": {"code": "NotFound", "message": "Operation not found."}})
+        self._send(200, self.service._operation_status(operation))
+
+    def _get_image(self, url, size, body):
+        if _IMAGE_PATH.match(url.path).group(1) not in self.service.operations:
+            return self._send(404, {"error": {"code": "NotFound", "message": "Operation not found."}})
+        self._send(200, _JPEG_PLACEHOLDER, content_type="image/jpeg")
+
+
+class MockContentUnderstandingService:
+    """Runs the mock service on a background thread.
+
+    Use as a context manager; `endpoint` is the base URL to pass to the client
+    and `stats` counts requests per route (e.g. "analyze", "get_result", "throttled").
+    """
+
+    def __init__(self, config: MockServiceConfig = None, host: str = "127.0.0.1", port: int = 0):
+        self.config = config or MockServiceConfig()
+        self.analyzers = {}
+        self.operations = {}
+        self.stats = {}
+        self._lock = threading.Lock()
+        self._throttle_tokens = self.config.throttle_rps or 0
+        self._throttle_updated_at = time.monotonic()
+        handler = type("Handler", (_Handler,), {"service": self})
+        self._server = _Server((host, port), handler)
+        self._thread = None
+
+    @property
+    def endpoint(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, name="cu-mock-service", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def reset_stats(self):
+        with self._lock:
+            self.stats = {}
+
+    def _count(self, name):
+        with self._lock:
+            self.stats[name] = self.stats.get(name, 0) + 1
+
+    def _throttle(self):
+        """Returns the Retry-After seconds if the request exceeds throttle_rps, otherwise 0."""
+        rate = self.config.throttle_rps
+        if not rate:
+            return 0
+        with self._lock:
+            now = time.monotonic()
+            self._throttle_tokens = min(rate, self._throttle_tokens + (now - self._throttle_updated_at) * rate)
+            self._throttle_updated_at = now
+            if self._throttle_tokens >= 1:
+                self._throttle_tokens -= 1
+                return 0
+        return self.config.retry_after_seconds
+
+    def _add_operation(self, analyzer_id, size, body):
+        config = self.config
+        duration = config.processing_seconds + config.processing_seconds_per_mb * size / (1 << 20)
+        duration *= 1 + random.uniform(-config.processing_jitter, config.processing_jitter)
+        operation = {
+            "id": str(uuid.uuid4()),
+            "analyzerId": analyzer_id,
+            "size": size,
+            "url": (body or {}).get("url"),
+            "createdAt": time.time(),
+            "started_at": time.time() + config.queue_seconds,
+            "ready_at": time.time() + config.queue_seconds + max(0.0, duration),
+            "failed": random.random() < config.failure_rate,
+        }
+        with self._lock:
+            self.operations[operation["id"]] = operation
+        return operation["id"]
+
+    def _operation_status(self, operation):
+        if time.time() < operation["started_at"]:
+            return {"id": operation["id"], "status": "NotStarted"}
+        if time.time() < operation["ready_at"]:
+            return {"id": operation["id"], "status": "Running"}
+        if operation["failed"]:
+            return {"id": operation["id"], "status": "Failed", "error": {"code": "InjectedFailure", "message": "Injected failure."}}
+        keyframe_times = [1000 * (i + 1) for i in range(self.config.image_count)]
+        return {
+            "id": operation["id"],
+            "status": "Succeeded",
+            "result": {
+                "analyzerId": operation["analyzerId"],
+                "apiVersion": "mock",
+                "createdAt": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(operation["createdAt"])),
+                "warnings": [],
+                "contents": [
+                    {
+                        "markdown": f"# Mock result\n\nAnalyzed {operation['url'] or str(operation['size']) + ' bytes'}.",
+                        "kind": "document",
+                        "startPageNumber": 1,
+                        "endPageNumber": 1,
+                        "KeyFrameTimesMs": keyframe_times,
+                        "fields": {
+                            "Summary": {"type": "string", "valueString": "Mock summary."},
+                        },
+                    }
+                ],
+            },
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--delay", type=float, default=1.0, help="base processing seconds per operation")
+    parser.add_argument("--queue", type=float, default=0.0, help="seconds an operation waits before running")
+    parser.add_argument("--delay-per-mb", type=float, default=0.0, help="extra processing seconds per uploaded MB")
+    parser.add_argument("--jitter", type=float, default=0.5, help="relative spread of the processing time")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="probability of a Failed operation")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="probability of an HTTP 500")
+    parser.add_argument("--throttle-rps", type=float, default=None, help="requests per second before 429s")
+    args = parser.parse_args()
+
+    config = MockServiceConfig(
+        processing_seconds=args.delay,
+        queue_seconds=args.queue,
+        processing_seconds_per_mb=args.delay_per_mb,
+        processing_jitter=args.jitter,
+        failure_rate=args.failure_rate,
+        error_rate=args.error_rate,
+        throttle_rps=args.throttle_rps,
+    )
+    service = MockContentUnderstandingService(config, args.host, args.port)
+    print(f"Mock Content Understanding service listening on {service.endpoint}")
+    try:
+        service._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service._server.server_close()
+
+
+if __name__ == "__main__":
+    main()
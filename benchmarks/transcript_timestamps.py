@@ -0,0 +1,113 @@
+"""Micro-benchmark of WebVTT cue formatting in the transcript processors.
+
+Compares the former per-phrase loop (three divmods and an f-string per
+timestamp) with the bulk format_time_ranges path, with and without NumPy,
+on the bundled data/*_pretranscribed.json samples. Run it in an environment
+without NumPy as well: the pure Python variant is what those installs use.
+
+Usage:
+    python benchmarks/transcript_timestamps.py [--cues 200000] [--repeat 5]
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT_DIR))
+
+from python.extension.transcripts_processor import (  # noqa: E402
+    TranscriptsProcessor,
+    _get_numpy,
+    format_time_ranges,
+)
+
+
+def legacy_format_timestamp(offset, units_per_ms):
+    """The per-phrase format_timestamp methods the processors used before."""
+    seconds, ms = divmod(int(offset / units_per_ms), 1000)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:02}:{minutes:02}:{seconds:02}.{ms:03}"
+
+
+def legacy_time_ranges(offsets, durations, units_per_ms):
+    """The per-phrase loop the processors used before, with end = offset + duration."""
+    start_times = []
+    end_times = []
+    for offset, duration in zip(offsets, durations):
+        start_times.append(legacy_format_timestamp(offset, units_per_ms))
+        end_times.append(legacy_format_timestamp(offset + duration, units_per_ms))
+    return start_times, end_times
+
+
+def load_samples(cue_count):
+    processors = TranscriptsProcessor()
+    samples = []
+    for file_path in sorted((ROOT_DIR / "data").glob("*_pretranscribed.json")):
+        with open(file_path, "r", encoding="utf-8") as f:
+            transcripts = json.load(f)
+        transcripts_type = processors.detect_format(transcripts)
+        if transcripts_type == "batch_transcription":
+            offset_key, duration_key, units_per_ms = "offsetInTicks", "durationInTicks", 10000
+        elif transcripts_type == "fast_transcription":
+            offset_key, duration_key, units_per_ms = "offsetMilliseconds", "durationMilliseconds", 1
+        else:
+            continue
+        processor = processors.get_transcriptionProcessor(transcripts_type)
+        phrases = processor.get_phrases(transcripts)
+        # Repeat the sample, shifted in time, to reach a measurable number of cues.
+        span = max(phrase[offset_key] + phrase[duration_key] for phrase in phrases)
+        offsets, durations = [], []
+        for i in range(cue_count):
+            phrase = phrases[i % len(phrases)]
+            offsets.append(phrase[offset_key] + span * (i // len(phrases)))
+            durations.append(phrase[duration_key])
+        samples.append((file_path.name, offsets, durations, units_per_ms))
+    return samples
+
+
+def measure(function, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cues", type=int, default=200000, help="cues per sample")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per variant; the best is reported")
+    args = parser.parse_args()
+
+    variants = [("per-phrase loop", None), ("bulk (pure Python)", False)]
+    if _get_numpy() is not None:
+        variants.append(("bulk (numpy)", True))
+    else:
+        print("NumPy is not installed; skipping the NumPy variant.")
+
+    print(f"{'sample':<28} {'variant':<18} {'cues/s':>14} {'speedup':>8}")
+    for name, offsets, durations, units_per_ms in load_samples(args.cues):
+        baseline_seconds, expected = measure(
+            lambda: legacy_time_ranges(offsets, durations, units_per_ms), args.repeat
+        )
+        for label, use_numpy in variants:
+            if use_numpy is None:
+                seconds = baseline_seconds
+            else:
+                seconds, result = measure(
+                    lambda: format_time_ranges(offsets, durations, units_per_ms, use_numpy),
+                    args.repeat,
+                )
+                assert result == expected, f"{label} output differs from the per-phrase loop"
+            print(
+                f"{name:<28} {label:<18} {len(offsets) / seconds:>14,.0f} "
+                f"{baseline_seconds / seconds:>7.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Sample client utilities for Azure AI Content Understanding.
+
+Importing the package is cheap: each name below is imported from its module on
+first access, so a worker that only needs the synchronous client never loads
+aiohttp, SQLite, pyarrow or the other optional dependencies.
+"""
+import importlib
+
+# Public name -> module that defines it.
+_EXPORTS = {
+    "AzureContentUnderstandingClient": "content_understanding_client",
+    "AnalyzeManyResult": "content_understanding_client",
+    "ImageDownloadResult": "content_understanding_client",
+    "OperationContext": "content_understanding_client",
+    "AsyncContentUnderstandingClient": "content_understanding_async_client",
+    "AnalyzeResult": "analyze_result",
+    "CachedTokenProvider": "credentials",
+    "Instrumentation": "instrumentation",
+    "CallbackInstrumentation": "instrumentation",
+    "OpenTelemetryInstrumentation": "instrumentation",
+    "OperationMetrics": "instrumentation",
+    "JobJournal": "job_journal",
+    "AdaptivePolling": "polling",
+    "ExponentialBackoffPolling": "polling",
+    "DurationEstimator": "polling",
+    "FixedIntervalPolling": "polling",
+    "PollingStrategy": "polling",
+    "TokenBucket": "rate_limiter",
+    "ResultCache": "result_cache",
+    "ResultExporter": "result_export",
+    "preflight_training_data": "training_preflight",
+    "load_manifest": "training_preflight",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # Cache it so later lookups do not go through __getattr__ again.
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
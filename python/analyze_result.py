@@ -0,0 +1,450 @@
+import bisect
+
+# The key holding the value of a field, by field type.
+_VALUE_KEYS = {
+    "string": "valueString",
+    "number": "valueNumber",
+    "integer": "valueInteger",
+    "boolean": "valueBoolean",
+    "date": "valueDate",
+    "time": "valueTime",
+    "array": "valueArray",
+    "object": "valueObject",
+}
+
+_UNSET = object()
+
+
+class _IntervalIndex:
+    """Finds the items overlapping a time range in O(log n + k).
+
+    Items are sorted by start; a running maximum of the ends bounds the
+    search from the left even when the items overlap each other. An item
+    without an end (None) is treated as an instant at its start.
+    """
+
+    __slots__ = ("_items", "_starts", "_ends", "_max_ends")
+
+    def __init__(self, items, get_start, get_end):
+        items = sorted(items, key=get_start)
+        self._items = items
+        self._starts = [get_start(item) for item in items]
+        self._ends = [
+            start if end is None else end
+            for start, end in zip(self._starts, map(get_end, items))
+        ]
+        self._max_ends = []
+        max_end = float("-inf")
+        for end in self._ends:
+            max_end = max(max_end, end)
+            self._max_ends.append(max_end)
+
+    def at(self, time):
+        """Returns the items with start <= time < end."""
+        lo = bisect.bisect_right(self._max_ends, time)
+        hi = bisect.bisect_right(self._starts, time)
+        return [self._items[i] for i in range(lo, hi) if self._ends[i] > time]
+
+    def overlapping(self, start, end):
+        """Returns the items that overlap [start, end)."""
+        lo = bisect.bisect_right(self._max_ends, start)
+        hi = bisect.bisect_left(self._starts, end)
+        return [self._items[i] for i in range(lo, hi) if self._ends[i] > start]
+
+
+class _SpanIndex:
+    """Finds the element whose span contains a markdown offset in O(log n)."""
+
+    __slots__ = ("_elements", "_offsets", "_ends")
+
+    def __init__(self, elements):
+        elements = sorted(
+            (element for element in elements if "span" in element),
+            key=lambda element: element["span"]["offset"],
+        )
+        self._elements = elements
+        self._offsets = [element["span"]["offset"] for element in elements]
+        self._ends = [offset + element["span"]["length"] for offset, element in zip(self._offsets, elements)]
+
+    def at(self, offset):
+        i = bisect.bisect_right(self._offsets, offset) - 1
+        if i >= 0 and offset < self._ends[i]:
+            return self._elements[i]
+        return None
+
+    def overlapping(self, offset, length):
+        end = offset + length
+        lo = max(0, bisect.bisect_right(self._offsets, offset) - 1)
+        hi = bisect.bisect_left(self._offsets, end)
+        return [self._elements[i] for i in range(lo, hi) if self._ends[i] > offset]
+
+
+class Span:
+    """A range of characters in the markdown of a content.
+
+    Attributes:
+        offset (int): The index of the first character.
+        length (int): The number of characters.
+    """
+
+    __slots__ = ("offset", "length")
+
+    def __init__(self, offset, length):
+        self.offset = offset
+        self.length = length
+
+    @property
+    def end(self):
+        return self.offset + self.length
+
+    def __eq__(self, other):
+        return isinstance(other, Span) and (self.offset, self.length) == (other.offset, other.length)
+
+    def __hash__(self):
+        return hash((self.offset, self.length))
+
+    def __repr__(self):
+        return f"Span(offset={self.offset}, length={self.length})"
+
+
+class Field:
+    """An extracted field. Nested array and object values are wrapped on first access.
+
+    Attributes:
+        name (str): The field name, or the parent name and index for array items.
+        raw (dict): The JSON of the field.
+    """
+
+    __slots__ = ("name", "raw", "_value")
+
+    def __init__(self, name, raw):
+        self.name = name
+        self.raw = raw
+        self._value = _UNSET
+
+    @property
+    def type(self):
+        return self.raw.get("type")
+
+    @property
+    def value(self):
+        """The typed value: a list of Field for arrays, a dict of Field for objects."""
+        if self._value is _UNSET:
+            value = self.raw.get(_VALUE_KEYS.get(self.type, ""))
+            if self.type == "array":
+                value = [Field(f"{self.name}[{i}]", item) for i, item in enumerate(value or ())]
+            elif self.type == "object":
+                value = {name: Field(name, item) for name, item in (value or {}).items()}
+            self._value = value
+        return self._value
+
+    @property
+    def confidence(self):
+        return self.raw.get("confidence")
+
+    @property
+    def source(self):
+        return self.raw.get("source")
+
+    @property
+    def spans(self):
+        return [Span(span["offset"], span["length"]) for span in self.raw.get("spans", ())]
+
+    def __getitem__(self, key):
+        """Indexes into an array field by position or an object field by name."""
+        value = self.value
+        if not isinstance(value, (list, dict)):
+            raise TypeError(f"Field {self.name!r} of type {self.type!r} cannot be indexed.")
+        return value[key]
+
+    def __repr__(self):
+        value = self.value
+        if isinstance(value, list):
+            value = f"<{len(value)} items>"
+        elif isinstance(value, dict):
+            value = f"<{', '.join(value)}>"
+        return f"Field(name={self.name!r}, type={self.type!r}, value={value!r})"
+
+
+class Content:
+    """One entry of `result.contents`: a document, or a segment of audio or video.
+
+    Lookups by field name, page number, time and markdown offset use indexes
+    that are built the first time they are needed.
+
+    Attributes:
+        index (int): The position of the content in `result.contents`.
+        raw (dict): The JSON of the content.
+    """
+
+    __slots__ = ("index", "raw", "_fields", "_pages", "_phrases", "_span_indexes")
+
+    def __init__(self, index, raw):
+        self.index = index
+        self.raw = raw
+        self._fields = None
+        self._pages = None
+        self._phrases = None
+        self._span_indexes = {}
+
+    @property
+    def kind(self):
+        return self.raw.get("kind")
+
+    @property
+    def markdown(self):
+        return self.raw.get("markdown", "")
+
+    @property
+    def start_time_ms(self):
+        return self.raw.get("startTimeMs")
+
+    @property
+    def end_time_ms(self):
+        return self.raw.get("endTimeMs")
+
+    @property
+    def start_page_number(self):
+        return self.raw.get("startPageNumber")
+
+    @property
+    def end_page_number(self):
+        return self.raw.get("endPageNumber")
+
+    @property
+    def fields(self):
+        """The extracted fields by name."""
+        if self._fields is None:
+            self._fields = {
+                name: Field(name, raw) for name, raw in self.raw.get("fields", {}).items()
+            }
+        return self._fields
+
+    def field(self, name, default=None):
+        return self.fields.get(name, default)
+
+    @property
+    def pages(self):
+        return self.raw.get("pages", [])
+
+    def page(self, page_number):
+        """Returns the page with the given 1-based number, or None."""
+        if self._pages is None:
+            self._pages = {page["pageNumber"]: page for page in self.pages}
+        return self._pages.get(page_number)
+
+    @property
+    def transcript_phrases(self):
+        return self.raw.get("transcriptPhrases", [])
+
+    def phrases_between(self, start_ms, end_ms):
+        """Returns the transcript phrases that overlap [start_ms, end_ms)."""
+        if self._phrases is None:
+            self._phrases = _IntervalIndex(
+                self.transcript_phrases,
+                lambda phrase: phrase["startTimeMs"],
+                lambda phrase: phrase["endTimeMs"],
+            )
+        return self._phrases.overlapping(start_ms, end_ms)
+
+    @property
+    def keyframe_times_ms(self):
+        return self.raw.get("KeyFrameTimesMs", [])
+
+    @property
+    def faces(self):
+        return self.raw.get("faces", [])
+
+    def _get_span_index(self, kind):
+        index = self._span_indexes.get(kind)
+        if index is None:
+            if kind in ("words", "lines"):
+                elements = [element for page in self.pages for element in page.get(kind, ())]
+            else:
+                elements = self.raw.get(kind, [])
+            index = self._span_indexes[kind] = _SpanIndex(elements)
+        return index
+
+    def word_at(self, offset):
+        """Returns the word whose span contains the markdown offset, or None."""
+        return self._get_span_index("words").at(offset)
+
+    def line_at(self, offset):
+        """Returns the line whose span contains the markdown offset, or None."""
+        return self._get_span_index("lines").at(offset)
+
+    def paragraph_at(self, offset):
+        """Returns the paragraph whose span contains the markdown offset, or None."""
+        return self._get_span_index("paragraphs").at(offset)
+
+    def words_in(self, span):
+        """Returns the words overlapping a Span, such as one of a field's spans."""
+        return self._get_span_index("words").overlapping(span.offset, span.length)
+
+    def text(self, span):
+        """Returns the markdown covered by a Span."""
+        return self.markdown[span.offset:span.end]
+
+    def resolve(self, pointer):
+        """Returns the element an `elements` reference such as "/paragraphs/6" points to."""
+        value = self.raw
+        for part in pointer.strip("/").split("/"):
+            value = value[int(part)] if isinstance(value, list) else value[part]
+        return value
+
+    def __repr__(self):
+        if self.start_time_ms is not None:
+            location = f"time={self.start_time_ms}-{self.end_time_ms}ms"
+        else:
+            location = f"pages={self.start_page_number}-{self.end_page_number}"
+        return f"Content(index={self.index}, kind={self.kind!r}, {location})"
+
+
+class AnalyzeResult:
+    """Indexed, read-only view over the JSON returned by `poll_result`.
+
+    Wraps the parsed JSON without copying it; `Content` and `Field` objects
+    and the lookup indexes are created on first access. Lookups by time,
+    page, field name or markdown offset then take O(1) or O(log n) instead
+    of scanning the nested lists.
+
+    Example:
+        result = AnalyzeResult(client.poll_result(response))
+        for content in result.contents_between(60_000, 120_000):
+            print(content.field("description").value)
+    """
+
+    __slots__ = ("raw", "_result", "_contents", "_time_index", "_fields", "_pages", "_keyframes")
+
+    def __init__(self, payload: dict):
+        """
+        Args:
+            payload (dict): The operation JSON (with "status" and "result") or the "result" object itself.
+        """
+        self.raw = payload
+        self._result = payload["result"] if "contents" not in payload and "result" in payload else payload
+        self._contents = None
+        self._time_index = None
+        self._fields = None
+        self._pages = None
+        self._keyframes = None
+
+    @property
+    def id(self):
+        return self.raw.get("id")
+
+    @property
+    def status(self):
+        return self.raw.get("status")
+
+    @property
+    def analyzer_id(self):
+        return self._result.get("analyzerId")
+
+    @property
+    def api_version(self):
+        return self._result.get("apiVersion")
+
+    @property
+    def created_at(self):
+        return self._result.get("createdAt")
+
+    @property
+    def warnings(self):
+        return self._result.get("warnings", [])
+
+    @property
+    def contents(self):
+        if self._contents is None:
+            self._contents = [
+                Content(index, raw) for index, raw in enumerate(self._result.get("contents", []))
+            ]
+        return self._contents
+
+    def __len__(self):
+        return len(self.contents)
+
+    def __iter__(self):
+        return iter(self.contents)
+
+    def __getitem__(self, index):
+        return self.contents[index]
+
+    def _get_time_index(self):
+        if self._time_index is None:
+            self._time_index = _IntervalIndex(
+                [content for content in self.contents if content.start_time_ms is not None],
+                lambda content: content.start_time_ms,
+                lambda content: content.end_time_ms,
+            )
+        return self._time_index
+
+    def contents_at(self, time_ms):
+        """Returns the audio/video contents playing at the given time."""
+        return self._get_time_index().at(time_ms)
+
+    def contents_between(self, start_ms, end_ms):
+        """Returns the audio/video contents that overlap [start_ms, end_ms), in time order."""
+        return self._get_time_index().overlapping(start_ms, end_ms)
+
+    def fields(self, name):
+        """Returns the fields with the given name across all contents, in content order."""
+        if self._fields is None:
+            self._fields = {}
+            for content in self.contents:
+                for field_name, field in content.fields.items():
+                    self._fields.setdefault(field_name, []).append(field)
+        return self._fields.get(name, [])
+
+    def field(self, name, default=None):
+        """Returns the first field with the given name, e.g. a document-level field."""
+        fields = self.fields(name)
+        return fields[0] if fields else default
+
+    def page(self, page_number):
+        """Returns (content, page) for the given 1-based page number, or (None, None)."""
+        if self._pages is None:
+            self._pages = {
+                page["pageNumber"]: (content, page)
+                for content in self.contents
+                for page in content.pages
+            }
+        return self._pages.get(page_number, (None, None))
+
+    @property
+    def keyframe_times_ms(self):
+        """The sorted keyframe times of all contents."""
+        if self._keyframes is None:
+            self._keyframes = sorted(
+                time for content in self.contents for time in content.keyframe_times_ms
+            )
+        return self._keyframes
+
+    @property
+    def keyframe_image_ids(self):
+        """The image IDs of all keyframes, for `get_images`."""
+        return [f"keyFrame.{time}" for time in self.keyframe_times_ms]
+
+    def nearest_keyframe_ms(self, time_ms):
+        """Returns the keyframe time closest to the given time, or None if there are none."""
+        times = self.keyframe_times_ms
+        if not times:
+            return None
+        i = bisect.bisect_left(times, time_ms)
+        candidates = times[max(0, i - 1):i + 1]
+        return min(candidates, key=lambda time: abs(time - time_ms))
+
+    @property
+    def face_ids(self):
+        """The distinct face IDs across all contents, in order of first appearance."""
+        return list(dict.fromkeys(
+            face["faceId"] for content in self.contents for face in content.faces if "faceId" in face
+        ))
+
+    @property
+    def face_image_ids(self):
+        """The image IDs of all faces, for `get_images`."""
+        return [f"face.{face_id}" for face_id in self.face_ids]
+
+    def __repr__(self):
+        return f"AnalyzeResult(analyzer_id={self.analyzer_id!r}, status={self.status!r}, contents={len(self)})"
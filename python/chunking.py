@@ -0,0 +1,291 @@
+import io
+import re
+import wave
+from pathlib import Path
+
+# Page and time references inside "source" strings, e.g. "D(1,811,150,...)" and "AV(2046,436,...)".
+_DOCUMENT_SOURCE = re.compile(r"\bD\((\d+),")
+_AUDIO_VISUAL_SOURCE = re.compile(r"\bAV\((\d+),")
+# JSON pointers to document elements, e.g. "/paragraphs/6".
+_ELEMENT_REFERENCE = re.compile(r"^/(\w+)/(\d+)$")
+_PAGE_KEYS = frozenset(["pageNumber", "startPageNumber", "endPageNumber"])
+_MARKDOWN_SEPARATOR = "\n\n"
+
+
+class Chunk:
+    """A piece of a long document or recording that is analyzed on its own.
+
+    Attributes:
+        index (int): The position of the chunk in the original.
+        data (bytes): The content of the chunk, as a standalone PDF or WAV file.
+        page_offset (int): The number of pages of the original before the chunk.
+        time_offset_ms (int): The position of the start of the chunk in the original recording.
+        keep_from_ms (int): With overlapping windows, the start of the part of the recording this
+            chunk is responsible for; transcript phrases starting earlier are dropped when merging.
+        keep_until_ms (int): The end of that part, or None for the last chunk.
+    """
+
+    __slots__ = ("index", "data", "page_offset", "time_offset_ms", "keep_from_ms", "keep_until_ms")
+
+    def __init__(
+        self,
+        index,
+        data,
+        page_offset=0,
+        time_offset_ms=0,
+        keep_from_ms=0,
+        keep_until_ms=None,
+    ):
+        self.index = index
+        self.data = data
+        self.page_offset = page_offset
+        self.time_offset_ms = time_offset_ms
+        self.keep_from_ms = keep_from_ms
+        self.keep_until_ms = keep_until_ms
+
+    def keeps(self, time_ms):
+        """Whether a phrase starting at `time_ms` (in the original) belongs to this chunk."""
+        return time_ms >= self.keep_from_ms and (
+            self.keep_until_ms is None or time_ms < self.keep_until_ms
+        )
+
+    def __repr__(self):
+        return (
+            f"Chunk(index={self.index}, size={len(self.data or b'')}, page_offset={self.page_offset}, "
+            f"time_offset_ms={self.time_offset_ms})"
+        )
+
+
+def split_pdf(file_path, pages_per_chunk: int = 10):
+    """Yields a PDF as chunks of at most `pages_per_chunk` pages. Requires the optional pypdf package."""
+    try:
+        from pypdf import PdfReader, PdfWriter
+    except ImportError as e:
+        raise ImportError("Splitting PDF documents requires the pypdf package.") from e
+    if pages_per_chunk < 1:
+        raise ValueError("pages_per_chunk must be at least 1.")
+
+    reader = PdfReader(str(file_path))
+    page_count = len(reader.pages)
+    for index, first_page in enumerate(range(0, page_count, pages_per_chunk)):
+        writer = PdfWriter()
+        for page in reader.pages[first_page:first_page + pages_per_chunk]:
+            writer.add_page(page)
+        buffer = io.BytesIO()
+        writer.write(buffer)
+        yield Chunk(index, buffer.getvalue(), page_offset=first_page)
+
+
+def split_wav(file_path, window_seconds: float = 300, overlap_seconds: float = 0):
+    """Yields a WAV recording as windows of `window_seconds`, each a standalone WAV file.
+
+    Consecutive windows share `overlap_seconds` of audio so that words cut at a
+    boundary are transcribed whole by one of them; when merging, each overlap is
+    split in the middle between the two chunks. Only one window is held in memory.
+    """
+    if overlap_seconds < 0 or overlap_seconds >= window_seconds:
+        raise ValueError("overlap_seconds must be at least 0 and less than window_seconds.")
+
+    with wave.open(str(file_path), "rb") as source:
+        params = source.getparams()
+        frame_rate = source.getframerate()
+        frame_count = source.getnframes()
+        window = max(1, int(window_seconds * frame_rate))
+        overlap = int(overlap_seconds * frame_rate)
+
+        def to_ms(frame):
+            return frame * 1000 // frame_rate
+
+        index, start = 0, 0
+        while True:
+            end = min(start + window, frame_count)
+            source.setpos(start)
+            buffer = io.BytesIO()
+            with wave.open(buffer, "wb") as target:
+                target.setparams(params)
+                target.writeframes(source.readframes(end - start))
+            is_last = end >= frame_count
+            yield Chunk(
+                index,
+                buffer.getvalue(),
+                time_offset_ms=to_ms(start),
+                keep_from_ms=0 if index == 0 else to_ms(start + overlap // 2),
+                keep_until_ms=None if is_last else to_ms(end - overlap + overlap // 2),
+            )
+            if is_last:
+                return
+            index += 1
+            start = end - overlap
+
+
+def split_file(file_path, pages_per_chunk: int = 10, window_seconds: float = 300, overlap_seconds: float = 0):
+    """Splits a local PDF by pages or a WAV recording by time, based on the file extension."""
+    suffix = Path(file_path).suffix.lower()
+    if suffix == ".pdf":
+        return split_pdf(file_path, pages_per_chunk)
+    if suffix == ".wav":
+        return split_wav(file_path, window_seconds, overlap_seconds)
+    raise ValueError(f"Chunked analysis supports PDF documents and WAV audio, not '{suffix}' files.")
+
+
+def _rebase(value, span_offset=0, page_offset=0, time_offset_ms=0, element_offsets=None):
+    """Shifts, in place, the spans, page numbers, timestamps and element references of a chunk result."""
+    if isinstance(value, list):
+        for item in value:
+            _rebase(item, span_offset, page_offset, time_offset_ms, element_offsets)
+        return
+    if not isinstance(value, dict):
+        return
+    for key, item in value.items():
+        if key == "span" and span_offset and isinstance(item, dict) and "offset" in item:
+            item["offset"] += span_offset
+        elif key == "spans" and span_offset and isinstance(item, list):
+            for span in item:
+                if isinstance(span, dict) and "offset" in span:
+                    span["offset"] += span_offset
+        elif key in _PAGE_KEYS and isinstance(item, int):
+            value[key] = item + page_offset
+        elif key.endswith("TimeMs") and isinstance(item, int):
+            value[key] = item + time_offset_ms
+        elif key.endswith("TimesMs") and isinstance(item, list):
+            value[key] = [time + time_offset_ms for time in item]
+        elif key == "offsetMilliseconds" and isinstance(item, int):
+            value[key] = item + time_offset_ms
+        elif key == "offsetInTicks" and isinstance(item, int):
+            value[key] = item + time_offset_ms * 10000
+        elif key == "source" and isinstance(item, str):
+            if page_offset:
+                item = _DOCUMENT_SOURCE.sub(lambda m: f"D({int(m.group(1)) + page_offset},", item)
+            if time_offset_ms:
+                item = _AUDIO_VISUAL_SOURCE.sub(lambda m: f"AV({int(m.group(1)) + time_offset_ms},", item)
+            value[key] = item
+        elif key == "elements" and element_offsets and isinstance(item, list):
+            value[key] = [_rebase_reference(reference, element_offsets) for reference in item]
+        elif key not in ("markdown", "fields"):
+            _rebase(item, span_offset, page_offset, time_offset_ms, element_offsets)
+    fields = value.get("fields")
+    if isinstance(fields, dict):
+        _rebase(list(fields.values()), span_offset, page_offset, time_offset_ms, element_offsets)
+
+
+def _rebase_reference(reference, element_offsets):
+    match = _ELEMENT_REFERENCE.match(reference)
+    if not match or match.group(1) not in element_offsets:
+        return reference
+    return f"/{match.group(1)}/{int(match.group(2)) + element_offsets[match.group(1)]}"
+
+
+def _merge_fields(content, fields):
+    """Merges the fields of a chunk into a content: arrays are concatenated, other fields keep the first value."""
+    if not fields:
+        return
+    merged = content.setdefault("fields", {})
+    for name, field in fields.items():
+        existing = merged.get(name)
+        if existing is None:
+            merged[name] = field
+        elif existing.get("type") == "array" and field.get("type") == "array":
+            existing.setdefault("valueArray", []).extend(field.get("valueArray", []))
+
+
+def _format_cue_time(milliseconds):
+    """Formats a cue time the way the service writes WEBVTT markdown: MM:SS.mmm, with hours only when non-zero."""
+    seconds, ms = divmod(milliseconds, 1000)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours:02}:{minutes:02}:{seconds:02}.{ms:03}"
+    return f"{minutes:02}:{seconds:02}.{ms:03}"
+
+
+def merge_chunk_results(chunk_results):
+    """Merges the analyze results of the chunks of one file into a single result.
+
+    Args:
+        chunk_results (iterable): (Chunk, dict) pairs in chunk order, the dict being the JSON
+            returned by `poll_result` for the chunk.
+
+    Document contents are joined into one document: markdown is concatenated,
+    and spans, page numbers, "D(page,...)" sources and "/paragraphs/N" style
+    element references are shifted to point into the merged document. Audio
+    contents are joined into one audioVisual content: timestamps and
+    "AV(time,...)" sources are shifted by the window position, phrases are
+    de-duplicated across overlapping windows, and the WEBVTT markdown is
+    rebuilt from the phrases. Array fields are concatenated across chunks; any
+    other field keeps the value of the first chunk that has it.
+
+    Returns:
+        dict: A result in the same shape as `poll_result` returns.
+    """
+    merged_result = None
+    document = None
+    audio = None
+    other_contents = []
+    for chunk, payload in chunk_results:
+        result = payload.get("result", {})
+        if merged_result is None:
+            merged_result = {
+                "status": payload.get("status", "Succeeded"),
+                "result": {
+                    "analyzerId": result.get("analyzerId"),
+                    "apiVersion": result.get("apiVersion"),
+                    "createdAt": result.get("createdAt"),
+                    "warnings": [],
+                    "contents": [],
+                },
+            }
+        merged_result["result"]["warnings"].extend(result.get("warnings", []))
+
+        for content in result.get("contents", []):
+            if content.get("kind") == "document":
+                if document is None:
+                    _rebase(content, page_offset=chunk.page_offset)
+                    document = content
+                    continue
+                span_offset = len(document.get("markdown", "")) + len(_MARKDOWN_SEPARATOR)
+                element_offsets = {
+                    key: len(value) for key, value in document.items() if isinstance(value, list)
+                }
+                _rebase(content, span_offset, chunk.page_offset, 0, element_offsets)
+                document["markdown"] = (
+                    document.get("markdown", "") + _MARKDOWN_SEPARATOR + content.get("markdown", "")
+                )
+                for key, value in content.items():
+                    if isinstance(value, list):
+                        document.setdefault(key, []).extend(value)
+                if "endPageNumber" in content:
+                    document["endPageNumber"] = content["endPageNumber"]
+                _merge_fields(document, content.get("fields"))
+            elif content.get("kind") == "audioVisual" and "KeyFrameTimesMs" not in content:
+                _rebase(content, time_offset_ms=chunk.time_offset_ms)
+                phrases = [
+                    phrase for phrase in content.get("transcriptPhrases", [])
+                    if chunk.keeps(phrase.get("startTimeMs", 0))
+                ]
+                if audio is None:
+                    audio = content
+                    audio["transcriptPhrases"] = phrases
+                else:
+                    audio["transcriptPhrases"].extend(phrases)
+                    _merge_fields(audio, content.get("fields"))
+                if "endTimeMs" in content:
+                    audio["endTimeMs"] = content["endTimeMs"]
+            else:
+                _rebase(content, 0, chunk.page_offset, chunk.time_offset_ms)
+                other_contents.append(content)
+
+    if merged_result is None:
+        raise ValueError("There are no chunk results to merge.")
+    contents = merged_result["result"]["contents"]
+    if document is not None:
+        contents.append(document)
+    if audio is not None:
+        cues = [
+            f"{_format_cue_time(phrase['startTimeMs'])} --> {_format_cue_time(phrase['endTimeMs'])}\n"
+            f"<v {phrase.get('speaker', 'Unknown')}>{phrase.get('text', '')}"
+            for phrase in audio["transcriptPhrases"]
+        ]
+        audio["markdown"] = "```WEBVTT\n\n" + "\n\n".join(cues) + "```"
+        contents.append(audio)
+    contents.extend(other_contents)
+    return merged_result
@@ -0,0 +1,116 @@
+import mimetypes
+import os
+import time
+from urllib.parse import urlparse
+
+from .credentials import CachedTokenProvider
+
+
+class ContentUnderstandingClientBase:
+    """Request building and bookkeeping shared by the synchronous and asyncio clients.
+
+    Subclasses set `_endpoint`, `_api_version`, `_logger`, `_instrumentation`
+    and `_duration_estimator`; nothing here performs I/O.
+    """
+
+    def _get_analyzer_url(self, endpoint, api_version, analyzer_id):
+        return f"{endpoint}/contentunderstanding/analyzers/{analyzer_id}?api-version={api_version}"  # noqa
+
+    def _get_analyzer_list_url(self, endpoint, api_version):
+        return f"{endpoint}/contentunderstanding/analyzers?api-version={api_version}"
+
+    def _get_analyze_url(self, endpoint, api_version, analyzer_id):
+        return f"{endpoint}/contentunderstanding/analyzers/{analyzer_id}:analyze?api-version={api_version}"  # noqa
+
+    def _get_training_data_config(
+        self, storage_container_sas_url, storage_container_path_prefix
+    ):
+        return {
+            "containerUrl": storage_container_sas_url,
+            "kind": "blob",
+            "prefix": storage_container_path_prefix,
+        }
+
+    def _get_headers(self, subscription_key, x_ms_useragent):
+        """Returns the static headers for the HTTP requests.
+
+        Bearer tokens expire, so they are not part of these headers; they are
+        added to each request from the cached token provider instead.
+        Args:
+            subscription_key (str): The subscription key for the service, if any.
+            x_ms_useragent (str): The user agent reported to the service.
+        Returns:
+            dict: A dictionary containing the headers for the HTTP requests.
+        """
+        headers = (
+            {"Ocp-Apim-Subscription-Key": subscription_key}
+            if subscription_key
+            else {}
+        )
+        headers["x-ms-useragent"] = x_ms_useragent
+        return headers
+
+    def _get_cached_token_provider(self, token_provider):
+        """Wraps a token provider in a CachedTokenProvider, unless it already is one."""
+        if isinstance(token_provider, CachedTokenProvider):
+            return token_provider
+        return CachedTokenProvider(token_provider)
+
+    def _describe_location(self, file_location):
+        if isinstance(file_location, (str, os.PathLike)):
+            return str(file_location)
+        name = getattr(file_location, "name", None)
+        if isinstance(name, str):
+            return name
+        return f"<{type(file_location).__name__}>"
+
+    def _guess_content_type(self, file_location):
+        path = self._describe_location(file_location)
+        if "://" in path:
+            path = urlparse(path).path
+        return mimetypes.guess_type(path)[0] or "application/octet-stream"
+
+    def _get_image_url(self, analyze_response, image_id):
+        operation_location = analyze_response.headers.get("operation-location", "")
+        if not operation_location:
+            raise ValueError(
+                "Operation location not found in the analyzer response header."
+            )
+        operation_location = operation_location.split("?api-version")[0]
+        return f"{operation_location}/images/{image_id}?api-version={self._api_version}"
+
+    def _check_image_response(self, response, image_id):
+        content_type = response.headers.get("Content-Type")
+        if content_type != "image/jpeg":
+            raise ValueError(f"Unexpected content type {content_type} for image {image_id}.")
+
+    def _end_operation(self, metrics, error=None):
+        """Completes the metrics of an operation and hands them to the instrumentation."""
+        metrics.total_seconds = time.time() - metrics.started_at
+        metrics.error = error
+        if error is None:
+            metrics.status = "succeeded"
+        elif isinstance(error, TimeoutError):
+            metrics.status = "timeout"
+        else:
+            metrics.status = "failed"
+        try:
+            self._instrumentation.on_operation_end(metrics)
+        except Exception:
+            self._logger.exception("Instrumentation hook on_operation_end failed.")
+
+    def _observe_duration(
+        self, estimator_key, polling_strategy, last_running_seconds, done_seconds
+    ):
+        """Feeds the likely completion time of an operation to the duration estimator.
+
+        The operation finished somewhere between the last poll that saw it running
+        and the poll that saw it done, so the midpoint is recorded. When the first
+        poll already saw it done, a slightly lower value is recorded so the next
+        first poll moves earlier rather than later.
+        """
+        if last_running_seconds is not None:
+            duration = (last_running_seconds + done_seconds) / 2
+        else:
+            duration = done_seconds * getattr(polling_strategy, "lead_fraction", 1.0)
+        self._duration_estimator.observe(estimator_key, duration)
@@ -0,0 +1,601 @@
+import asyncio
+import email.utils
+import json
+import logging
+import math
+import os
+import random
+import time
+from pathlib import Path
+
+import aiohttp
+
+from .client_base import ContentUnderstandingClientBase
+from .content_understanding_client import ImageDownloadResult, OperationContext
+from .instrumentation import Instrumentation, OperationMetrics
+from .polling import AdaptivePolling, DurationEstimator, FixedIntervalPolling, PollingStrategy
+
+
+# Connect timeouts (aiohttp >= 3.10) happen before anything is sent, so they are always retryable.
+_CONNECTION_TIMEOUT_ERRORS = getattr(aiohttp, "ConnectionTimeoutError", ())
+
+
+class AsyncContentUnderstandingClient(ContentUnderstandingClientBase):
+    """Asyncio counterpart of AzureContentUnderstandingClient.
+
+    All calls share one aiohttp connection pool, and a semaphore bounds the
+    number of HTTP requests in flight, so a single event loop can keep
+    thousands of analyze operations polling concurrently.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        api_version: str,
+        subscription_key: str = None,
+        token_provider: callable = None,
+        x_ms_useragent: str = "cu-sample-code",
+        max_concurrency: int = 64,
+        pool_maxsize: int = 100,
+        pool_maxsize_per_host: int = 0,
+        keepalive_timeout: float = 30,
+        max_retries: int = 5,
+        backoff_factor: float = 0.5,
+        backoff_max: float = 60,
+        backoff_jitter: float = 0.5,
+        retry_status_codes: tuple = (429, 503),
+        polling_strategy: PollingStrategy = None,
+        duration_estimator: DurationEstimator = None,
+        instrumentation: Instrumentation = None,
+    ):
+        if not subscription_key and not token_provider:
+            raise ValueError("Either subscription key or token provider must be provided.")
+        if not api_version:
+            raise ValueError("API version must be provided.")
+        if not endpoint:
+            raise ValueError("Endpoint must be provided.")
+
+        self._endpoint = endpoint.rstrip("/")
+        self._api_version = api_version
+        self._logger = logging.getLogger(__name__)
+
+        # Without a subscription key, a cached bearer token is added to every request.
+        self._headers = self._get_headers(subscription_key, x_ms_useragent)
+        self._token_provider = (
+            None if subscription_key else self._get_cached_token_provider(token_provider)
+        )
+
+        self._max_concurrency = max_concurrency
+        self._pool_maxsize = pool_maxsize
+        self._pool_maxsize_per_host = pool_maxsize_per_host
+        self._keepalive_timeout = keepalive_timeout
+        self._max_retries = max_retries
+        self._backoff_factor = backoff_factor
+        self._backoff_max = backoff_max
+        self._backoff_jitter = backoff_jitter
+        self._retry_status_codes = frozenset(retry_status_codes)
+        self._polling_strategy = polling_strategy or AdaptivePolling()
+        self._duration_estimator = duration_estimator or DurationEstimator()
+        self._instrumentation = instrumentation
+
+        # aiohttp sessions must be created inside a running event loop, so the
+        # session and semaphore are created on first use.
+        self._session = None
+        self._semaphore = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        """Closes the pooled HTTP session and releases its connections."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _get_session(self):
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self._pool_maxsize,
+                limit_per_host=self._pool_maxsize_per_host,
+                keepalive_timeout=self._keepalive_timeout,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        return self._session
+
+    def _get_retry_delay(self, response, attempt):
+        """Returns the number of seconds to wait before retrying a request.
+        Args:
+            response (aiohttp.ClientResponse): The throttled response, or None after a connection error.
+            attempt (int): The zero-based retry attempt.
+        Returns:
+            float: The delay in seconds.
+        """
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after:
+            try:
+                seconds = float(retry_after)
+                if math.isfinite(seconds):
+                    return max(0.0, seconds)
+            except ValueError:
+                try:
+                    retry_date = email.utils.parsedate_to_datetime(retry_after)
+                    return max(0.0, retry_date.timestamp() - time.time())
+                except (TypeError, ValueError):
+                    # A malformed header falls back to the exponential backoff.
+                    self._logger.info(f"Ignoring invalid Retry-After header: {retry_after!r}")
+        delay = min(self._backoff_max, self._backoff_factor * (2**attempt))
+        return delay + random.uniform(0, self._backoff_jitter)
+
+    async def _get_authorization(self):
+        """Returns the Authorization header value, refreshing the token off the event loop if needed."""
+        token = self._token_provider.peek()
+        if token is None:
+            token = await asyncio.to_thread(self._token_provider.get_token)
+        return f"Bearer {token}"
+
+    def _is_retryable_error(self, method, error):
+        """Whether a request that raised `error` can be sent again, like the sync client's Retry.
+
+        Failures to connect are always retried. Other connection errors and
+        timeouts may happen after the service accepted the request, so they are
+        only retried for methods other than POST, to avoid submitting an
+        analysis twice.
+        """
+        if isinstance(error, (aiohttp.ClientConnectorError, _CONNECTION_TIMEOUT_ERRORS)):
+            return True
+        return method != "POST" and isinstance(
+            error, (aiohttp.ClientConnectionError, asyncio.TimeoutError)
+        )
+
+    async def _request(self, method, url, headers=None, **kwargs):
+        """Sends a request through the pooled session, retrying throttled responses and connection errors.
+
+        The response body is read before the connection is released, so the
+        returned response can still be inspected with `json()` or `read()`.
+        A `data_factory` callable may be passed instead of `data` to provide a
+        fresh streaming body for every attempt, `max_retries` overrides the
+        client setting (0 for bodies that cannot be replayed), and retried
+        attempts are counted in the OperationMetrics passed as `metrics`.
+        """
+        session = self._get_session()
+        headers = headers or self._headers
+        # A streamed body is consumed by each attempt, so it is rebuilt before every send.
+        data_factory = kwargs.pop("data_factory", None)
+        metrics = kwargs.pop("metrics", None)
+        max_retries = kwargs.pop("max_retries", self._max_retries)
+        attempt = 0
+        while True:
+            if data_factory is not None:
+                kwargs["data"] = data_factory()
+            if self._token_provider is not None:
+                # Resolved per attempt, since a retry may wait past the token's expiry.
+                headers = {**headers, "Authorization": await self._get_authorization()}
+            try:
+                async with self._semaphore:
+                    response = await session.request(method, url, headers=headers, **kwargs)
+                    # Reading the whole body returns the connection to the pool; the
+                    # response is not released explicitly so read() keeps working.
+                    await response.read()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt >= max_retries or not self._is_retryable_error(method, e):
+                    raise
+                delay = self._get_retry_delay(None, attempt)
+                self._logger.info(f"Request failed with {e!r}, retrying in {delay:.2f} seconds.")
+                if metrics is not None:
+                    metrics.record_retries((None,))
+                attempt += 1
+                await asyncio.sleep(delay)
+                continue
+            if response.status not in self._retry_status_codes or attempt >= max_retries:
+                return response
+            if metrics is not None:
+                metrics.record_retries((response.status,))
+            delay = self._get_retry_delay(response, attempt)
+            self._logger.info(
+                f"Request throttled with status {response.status}, retrying in {delay:.2f} seconds."
+            )
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def get_all_analyzers(self):
+        """
+        Retrieves a list of all available analyzers from the content understanding service.
+
+        Returns:
+            dict: A dictionary containing the JSON response from the service.
+
+        Raises:
+            aiohttp.ClientResponseError: If the HTTP request returned an unsuccessful status code.
+        """
+        response = await self._request(
+            "GET", self._get_analyzer_list_url(self._endpoint, self._api_version)
+        )
+        response.raise_for_status()
+        return await response.json()
+
+    async def get_analyzer_detail_by_id(self, analyzer_id):
+        """
+        Retrieves a specific analyzer detail through analyzerid from the content understanding service.
+
+        Args:
+            analyzer_id (str): The unique identifier for the analyzer.
+
+        Returns:
+            dict: A dictionary containing the JSON response from the service.
+
+        Raises:
+            aiohttp.ClientResponseError: If the request fails.
+        """
+        response = await self._request(
+            "GET", self._get_analyzer_url(self._endpoint, self._api_version, analyzer_id)
+        )
+        response.raise_for_status()
+        return await response.json()
+
+    async def begin_create_analyzer(
+        self,
+        analyzer_id: str,
+        analyzer_template: dict = None,
+        analyzer_template_path: str = "",
+        training_storage_container_sas_url: str = "",
+        training_storage_container_path_prefix: str = "",
+    ):
+        """
+        Initiates the creation of an analyzer with the given ID and schema.
+
+        Args:
+            analyzer_id (str): The unique identifier for the analyzer.
+            analyzer_template (dict, optional): The schema definition for the analyzer. Defaults to None.
+            analyzer_template_path (str, optional): The file path to the analyzer schema JSON file. Defaults to "".
+            training_storage_container_sas_url (str, optional): The SAS URL for the training storage container. Defaults to "".
+            training_storage_container_path_prefix (str, optional): The path prefix within the training storage container. Defaults to "".
+
+        Raises:
+            ValueError: If neither `analyzer_template` nor `analyzer_template_path` is provided.
+            aiohttp.ClientResponseError: If the HTTP request to create the analyzer fails.
+
+        Returns:
+            aiohttp.ClientResponse: The response object from the HTTP request.
+        """
+        if analyzer_template_path and Path(analyzer_template_path).exists():
+            with open(analyzer_template_path, "r") as file:
+                analyzer_template = json.load(file)
+
+        if not analyzer_template:
+            raise ValueError("Analyzer schema must be provided.")
+
+        if (
+            training_storage_container_sas_url
+            and training_storage_container_path_prefix
+        ):  # noqa
+            analyzer_template["trainingData"] = self._get_training_data_config(
+                training_storage_container_sas_url,
+                training_storage_container_path_prefix,
+            )
+
+        headers = {"Content-Type": "application/json"}
+        headers.update(self._headers)
+
+        response = await self._request(
+            "PUT",
+            self._get_analyzer_url(self._endpoint, self._api_version, analyzer_id),
+            headers=headers,
+            json=analyzer_template,
+        )
+        response.raise_for_status()
+        self._logger.info(f"Analyzer {analyzer_id} create request accepted.")
+        return response
+
+    async def delete_analyzer(self, analyzer_id: str):
+        """
+        Deletes an analyzer with the specified analyzer ID.
+
+        Args:
+            analyzer_id (str): The ID of the analyzer to be deleted.
+
+        Returns:
+            aiohttp.ClientResponse: The response object from the delete request.
+
+        Raises:
+            aiohttp.ClientResponseError: If the delete request fails.
+        """
+        response = await self._request(
+            "DELETE", self._get_analyzer_url(self._endpoint, self._api_version, analyzer_id)
+        )
+        response.raise_for_status()
+        self._logger.info(f"Analyzer {analyzer_id} deleted.")
+        return response
+
+    async def begin_analyze(self, analyzer_id: str, file_location):
+        """
+        Begins the analysis of a file, URL or in-memory content using the specified analyzer.
+
+        Local files are streamed from disk instead of being read into memory.
+
+        Args:
+            analyzer_id (str): The ID of the analyzer to use.
+            file_location (str | bytes | memoryview | file-like): The path to the file, the URL
+                to analyze, or the content itself as a bytes-like or binary file-like object.
+
+        Returns:
+            aiohttp.ClientResponse: The response from the analysis request.
+
+        Raises:
+            ValueError: If the file location is not a valid path or URL.
+            aiohttp.ClientResponseError: If the HTTP request returned an unsuccessful status code.
+        """
+        url = self._get_analyze_url(self._endpoint, self._api_version, analyzer_id)
+        headers = {"Content-Type": "application/octet-stream"}
+        headers.update(self._headers)
+        content_type = self._guess_content_type(file_location)
+        metrics = (
+            OperationMetrics(analyzer_id, content_type)
+            if self._instrumentation is not None
+            else None
+        )
+        upload_start = time.perf_counter()
+        try:
+            if not isinstance(file_location, (str, os.PathLike)):
+                if hasattr(file_location, "read"):
+                    response = await self._post_file(url, headers, file_location, metrics=metrics)
+                else:
+                    try:
+                        data = memoryview(file_location).cast("B")
+                    except TypeError:
+                        raise ValueError(
+                            "Content must be a path, URL, bytes-like object or file-like object."
+                        ) from None
+                    response = await self._request(
+                        "POST", url, headers=headers, data=data, metrics=metrics
+                    )
+            elif Path(file_location).exists():
+                with open(file_location, "rb") as file:
+                    response = await self._post_file(url, headers, file, metrics=metrics)
+            elif "https://" in str(file_location) or "http://" in str(file_location):
+                headers["Content-Type"] = "application/json"
+                response = await self._request(
+                    "POST", url, headers=headers, json={"url": str(file_location)}, metrics=metrics
+                )
+            else:
+                raise ValueError("File location must be a valid path or URL.")
+
+            if metrics is not None:
+                metrics.upload_seconds = time.perf_counter() - upload_start
+                upload_bytes = response.request_info.headers.get("Content-Length")
+                metrics.upload_bytes = int(upload_bytes) if upload_bytes else None
+            response.raise_for_status()
+        except Exception as e:
+            if metrics is not None:
+                self._end_operation(metrics, e)
+            raise
+        response.operation_context = OperationContext(
+            analyzer_id, content_type, time.time(), metrics
+        )
+        self._logger.info(
+            f"Analyzing file {self._describe_location(file_location)} with analyzer: {analyzer_id}"
+        )
+        return response
+
+    async def _post_file(self, url, headers, file, block_size=1 << 20, metrics=None):
+        """Streams a binary file-like object as the request body, block by block.
+
+        Blocks are read on a worker thread so disk reads do not stall the event
+        loop. The file is not closed. A seekable file is rewound before a retry;
+        a non-seekable stream cannot be sent twice, so its request is not retried
+        and a throttled response is returned as is.
+        """
+        seekable = getattr(file, "seekable", None)
+        start = file.tell() if seekable and seekable() else None
+        if start is not None:
+            headers = dict(headers)
+            headers["Content-Length"] = str(file.seek(0, os.SEEK_END) - start)
+
+        async def read_blocks():
+            if start is not None:
+                file.seek(start)
+            while True:
+                block = await asyncio.to_thread(file.read, block_size)
+                if not block:
+                    return
+                yield block
+
+        return await self._request(
+            "POST", url, headers=headers, data_factory=read_blocks, metrics=metrics,
+            max_retries=self._max_retries if start is not None else 0,
+        )
+
+    async def get_image_from_analyze_operation(self, analyze_response, image_id: str):
+        """Retrieves an image from the analyze operation using the image ID.
+        Args:
+            analyze_response (aiohttp.ClientResponse): The response object from the analyze operation.
+            image_id (str): The ID of the image to retrieve.
+        Returns:
+            bytes: The image content as a byte string.
+        Raises:
+            ValueError: If the operation location is missing or the response is not an image.
+            aiohttp.ClientResponseError: If the HTTP request returned an unsuccessful status code.
+        """
+        response = await self._request("GET", self._get_image_url(analyze_response, image_id))
+        response.raise_for_status()
+        self._check_image_response(response, image_id)
+        return await response.read()
+
+    async def get_images(
+        self,
+        analyze_response,
+        image_ids,
+        output_dir: str = None,
+        callback: callable = None,
+        max_concurrency: int = 8,
+        overwrite: bool = False,
+    ):
+        """Retrieves many images of an analyze operation concurrently.
+
+        Behaves like AzureContentUnderstandingClient.get_images: images are saved to
+        `<output_dir>/<image_id>.jpg` (skipping those already on disk) or passed to
+        `callback(image_id, content)`, which may be a coroutine function. File writes
+        run on a worker thread so they do not stall the event loop.
+
+        Args:
+            analyze_response (aiohttp.ClientResponse): The response object from the analyze operation.
+            image_ids (iterable): The IDs of the images to retrieve, e.g. keyframe or face IDs.
+            output_dir (str, optional): The directory to save the images to. Defaults to None.
+            callback (callable, optional): Receives each image instead of saving it. Defaults to None.
+            max_concurrency (int, optional): The maximum number of parallel downloads. Defaults to 8.
+            overwrite (bool, optional): Download images even if they already exist on disk. Defaults to False.
+
+        Returns:
+            list[ImageDownloadResult]: One result per image ID, in input order.
+
+        Raises:
+            ValueError: If neither or both of `output_dir` and `callback` are given, or the
+                operation location is missing.
+        """
+        if (output_dir is None) == (callback is None):
+            raise ValueError("Exactly one of output_dir and callback must be provided.")
+        # Fail fast on a response without an operation location.
+        self._get_image_url(analyze_response, "")
+        if output_dir is not None:
+            output_dir = Path(output_dir)
+            output_dir.mkdir(parents=True, exist_ok=True)
+        limit = asyncio.Semaphore(max_concurrency)
+
+        def save(path, content):
+            partial_path = path.with_name(f".{path.name}.partial")
+            try:
+                partial_path.write_bytes(content)
+                os.replace(partial_path, path)
+            finally:
+                if partial_path.exists():
+                    partial_path.unlink()
+
+        async def download(image_id):
+            path = output_dir / f"{image_id}.jpg" if output_dir is not None else None
+            if path is not None and not overwrite and path.exists():
+                return ImageDownloadResult(image_id, path, skipped=True)
+            try:
+                async with limit:
+                    content = await self.get_image_from_analyze_operation(
+                        analyze_response, image_id
+                    )
+                if path is None:
+                    result = callback(image_id, content)
+                    if asyncio.iscoroutine(result):
+                        await result
+                else:
+                    await asyncio.to_thread(save, path, content)
+                return ImageDownloadResult(image_id, path, size=len(content))
+            except Exception as e:
+                self._logger.error(f"Retrieving image {image_id} failed: {e}")
+                return ImageDownloadResult(image_id, path, error=e)
+
+        return list(await asyncio.gather(*(download(image_id) for image_id in image_ids)))
+
+    async def poll_result(
+        self,
+        response,
+        timeout_seconds: int = 120,
+        polling_interval_seconds: int = None,
+        polling_strategy: PollingStrategy = None,
+    ):
+        """
+        Polls the result of an asynchronous operation until it completes or times out.
+
+        Waiting between polls suspends only the calling task, so many operations
+        can be polled concurrently on one event loop. By default the client polling
+        strategy is used, as in AzureContentUnderstandingClient.poll_result.
+
+        Args:
+            response (aiohttp.ClientResponse): The initial response object containing the operation location.
+            timeout_seconds (int, optional): The maximum number of seconds to wait for the operation to complete. Defaults to 120.
+            polling_interval_seconds (int, optional): Poll at this fixed interval instead of using the polling strategy. Defaults to None.
+            polling_strategy (PollingStrategy, optional): Overrides the client polling strategy for this operation. Defaults to None.
+
+        Raises:
+            ValueError: If the operation location is not found in the response headers.
+            TimeoutError: If the operation does not complete within the specified timeout.
+            RuntimeError: If the operation fails.
+
+        Returns:
+            dict: The JSON response of the completed operation if it succeeds.
+        """
+        operation_location = response.headers.get("operation-location", "")
+        if not operation_location:
+            raise ValueError("Operation location not found in response headers.")
+
+        if polling_strategy is None:
+            polling_strategy = (
+                FixedIntervalPolling(polling_interval_seconds)
+                if polling_interval_seconds is not None
+                else self._polling_strategy
+            )
+        context = getattr(response, "operation_context", None)
+        estimator_key = context.estimator_key if context else None
+        expected_seconds = (
+            self._duration_estimator.estimate(estimator_key) if estimator_key else None
+        )
+        start_time = time.time()
+        submitted_at = context.submitted_at if context else start_time
+        operation_id = operation_location.split("/")[-1].split("?")[0]
+        metrics = context.metrics if context else None
+        if metrics is not None:
+            metrics.operation_id = operation_id
+        attempt = 0
+        retry_after = None
+        last_running_seconds = None
+        try:
+            while True:
+                delay = polling_strategy.get_delay(
+                    attempt, time.time() - submitted_at, retry_after, expected_seconds
+                )
+                # Never sleep past the deadline; the last poll then reports the timeout.
+                remaining = timeout_seconds - (time.time() - start_time)
+                await asyncio.sleep(min(delay, max(0.0, remaining) + 0.001))
+
+                elapsed_time = time.time() - start_time
+                if elapsed_time > timeout_seconds:
+                    raise TimeoutError(
+                        f"Operation timed out after {timeout_seconds:.2f} seconds."
+                    )
+
+                response = await self._request("GET", operation_location, metrics=metrics)
+                if metrics is not None:
+                    metrics.polls += 1
+                response.raise_for_status()
+                result = await response.json()
+                attempt += 1
+                status = result.get("status").lower()
+                if metrics is not None:
+                    metrics.record_status(status, result, time.time())
+                if status == "succeeded":
+                    self._logger.info(
+                        f"Request result is ready after {elapsed_time:.2f} seconds."
+                    )
+                    if estimator_key:
+                        self._observe_duration(
+                            estimator_key,
+                            polling_strategy,
+                            last_running_seconds,
+                            time.time() - submitted_at,
+                        )
+                    if metrics is not None:
+                        self._end_operation(metrics)
+                    return result
+                elif status == "failed":
+                    self._logger.error(f"Request failed. Reason: {result}")
+                    raise RuntimeError("Request failed.")
+                last_running_seconds = time.time() - submitted_at
+                self._logger.info(f"Request {operation_id} in progress ...")
+                retry_after = response.headers.get("Retry-After")
+                try:
+                    retry_after = float(retry_after) if retry_after else None
+                except ValueError:
+                    retry_after = None
+        except Exception as e:
+            if metrics is not None:
+                self._end_operation(metrics, e)
+            raise
@@ -1,12 +1,179 @@
 import requests
+from requests.adapters import HTTPAdapter
 from requests.models import Response
+from urllib3.util.retry import Retry
 import logging
+import contextlib
+import inspect
 import json
+import os
+import threading
 import time
+from collections.abc import Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from itertools import islice
 from pathlib import Path
+from typing import TYPE_CHECKING
 
+from .client_base import ContentUnderstandingClientBase
+from .credentials import BearerTokenAuth
+from .instrumentation import Instrumentation, OperationMetrics
+from .polling import (
+    AdaptivePolling,
+    DurationEstimator,
+    FixedIntervalPolling,
+    PollScheduler,
+)
+from .rate_limiter import TokenBucket
+from .result_cache import (
+    ResultCache,
+    hash_analyzer_definition,
+    hash_content,
+    make_cache_key,
+)
 
-class AzureContentUnderstandingClient:
+if TYPE_CHECKING:
+    # Imported only for annotations: sqlite3 is not loaded until a journal is used.
+    from .job_journal import JobJournal
+
+
+class _TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter applying a default timeout to requests that do not set one."""
+
+    __attrs__ = HTTPAdapter.__attrs__ + ["_timeout"]
+
+    def __init__(self, timeout=None, **kwargs):
+        self._timeout = timeout
+        super().__init__(**kwargs)
+
+    def send(self, request, timeout=None, **kwargs):
+        return super().send(request, timeout=self._timeout if timeout is None else timeout, **kwargs)
+
+
+class _ChunkedUploadBody:
+    """Wraps an iterable of byte chunks so requests can stream it with a known Content-Length.
+
+    The chunks can only be sent once, so it is posted without status retries
+    (see `_can_resend`); should it still be replayed, it fails loudly instead
+    of sending an empty body under a non-zero Content-Length.
+    """
+
+    def __init__(self, chunks, content_length=None):
+        self._chunks = chunks
+        self._content_length = content_length
+        self._consumed = False
+
+    def __len__(self):
+        return self._content_length or 0
+
+    def __bool__(self):
+        # An unknown length must not make the body look empty.
+        return True
+
+    def __iter__(self):
+        if self._consumed:
+            raise ValueError("An iterable upload body cannot be sent more than once.")
+        self._consumed = True
+        return iter(self._chunks)
+
+
+def _can_resend(body):
+    """Whether urllib3 can rewind a request body and send it again on a retry."""
+    if isinstance(body, _ChunkedUploadBody):
+        return False
+    if hasattr(body, "read"):
+        seekable = getattr(body, "seekable", None)
+        if seekable is not None:
+            return seekable()
+        return hasattr(body, "seek") and hasattr(body, "tell")
+    return True
+
+
+class OperationContext:
+    """Describes a submitted analyze operation; attached to the begin_analyze response.
+
+    Attributes:
+        analyzer_id (str): The ID of the analyzer used.
+        content_type (str): The guessed MIME type of the analyzed content.
+        submitted_at (float): The time.time() at which the operation was accepted.
+        metrics (OperationMetrics): The metrics being collected, or None without instrumentation.
+    """
+
+    __slots__ = ("analyzer_id", "content_type", "submitted_at", "metrics")
+
+    def __init__(self, analyzer_id, content_type, submitted_at, metrics=None):
+        self.analyzer_id = analyzer_id
+        self.content_type = content_type
+        self.submitted_at = submitted_at
+        self.metrics = metrics
+
+    @property
+    def estimator_key(self):
+        return (self.analyzer_id, self.content_type)
+
+
+class AnalyzeManyResult:
+    """The outcome of analyzing one location in `analyze_many`.
+
+    Attributes:
+        index (int): The position of the location in the input.
+        location (str): The file path or URL that was analyzed.
+        result (dict): The JSON response of the completed operation, or None on error.
+        error (Exception): The exception raised while analyzing, or None on success.
+        elapsed_seconds (float): The wall-clock time spent on this location.
+    """
+
+    __slots__ = ("index", "location", "result", "error", "elapsed_seconds")
+
+    def __init__(self, index, location, result=None, error=None, elapsed_seconds=0.0):
+        self.index = index
+        self.location = location
+        self.result = result
+        self.error = error
+        self.elapsed_seconds = elapsed_seconds
+
+    @property
+    def succeeded(self):
+        return self.error is None
+
+    def __repr__(self):
+        status = "succeeded" if self.succeeded else f"failed: {self.error!r}"
+        return f"AnalyzeManyResult(index={self.index}, location={self.location!r}, {status})"
+
+
+class ImageDownloadResult:
+    """The outcome of retrieving one image in `get_images`.
+
+    Attributes:
+        image_id (str): The ID of the image, e.g. "keyFrame.1000" or "face.<faceId>".
+        path (Path): The file the image was saved to, or None when it was passed to a callback.
+        size (int): The number of bytes retrieved; 0 when the image was skipped.
+        skipped (bool): Whether the image already existed on disk and was not downloaded.
+        error (Exception): The exception raised while retrieving the image, or None on success.
+    """
+
+    __slots__ = ("image_id", "path", "size", "skipped", "error")
+
+    def __init__(self, image_id, path=None, size=0, skipped=False, error=None):
+        self.image_id = image_id
+        self.path = path
+        self.size = size
+        self.skipped = skipped
+        self.error = error
+
+    @property
+    def succeeded(self):
+        return self.error is None
+
+    def __repr__(self):
+        if not self.succeeded:
+            status = f"failed: {self.error!r}"
+        else:
+            status = "skipped" if self.skipped else f"size={self.size}"
+        return f"ImageDownloadResult(image_id={self.image_id!r}, path={self.path!r}, {status})"
+
+
+class AzureContentUnderstandingClient(ContentUnderstandingClientBase):
     # def __init__(
     #     self,
     #     endpoint: str,
@@ -38,10 +205,26 @@ class AzureContentUnderstandingClient:
         subscription_key: str = None,
         token_provider: callable = None,            # still optional, but unused if you supply a key
         x_ms_useragent: str = "cu-sample-code",
+        pool_connections: int = 10,
+        pool_maxsize: int = 32,
+        pool_block: bool = False,
+        max_retries: int = 5,
+        backoff_factor: float = 0.5,
+        backoff_max: float = 60,
+        backoff_jitter: float = 0.5,
+        retry_status_codes: tuple = (429, 503),
+        timeout: tuple = (10, 120),
+        polling_strategy=None,
+        duration_estimator: DurationEstimator = None,
+        poll_workers: int = 4,
+        result_cache: ResultCache = None,
+        analyzer_cache_ttl_seconds: float = 300,
+        instrumentation: Instrumentation = None,
     ):
-        # You must provide at least a subscription key
-        if not subscription_key:
-            raise ValueError("A subscription key must be provided.")
+        if not subscription_key and not token_provider:
+            raise ValueError(
+                "Either subscription key or token provider must be provided."
+            )
 
         if not api_version:
             raise ValueError("API version must be provided.")
@@ -52,50 +235,150 @@ class AzureContentUnderstandingClient:
         self._api_version = api_version
         self._logger = logging.getLogger(__name__)
 
-        # **Only** call token_provider if you really passed one in
-        token = token_provider() if callable(token_provider) else None
+        # The subscription key is sent with every request; without one, a
+        # cached bearer token is resolved per request and refreshed ahead of expiry.
+        self._headers = self._get_headers(subscription_key, x_ms_useragent)
+        self._token_provider = (
+            None if subscription_key else self._get_cached_token_provider(token_provider)
+        )
 
-        # Build headers with your key + (optional) token
-        self._headers = self._get_headers(
-            subscription_key,
-            token,
-            x_ms_useragent
+        # One pooled session shared by every call: connections are kept alive
+        # and reused, and throttled requests are retried with backoff.
+        # Every request gets a (connect, read) timeout, so a hung connection
+        # cannot block a poll worker or poll_result forever.
+        self._timeout = timeout
+        retry = self._get_retry_policy(
+            max_retries=max_retries,
+            backoff_factor=backoff_factor,
+            backoff_max=backoff_max,
+            backoff_jitter=backoff_jitter,
+            retry_status_codes=retry_status_codes,
         )
+        self._session = self._create_session(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            timeout=timeout,
+            retry=retry,
+        )
+        # Upload bodies that can only be read once (iterables, non-seekable
+        # streams) go through a session that does not retry on status: a
+        # replay would have no body, so a throttled response is returned as
+        # is, as the async client does.
+        self._single_attempt_session = self._create_session(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            timeout=timeout,
+            retry=retry.new(status=0),
+        )
+        if self._token_provider is not None:
+            auth = BearerTokenAuth(self._token_provider, self._endpoint)
+            self._session.auth = auth
+            self._single_attempt_session.auth = auth
+
+        # Status polling of all operations is multiplexed on one scheduler,
+        # created on first use.
+        self._polling_strategy = polling_strategy or AdaptivePolling()
+        self._duration_estimator = duration_estimator or DurationEstimator()
+        self._poll_workers = poll_workers
+        self._poll_scheduler = None
+        self._poll_scheduler_lock = threading.Lock()
+
+        # Opt-in cache of completed results, used by analyze().
+        self._result_cache = result_cache
 
-    def _get_analyzer_url(self, endpoint, api_version, analyzer_id):
-        return f"{endpoint}/contentunderstanding/analyzers/{analyzer_id}?api-version={api_version}"  # noqa
+        # Deployed analyzer definitions by analyzer id, as (expires_at, definition).
+        self._analyzer_cache_ttl_seconds = analyzer_cache_ttl_seconds
+        self._analyzer_definitions = {}
 
-    def _get_analyzer_list_url(self, endpoint, api_version):
-        return f"{endpoint}/contentunderstanding/analyzers?api-version={api_version}"
+        # Optional telemetry hooks; without them no metrics are collected.
+        self._instrumentation = instrumentation
 
-    def _get_analyze_url(self, endpoint, api_version, analyzer_id):
-        return f"{endpoint}/contentunderstanding/analyzers/{analyzer_id}:analyze?api-version={api_version}"  # noqa
+    def __enter__(self):
+        return self
 
-    def _get_training_data_config(
-        self, storage_container_sas_url, storage_container_path_prefix
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Closes the pooled HTTP session and releases its connections."""
+        if self._poll_scheduler is not None:
+            self._poll_scheduler.close()
+            self._poll_scheduler = None
+        self._session.close()
+        self._single_attempt_session.close()
+
+    def _get_poll_scheduler(self):
+        if self._poll_scheduler is None:
+            with self._poll_scheduler_lock:
+                if self._poll_scheduler is None:
+                    self._poll_scheduler = PollScheduler(max_workers=self._poll_workers)
+        return self._poll_scheduler
+
+    def _get_retry_policy(
+        self,
+        max_retries,
+        backoff_factor,
+        backoff_max,
+        backoff_jitter,
+        retry_status_codes,
     ):
-        return {
-            "containerUrl": storage_container_sas_url,
-            "kind": "blob",
-            "prefix": storage_container_path_prefix,
-        }
-
-    def _get_headers(self, subscription_key, api_token, x_ms_useragent):
-        """Returns the headers for the HTTP requests.
+        """Returns the retry policy used by the pooled session.
+        Args:
+            max_retries (int): The maximum number of retries per request.
+            backoff_factor (float): The base of the exponential backoff, in seconds.
+            backoff_max (float): The upper bound of a single backoff, in seconds.
+            backoff_jitter (float): The maximum random jitter added to each backoff, in seconds.
+            retry_status_codes (tuple): The status codes that trigger a retry.
+        Returns:
+            Retry: The urllib3 retry policy.
+        """
+        options = {}
+        # backoff_max and backoff_jitter are urllib3 2.x options; on 1.26 the
+        # backoff is capped at urllib3's default maximum and has no jitter.
+        supported = inspect.signature(Retry.__init__).parameters
+        if "backoff_max" in supported:
+            options["backoff_max"] = backoff_max
+        if "backoff_jitter" in supported:
+            options["backoff_jitter"] = backoff_jitter
+        return Retry(
+            total=max_retries,
+            # A read error may arrive after the service accepted the request,
+            # so it is not retried to avoid submitting an analysis twice.
+            read=0,
+            backoff_factor=backoff_factor,
+            status_forcelist=retry_status_codes,
+            # 429 and 503 mean the request was not processed, so every method
+            # (including the analyze POST) is safe to retry.
+            allowed_methods=None,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+            **options,
+        )
+
+    def _create_session(self, pool_connections, pool_maxsize, pool_block, retry, timeout=None):
+        """Returns a requests session backed by a keep-alive connection pool.
         Args:
-            subscription_key (str): The subscription key for the service.
-            api_token (str): The API token for the service.
-            enable_face_identification (bool): A flag to enable face identification.
+            pool_connections (int): The number of per-host connection pools to cache.
+            pool_maxsize (int): The maximum number of connections kept per host.
+            pool_block (bool): Whether to block when the pool has no free connection.
+            retry (Retry): The retry policy applied to every request.
+            timeout (float | tuple): The default (connect, read) timeout of every request, in seconds.
         Returns:
-            dict: A dictionary containing the headers for the HTTP requests.
+            requests.Session: The configured session.
         """
-        headers = (
-            {"Ocp-Apim-Subscription-Key": subscription_key}
-            if subscription_key
-            else {"Authorization": f"Bearer {api_token}"}
+        session = requests.Session()
+        adapter = _TimeoutHTTPAdapter(
+            timeout=timeout,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            max_retries=retry,
         )
-        headers["x-ms-useragent"] = x_ms_useragent
-        return headers
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
 
     def get_all_analyzers(self):
         """
@@ -111,13 +394,33 @@ class AzureContentUnderstandingClient:
         Raises:
             requests.exceptions.HTTPError: If the HTTP request returned an unsuccessful status code.
         """
-        response = requests.get(
+        response = self._session.get(
             url=self._get_analyzer_list_url(self._endpoint, self._api_version),
             headers=self._headers,
         )
         response.raise_for_status()
         return response.json()
 
+    def iter_analyzers(self):
+        """
+        Lazily iterates over all analyzers, following `nextLink` pagination.
+
+        Each page is requested only when the previous one has been consumed.
+
+        Yields:
+            dict: The definition of each analyzer.
+
+        Raises:
+            requests.exceptions.HTTPError: If an HTTP request returned an unsuccessful status code.
+        """
+        url = self._get_analyzer_list_url(self._endpoint, self._api_version)
+        while url:
+            response = self._session.get(url=url, headers=self._headers)
+            response.raise_for_status()
+            page = response.json()
+            yield from page.get("value", [])
+            url = page.get("nextLink")
+
     def get_analyzer_detail_by_id(self, analyzer_id):
         """
         Retrieves a specific analyzer detail through analyzerid from the content understanding service.
@@ -132,12 +435,111 @@ class AzureContentUnderstandingClient:
         Raises:
             HTTPError: If the request fails.
         """
-        response = requests.get(
+        response = self._session.get(
             url=self._get_analyzer_url(self._endpoint, self._api_version, analyzer_id),
             headers=self._headers,
         )
         response.raise_for_status()
-        return response.json()
+        definition = response.json()
+        self._analyzer_definitions[analyzer_id] = (
+            time.monotonic() + self._analyzer_cache_ttl_seconds,
+            definition,
+        )
+        return definition
+
+    def get_cached_analyzer_detail_by_id(self, analyzer_id):
+        """
+        Returns the analyzer detail from the in-process cache, fetching it if missing or expired.
+
+        Args:
+            analyzer_id (str): The unique identifier for the analyzer.
+
+        Returns:
+            dict: The analyzer detail, or None if the analyzer does not exist.
+
+        Raises:
+            HTTPError: If the request fails with a status other than 404.
+        """
+        cached = self._analyzer_definitions.get(analyzer_id)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        try:
+            return self.get_analyzer_detail_by_id(analyzer_id)
+        except requests.exceptions.HTTPError as e:
+            if e.response is not None and e.response.status_code == 404:
+                self._analyzer_definitions.pop(analyzer_id, None)
+                return None
+            raise
+
+    def ensure_analyzer(
+        self,
+        analyzer_id: str,
+        analyzer_template: dict = None,
+        analyzer_template_path: str = "",
+        training_storage_container_sas_url: str = "",
+        training_storage_container_path_prefix: str = "",
+        timeout_seconds: int = 120,
+    ):
+        """
+        Makes sure an analyzer matching the template is deployed, creating it only if needed.
+
+        The normalized template is hashed and the hash is stored in the analyzer `tags`. If the
+        deployed analyzer carries the same hash, or matches the template field by field, it is
+        reused without any write. Otherwise the stale analyzer is deleted and the template is
+        deployed, and the call waits for creation to finish.
+
+        Args:
+            analyzer_id (str): The unique identifier for the analyzer.
+            analyzer_template (dict, optional): The schema definition for the analyzer. Defaults to None.
+            analyzer_template_path (str, optional): The file path to the analyzer schema JSON file. Defaults to "".
+            training_storage_container_sas_url (str, optional): The SAS URL for the training storage container. Defaults to "".
+            training_storage_container_path_prefix (str, optional): The path prefix within the training storage container. Defaults to "".
+            timeout_seconds (int, optional): The maximum number of seconds to wait for creation. Defaults to 120.
+
+        Raises:
+            ValueError: If neither `analyzer_template` nor `analyzer_template_path` is provided.
+
+        Returns:
+            bool: True if the analyzer was created, False if the deployed one was reused.
+        """
+        if analyzer_template_path and Path(analyzer_template_path).exists():
+            with open(analyzer_template_path, "r") as file:
+                analyzer_template = json.load(file)
+        if not analyzer_template:
+            raise ValueError("Analyzer schema must be provided.")
+
+        template = dict(analyzer_template)
+        if (
+            training_storage_container_sas_url
+            and training_storage_container_path_prefix
+        ):  # noqa
+            template["trainingData"] = self._get_training_data_config(
+                training_storage_container_sas_url,
+                training_storage_container_path_prefix,
+            )
+        template_hash = hash_analyzer_definition(template)
+        template["tags"] = dict(template.get("tags") or {}, templateHash=template_hash)
+
+        deployed = self.get_cached_analyzer_detail_by_id(analyzer_id)
+        if deployed is not None:
+            if self._is_analyzer_up_to_date(deployed, template, template_hash):
+                self._logger.info(f"Analyzer {analyzer_id} is up to date, reusing it.")
+                return False
+            self._logger.info(f"Analyzer {analyzer_id} differs from the template, replacing it.")
+            self.delete_analyzer(analyzer_id)
+
+        response = self.begin_create_analyzer(analyzer_id, analyzer_template=template)
+        self.poll_result(response, timeout_seconds=timeout_seconds)
+        self._analyzer_definitions.pop(analyzer_id, None)
+        return True
+
+    def _is_analyzer_up_to_date(self, deployed, template, template_hash):
+        if (deployed.get("tags") or {}).get("templateHash") == template_hash:
+            return True
+        # Analyzers deployed without the hash tag are compared on the template fields.
+        return all(
+            deployed.get(key) == value for key, value in template.items() if key != "tags"
+        )
 
     def begin_create_analyzer(
         self,
@@ -183,12 +585,13 @@ class AzureContentUnderstandingClient:
         headers = {"Content-Type": "application/json"}
         headers.update(self._headers)
 
-        response = requests.put(
+        response = self._session.put(
             url=self._get_analyzer_url(self._endpoint, self._api_version, analyzer_id),
             headers=headers,
             json=analyzer_template,
         )
         response.raise_for_status()
+        self._analyzer_definitions.pop(analyzer_id, None)
         self._logger.info(f"Analyzer {analyzer_id} create request accepted.")
         return response
 
@@ -205,21 +608,36 @@ class AzureContentUnderstandingClient:
         Raises:
             HTTPError: If the delete request fails.
         """
-        response = requests.delete(
+        response = self._session.delete(
             url=self._get_analyzer_url(self._endpoint, self._api_version, analyzer_id),
             headers=self._headers,
         )
         response.raise_for_status()
+        self._analyzer_definitions.pop(analyzer_id, None)
         self._logger.info(f"Analyzer {analyzer_id} deleted.")
         return response
 
-    def begin_analyze(self, analyzer_id: str, file_location: str):
+    def begin_analyze(self, analyzer_id: str, file_location, content_length: int = None):
         """
-        Begins the analysis of a file or URL using the specified analyzer.
+        Begins the analysis of a file, URL or in-memory content using the specified analyzer.
+
+        Content is streamed to the service rather than read into memory first, so peak
+        memory stays flat regardless of the upload size. `file_location` may be:
+            - a path to a local file, which is streamed from disk;
+            - an http(s) URL, which the service downloads itself;
+            - `bytes`, `bytearray`, `memoryview` or another buffer, sent without copying;
+            - a binary file-like object with `read()`, such as an open file, `io.BytesIO`
+              or `mmap.mmap`, which is read in blocks;
+            - an iterable of `bytes` chunks, sent with `content_length` as its Content-Length
+              (or with chunked transfer encoding when `content_length` is None).
+
+        Iterables and non-seekable streams can only be sent once, so a throttled
+        upload of one is not retried and raises its HTTP 429 error instead.
 
         Args:
             analyzer_id (str): The ID of the analyzer to use.
-            file_location (str): The path to the file or the URL to analyze.
+            file_location (str | bytes | memoryview | file-like | iterable): The content to analyze.
+            content_length (int, optional): The total size in bytes of an iterable of chunks. Defaults to None.
 
         Returns:
             Response: The response from the analysis request.
@@ -228,41 +646,79 @@ class AzureContentUnderstandingClient:
             ValueError: If the file location is not a valid path or URL.
             HTTPError: If the HTTP request returned an unsuccessful status code.
         """
-        data = None
-        if Path(file_location).exists():
-            with open(file_location, "rb") as file:
-                data = file.read()
-            headers = {"Content-Type": "application/octet-stream"}
-        elif "https://" in file_location or "http://" in file_location:
-            data = {"url": file_location}
-            headers = {"Content-Type": "application/json"}
-        else:
-            raise ValueError("File location must be a valid path or URL.")
+        url = self._get_analyze_url(self._endpoint, self._api_version, analyzer_id)
+        content_type = self._guess_content_type(file_location)
+        metrics = (
+            OperationMetrics(analyzer_id, content_type)
+            if self._instrumentation is not None
+            else None
+        )
+        upload_start = time.perf_counter()
+        try:
+            with contextlib.ExitStack() as stack:
+                if isinstance(file_location, (str, os.PathLike)):
+                    if Path(file_location).exists():
+                        data = stack.enter_context(open(file_location, "rb"))
+                    elif "https://" in str(file_location) or "http://" in str(file_location):
+                        data = None
+                    else:
+                        raise ValueError("File location must be a valid path or URL.")
+                else:
+                    data = self._get_upload_body(file_location, content_length)
 
-        headers.update(self._headers)
-        if isinstance(data, dict):
-            response = requests.post(
-                url=self._get_analyze_url(
-                    self._endpoint, self._api_version, analyzer_id
-                ),
-                headers=headers,
-                json=data,
-            )
-        else:
-            response = requests.post(
-                url=self._get_analyze_url(
-                    self._endpoint, self._api_version, analyzer_id
-                ),
-                headers=headers,
-                data=data,
-            )
+                if data is None:
+                    headers = {"Content-Type": "application/json"}
+                    headers.update(self._headers)
+                    response = self._session.post(
+                        url=url, headers=headers, json={"url": str(file_location)}
+                    )
+                else:
+                    headers = {"Content-Type": "application/octet-stream"}
+                    headers.update(self._headers)
+                    session = self._session if _can_resend(data) else self._single_attempt_session
+                    response = session.post(url=url, headers=headers, data=data)
 
-        response.raise_for_status()
+            if metrics is not None:
+                metrics.upload_seconds = time.perf_counter() - upload_start
+                upload_bytes = response.request.headers.get("Content-Length")
+                metrics.upload_bytes = int(upload_bytes) if upload_bytes else None
+                self._record_retries(metrics, response)
+            response.raise_for_status()
+        except Exception as e:
+            if metrics is not None:
+                self._end_operation(metrics, e)
+            raise
+        description = self._describe_location(file_location)
+        response.operation_context = OperationContext(
+            analyzer_id, content_type, time.time(), metrics
+        )
         self._logger.info(
-            f"Analyzing file {file_location} with analyzer: {analyzer_id}"
+            f"Analyzing file {description} with analyzer: {analyzer_id}"
         )
         return response
 
+    def _get_upload_body(self, content, content_length=None):
+        """Returns a request body that streams in-memory or file-like content without copying it.
+        Args:
+            content (bytes | memoryview | file-like | iterable): The content to upload.
+            content_length (int, optional): The total size of an iterable of chunks.
+        Returns:
+            object: A body accepted by requests that sends `content` incrementally.
+        """
+        if isinstance(content, bytes) or hasattr(content, "read"):
+            return content
+        try:
+            # Flatten any buffer (bytearray, array, numpy array, ...) to a byte view
+            # so its length is reported in bytes.
+            return memoryview(content).cast("B")
+        except TypeError:
+            pass
+        if isinstance(content, Iterable):
+            return _ChunkedUploadBody(content, content_length)
+        raise ValueError(
+            "Content must be a path, URL, bytes-like object, file-like object or iterable of bytes."
+        )
+
     def get_image_from_analyze_operation(
         self, analyze_response: Response, image_id: str
     ):
@@ -272,40 +728,246 @@ class AzureContentUnderstandingClient:
             image_id (str): The ID of the image to retrieve.
         Returns:
             bytes: The image content as a byte string.
+        Raises:
+            ValueError: If the operation location is missing or the response is not an image.
+            requests.exceptions.HTTPError: If the HTTP request returned an unsuccessful status code.
         """
-        operation_location = analyze_response.headers.get("operation-location", "")
+        image_retrieval_url = self._get_image_url(analyze_response, image_id)
+        response = self._session.get(url=image_retrieval_url, headers=self._headers)
+        response.raise_for_status()
+        self._check_image_response(response, image_id)
+        return response.content
+
+    def get_images(
+        self,
+        analyze_response: Response,
+        image_ids,
+        output_dir: str = None,
+        callback: callable = None,
+        max_concurrency: int = 8,
+        overwrite: bool = False,
+        chunk_size: int = 1 << 16,
+    ):
+        """Retrieves many images of an analyze operation concurrently.
+
+        Images are downloaded in parallel over the pooled session. With `output_dir`, each
+        image is streamed to `<output_dir>/<image_id>.jpg` through a temporary file, so an
+        interrupted download never leaves a partial image behind, and images already on
+        disk are skipped. With `callback`, `callback(image_id, content)` is called with the
+        bytes of each image instead, from a worker thread. An error on one image is captured
+        in its result instead of aborting the others.
+
+        Args:
+            analyze_response (Response): The response object from the analyze operation.
+            image_ids (iterable): The IDs of the images to retrieve, e.g. keyframe or face IDs.
+            output_dir (str, optional): The directory to save the images to. Defaults to None.
+            callback (callable, optional): Receives each image instead of saving it. Defaults to None.
+            max_concurrency (int, optional): The maximum number of parallel downloads. Defaults to 8.
+            overwrite (bool, optional): Download images even if they already exist on disk. Defaults to False.
+            chunk_size (int, optional): The number of bytes written at a time. Defaults to 64 KiB.
+
+        Returns:
+            list[ImageDownloadResult]: One result per image ID, in input order.
+
+        Raises:
+            ValueError: If neither or both of `output_dir` and `callback` are given, or the
+                operation location is missing.
+        """
+        if (output_dir is None) == (callback is None):
+            raise ValueError("Exactly one of output_dir and callback must be provided.")
+        # Fail fast on a response without an operation location.
+        self._get_image_url(analyze_response, "")
+        if output_dir is not None:
+            output_dir = Path(output_dir)
+            output_dir.mkdir(parents=True, exist_ok=True)
+
+        def download(image_id):
+            path = output_dir / f"{image_id}.jpg" if output_dir is not None else None
+            if path is not None and not overwrite and path.exists():
+                return ImageDownloadResult(image_id, path, skipped=True)
+            try:
+                url = self._get_image_url(analyze_response, image_id)
+                with self._session.get(url, headers=self._headers, stream=True) as response:
+                    response.raise_for_status()
+                    self._check_image_response(response, image_id)
+                    if path is None:
+                        content = response.content
+                        callback(image_id, content)
+                        return ImageDownloadResult(image_id, size=len(content))
+                    size = 0
+                    partial_path = path.with_name(f".{path.name}.partial")
+                    try:
+                        with open(partial_path, "wb") as file:
+                            for chunk in response.iter_content(chunk_size):
+                                file.write(chunk)
+                                size += len(chunk)
+                        os.replace(partial_path, path)
+                    finally:
+                        if partial_path.exists():
+                            partial_path.unlink()
+                return ImageDownloadResult(image_id, path, size=size)
+            except Exception as e:
+                self._logger.error(f"Retrieving image {image_id} failed: {e}")
+                return ImageDownloadResult(image_id, path, error=e)
+
+        image_ids = list(image_ids)
+        if not image_ids:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(image_ids))) as executor:
+            return list(executor.map(download, image_ids))
+
+    def _get_operation_status(self, operation_location, metrics=None):
+        """Sends one status request for an operation.
+        Args:
+            operation_location (str): The operation URL.
+            metrics (OperationMetrics, optional): The operation metrics to count the request in.
+        Returns:
+            tuple: The lower-cased status, the JSON response and the Retry-After hint in seconds (or None).
+        """
+        response = self._session.get(operation_location, headers=self._headers)
+        if metrics is not None:
+            metrics.polls += 1
+            self._record_retries(metrics, response)
+        response.raise_for_status()
+        payload = response.json()
+        retry_after = response.headers.get("Retry-After")
+        try:
+            retry_after = float(retry_after) if retry_after else None
+        except ValueError:
+            retry_after = None
+        return payload.get("status").lower(), payload, retry_after
+
+    def _record_retries(self, metrics, response):
+        """Counts the attempts urllib3 retried before returning the response."""
+        retries = getattr(response.raw, "retries", None)
+        if retries is not None:
+            metrics.record_retries(entry.status for entry in retries.history)
+
+    def begin_poll(
+        self,
+        response: Response,
+        timeout_seconds: int = 120,
+        polling_interval_seconds: int = None,
+        polling_strategy=None,
+    ) -> Future:
+        """
+        Starts polling an asynchronous operation on the shared poll scheduler.
+
+        Args:
+            response (Response): The initial response object containing the operation location.
+            timeout_seconds (int, optional): The maximum number of seconds to wait for the operation to complete. Defaults to 120.
+            polling_interval_seconds (int, optional): Poll at this fixed interval instead of using the polling strategy. Defaults to None.
+            polling_strategy (PollingStrategy, optional): Overrides the client polling strategy for this operation. Defaults to None.
+
+        Raises:
+            ValueError: If the operation location is not found in the response headers.
+
+        Returns:
+            Future: Resolves to the JSON response of the completed operation, or fails with
+            TimeoutError, RuntimeError or an HTTP error.
+        """
+        operation_location = response.headers.get("operation-location", "")
         if not operation_location:
-            raise ValueError(
-                "Operation location not found in the analyzer response header."
+            raise ValueError("Operation location not found in response headers.")
+
+        if polling_strategy is None:
+            polling_strategy = (
+                FixedIntervalPolling(polling_interval_seconds)
+                if polling_interval_seconds is not None
+                else self._polling_strategy
             )
-        operation_location = operation_location.split("?api-version")[0]
-        image_retrieval_url = (
-            f"{operation_location}/images/{image_id}?api-version={self._api_version}"
+        context = getattr(response, "operation_context", None)
+        estimator_key = context.estimator_key if context else None
+        expected_seconds = (
+            self._duration_estimator.estimate(estimator_key) if estimator_key else None
         )
-        try:
-            response = requests.get(url=image_retrieval_url, headers=self._headers)
-            response.raise_for_status()
+        start_time = time.time()
+        submitted_at = context.submitted_at if context else start_time
+        operation_id = operation_location.split("/")[-1].split("?")[0]
+        metrics = context.metrics if context else None
+        if metrics is not None:
+            metrics.operation_id = operation_id
+        scheduler = self._get_poll_scheduler()
+        future = Future()
+        attempt = 0
+        last_running_seconds = None
 
-            assert response.headers.get("Content-Type") == "image/jpeg"
+        def poll():
+            nonlocal attempt, last_running_seconds
+            if future.cancelled():
+                return
+            try:
+                elapsed_time = time.time() - start_time
+                if elapsed_time > timeout_seconds:
+                    raise TimeoutError(
+                        f"Operation timed out after {timeout_seconds:.2f} seconds."
+                    )
+                status, payload, retry_after = self._get_operation_status(
+                    operation_location, metrics
+                )
+                attempt += 1
+                if metrics is not None:
+                    metrics.record_status(status, payload, time.time())
+                if status == "succeeded":
+                    self._logger.info(
+                        f"Request result is ready after {elapsed_time:.2f} seconds."
+                    )
+                    if estimator_key:
+                        self._observe_duration(
+                            estimator_key,
+                            polling_strategy,
+                            last_running_seconds,
+                            time.time() - submitted_at,
+                        )
+                    if metrics is not None:
+                        self._end_operation(metrics)
+                    future.set_result(payload)
+                    return
+                elif status == "failed":
+                    self._logger.error(f"Request failed. Reason: {payload}")
+                    raise RuntimeError("Request failed.")
+                last_running_seconds = time.time() - submitted_at
+                self._logger.info(f"Request {operation_id} in progress ...")
+                schedule_next(retry_after)
+            except Exception as e:
+                fail(e)
 
-            return response.content
-        except requests.exceptions.RequestException as e:
-            print(f"HTTP request failed: {e}")
-            return None
+        def fail(error):
+            if future.done():
+                return
+            if metrics is not None:
+                self._end_operation(metrics, error)
+            future.set_exception(error)
+
+        def schedule_next(retry_after=None):
+            delay = polling_strategy.get_delay(
+                attempt, time.time() - submitted_at, retry_after, expected_seconds
+            )
+            # Never sleep past the deadline; the last poll then reports the timeout.
+            remaining = timeout_seconds - (time.time() - start_time)
+            scheduler.schedule(min(delay, max(0.0, remaining) + 0.001), poll, on_cancel=fail)
+
+        schedule_next()
+        return future
 
     def poll_result(
         self,
         response: Response,
         timeout_seconds: int = 120,
-        polling_interval_seconds: int = 2,
+        polling_interval_seconds: int = None,
+        polling_strategy=None,
     ):
         """
         Polls the result of an asynchronous operation until it completes or times out.
 
+        By default the client polling strategy is used: it backs off exponentially, honours
+        Retry-After and learns the expected duration per analyzer and content type.
+
         Args:
             response (Response): The initial response object containing the operation location.
             timeout_seconds (int, optional): The maximum number of seconds to wait for the operation to complete. Defaults to 120.
-            polling_interval_seconds (int, optional): The number of seconds to wait between polling attempts. Defaults to 2.
+            polling_interval_seconds (int, optional): Poll at this fixed interval instead of using the polling strategy. Defaults to None.
+            polling_strategy (PollingStrategy, optional): Overrides the client polling strategy for this operation. Defaults to None.
 
         Raises:
             ValueError: If the operation location is not found in the response headers.
@@ -315,34 +977,367 @@ class AzureContentUnderstandingClient:
         Returns:
             dict: The JSON response of the completed operation if it succeeds.
         """
-        operation_location = response.headers.get("operation-location", "")
-        if not operation_location:
-            raise ValueError("Operation location not found in response headers.")
+        future = self.begin_poll(
+            response,
+            timeout_seconds=timeout_seconds,
+            polling_interval_seconds=polling_interval_seconds,
+            polling_strategy=polling_strategy,
+        )
+        try:
+            return future.result()
+        except BaseException:
+            future.cancel()
+            raise
 
-        headers = {"Content-Type": "application/json"}
-        headers.update(self._headers)
+    def analyze_many(
+        self,
+        analyzer_id: str,
+        locations,
+        max_in_flight: int = 8,
+        rps: float = None,
+        ordered: bool = False,
+        timeout_seconds: int = 120,
+        polling_interval_seconds: int = None,
+    ):
+        """
+        Analyzes many files or URLs concurrently and yields the results as they become available.
 
-        start_time = time.time()
-        while True:
-            elapsed_time = time.time() - start_time
-            if elapsed_time > timeout_seconds:
-                raise TimeoutError(
-                    f"Operation timed out after {timeout_seconds:.2f} seconds."
-                )
+        Submissions go through a token bucket limited to `rps` requests per second, and at most
+        `max_in_flight` operations are uploading or polling at any time. Locations are consumed
+        lazily, so `locations` may be a generator over a large directory listing. An error on one
+        location is captured in its result instead of aborting the batch.
 
-            response = requests.get(operation_location, headers=self._headers)
-            response.raise_for_status()
-            status = response.json().get("status").lower()
-            if status == "succeeded":
-                self._logger.info(
-                    f"Request result is ready after {elapsed_time:.2f} seconds."
-                )
-                return response.json()
-            elif status == "failed":
-                self._logger.error(f"Request failed. Reason: {response.json()}")
-                raise RuntimeError("Request failed.")
-            else:
-                self._logger.info(
-                    f"Request {operation_location.split('/')[-1].split('?')[0]} in progress ..."
+        Args:
+            analyzer_id (str): The ID of the analyzer to use.
+            locations (iterable): The file paths or URLs to analyze.
+            max_in_flight (int, optional): The maximum number of concurrent operations. Defaults to 8.
+            rps (float, optional): The maximum number of analyze submissions per second. Defaults to None (unlimited).
+            ordered (bool, optional): Yield results in input order instead of completion order; results
+                waiting behind a slower one count against max_in_flight. Defaults to False.
+            timeout_seconds (int, optional): The maximum number of seconds to wait for each operation. Defaults to 120.
+            polling_interval_seconds (int, optional): Poll at this fixed interval instead of using the polling strategy. Defaults to None.
+
+        Yields:
+            AnalyzeManyResult: The outcome of each location.
+        """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1.")
+        rate_limiter = TokenBucket(rps) if rps else None
+
+        def submit_one(location):
+            if rate_limiter:
+                rate_limiter.acquire()
+            return self.begin_analyze(analyzer_id, location)
+
+        return self._run_analyze_pipeline(
+            locations, submit_one, max_in_flight, ordered, timeout_seconds, polling_interval_seconds
+        )
+
+    def _run_analyze_pipeline(
+        self, locations, submit_one, max_in_flight, ordered, timeout_seconds, polling_interval_seconds
+    ):
+        """Submits each location with `submit_one` and polls the returned responses; see analyze_many."""
+        # Uploads run on the thread pool; once accepted, each operation is polled
+        # by the shared poll scheduler, so no thread sleeps between polls.
+        pending_locations = enumerate(locations)
+        executor = ThreadPoolExecutor(
+            max_workers=max_in_flight, thread_name_prefix="cu-submit"
+        )
+        in_flight = {}
+
+        def start(index, location):
+            in_flight[executor.submit(submit_one, location)] = (
+                index, location, time.time(), False
+            )
+
+        try:
+            for index, location in islice(pending_locations, max_in_flight):
+                start(index, location)
+            completed = {}
+            next_index = 0
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                finished = []
+                for future in done:
+                    index, location, start_time, polling = in_flight.pop(future)
+                    try:
+                        value = future.result()
+                        if not polling:
+                            poll_future = self.begin_poll(
+                                value,
+                                timeout_seconds=timeout_seconds,
+                                polling_interval_seconds=polling_interval_seconds,
+                            )
+                            in_flight[poll_future] = (index, location, start_time, True)
+                            continue
+                        item = AnalyzeManyResult(
+                            index, location, result=value,
+                            elapsed_seconds=time.time() - start_time,
+                        )
+                    except Exception as e:
+                        self._logger.error(
+                            f"Analyzing {self._describe_location(location)} failed: {e}"
+                        )
+                        item = AnalyzeManyResult(
+                            index, location, error=e,
+                            elapsed_seconds=time.time() - start_time,
+                        )
+                    finished.append(item)
+                if ordered:
+                    for item in finished:
+                        completed[item.index] = item
+                    finished = []
+                    while next_index in completed:
+                        finished.append(completed.pop(next_index))
+                        next_index += 1
+                # Refill the window before yielding so a slow consumer does not
+                # stall the operations still in flight. Results held back behind
+                # a slow item count against the window, which bounds the backlog
+                # of buffered results to max_in_flight.
+                free = max_in_flight - len(in_flight) - len(completed)
+                for index, location in islice(pending_locations, max(0, free)):
+                    start(index, location)
+                yield from finished
+        finally:
+            for future in in_flight:
+                future.cancel()
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def analyze_backfill(
+        self,
+        analyzer_id: str,
+        locations,
+        journal: "JobJournal",
+        max_in_flight: int = 8,
+        rps: float = None,
+        retry_failed: bool = False,
+        timeout_seconds: int = 120,
+        polling_interval_seconds: int = None,
+    ):
+        """
+        Analyzes many files or URLs like `analyze_many`, recording every job in a durable journal.
+
+        Each submission is journaled with its operation URL before it is polled. When a run is
+        restarted with the same journal, operations still in flight are polled again instead of
+        being resubmitted, and locations that already succeeded (or failed, unless
+        `retry_failed`) are skipped. A job is marked completed only after the caller has
+        processed its yielded result, so results interrupted by a crash are delivered again
+        on the next run. Local paths are journaled (and yielded) as absolute paths, so a run
+        can be restarted from another working directory. Use `journal.progress(analyzer_id)`
+        for progress counters.
+
+        Args:
+            analyzer_id (str): The ID of the analyzer to use.
+            locations (iterable): The file paths or URLs to analyze.
+            journal (JobJournal): The journal of this backfill.
+            max_in_flight (int, optional): The maximum number of concurrent operations. Defaults to 8.
+            rps (float, optional): The maximum number of analyze submissions per second. Defaults to None (unlimited).
+            retry_failed (bool, optional): Submit again the locations that failed in a previous run. Defaults to False.
+            timeout_seconds (int, optional): The maximum number of seconds to wait for each operation. Defaults to 120.
+            polling_interval_seconds (int, optional): Poll at this fixed interval instead of using the polling strategy. Defaults to None.
+
+        Yields:
+            AnalyzeManyResult: The outcome of each resumed or newly submitted location, in completion order.
+        """
+        from .job_journal import FAILED, SUBMITTED, SUCCEEDED
+
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1.")
+        rate_limiter = TokenBucket(rps) if rps else None
+        statuses = journal.get_statuses(analyzer_id)
+        resumed = {job.location: job for job in journal.in_flight(analyzer_id)}
+        if resumed:
+            self._logger.info(f"Resuming {len(resumed)} operations of analyzer: {analyzer_id}")
+
+        def pending_locations():
+            yield from list(resumed)
+            for location in locations:
+                location = os.fspath(location)
+                if "://" not in location:
+                    location = os.path.abspath(location)
+                status = statuses.get(location)
+                if status in (SUBMITTED, SUCCEEDED) or (status == FAILED and not retry_failed):
+                    continue
+                # Also guards against the same location appearing twice in the input.
+                statuses[location] = SUBMITTED
+                yield location
+
+        def submit_one(location):
+            job = resumed.pop(location, None)
+            if job is not None:
+                # Rebuild the accepted response of an operation submitted by an earlier run.
+                response = Response()
+                response.status_code = 202
+                response.headers["Operation-Location"] = job.operation_location
+                response.operation_context = OperationContext(
+                    analyzer_id, self._guess_content_type(job.location), job.submitted_at
                 )
-            time.sleep(polling_interval_seconds)
+                return response
+            if rate_limiter:
+                rate_limiter.acquire()
+            response = self.begin_analyze(analyzer_id, location)
+            journal.record_submitted(analyzer_id, location, response.headers.get("operation-location"))
+            return response
+
+        for item in self._run_analyze_pipeline(
+            pending_locations(), submit_one, max_in_flight, False, timeout_seconds, polling_interval_seconds
+        ):
+            yield item
+            journal.record_completed(
+                analyzer_id, item.location, None if item.succeeded else repr(item.error)
+            )
+
+    def _get_content_cache_key(self, file_location):
+        """Returns a key identifying the content to analyze, or None if it cannot be identified.
+
+        Local files and in-memory content are identified by a streamed SHA-256 of their bytes,
+        and URLs by the URL and the ETag returned for a HEAD request. Non-seekable streams,
+        iterables and URLs without an ETag are not cacheable.
+        """
+        if isinstance(file_location, (str, os.PathLike)):
+            if Path(file_location).exists():
+                return f"sha256:{hash_content(file_location)}"
+            try:
+                # Sent outside the session: content URLs are on other hosts and
+                # must never receive the service credentials.
+                response = requests.head(str(file_location), allow_redirects=True, timeout=self._timeout)
+            except requests.exceptions.RequestException as e:
+                self._logger.info(f"Cannot resolve ETag of {file_location}: {e}")
+                return None
+            etag = response.headers.get("ETag") if response.ok else None
+            return f"url:{file_location}|etag:{etag}" if etag else None
+        if hasattr(file_location, "read"):
+            seekable = getattr(file_location, "seekable", None)
+            return f"sha256:{hash_content(file_location)}" if seekable and seekable() else None
+        try:
+            return f"sha256:{hash_content(file_location)}"
+        except TypeError:
+            return None
+
+    def _get_result_cache_key(self, analyzer_id, file_location):
+        content_key = self._get_content_cache_key(file_location)
+        if content_key is None:
+            return None
+        definition = self.get_cached_analyzer_detail_by_id(analyzer_id)
+        if definition is None:
+            return None
+        analyzer_hash = hash_analyzer_definition(definition)
+        return make_cache_key(content_key, analyzer_id, analyzer_hash, self._api_version)
+
+    def analyze(
+        self,
+        analyzer_id: str,
+        file_location,
+        timeout_seconds: int = 120,
+        content_length: int = None,
+        bypass_cache: bool = False,
+    ):
+        """
+        Analyzes a file, URL or in-memory content and waits for the result.
+
+        When the client has a result cache, the result is looked up by the content hash (or URL
+        and ETag), the analyzer id, the analyzer definition hash and the API version, and
+        completed results are stored for later runs.
+
+        Args:
+            analyzer_id (str): The ID of the analyzer to use.
+            file_location (str | bytes | memoryview | file-like | iterable): The content to analyze, see begin_analyze.
+            timeout_seconds (int, optional): The maximum number of seconds to wait for the operation to complete. Defaults to 120.
+            content_length (int, optional): The total size in bytes of an iterable of chunks. Defaults to None.
+            bypass_cache (bool, optional): Skip the cache lookup and refresh the cached result. Defaults to False.
+
+        Returns:
+            dict: The JSON response of the completed operation.
+        """
+        cache_key = None
+        if self._result_cache is not None:
+            cache_key = self._get_result_cache_key(analyzer_id, file_location)
+            if cache_key and not bypass_cache:
+                result = self._result_cache.get(cache_key)
+                if result is not None:
+                    self._logger.info(
+                        f"Using cached result for {self._describe_location(file_location)} with analyzer: {analyzer_id}"
+                    )
+                    return result
+
+        response = self.begin_analyze(analyzer_id, file_location, content_length)
+        result = self.poll_result(response, timeout_seconds=timeout_seconds)
+        if cache_key:
+            self._result_cache.put(cache_key, result)
+        return result
+
+    def analyze_in_chunks(
+        self,
+        analyzer_id: str,
+        file_path: str,
+        pages_per_chunk: int = 10,
+        window_seconds: float = 300,
+        overlap_seconds: float = 0,
+        max_in_flight: int = 4,
+        chunk_retries: int = 2,
+        timeout_seconds: int = 600,
+    ):
+        """
+        Analyzes a long local PDF or WAV file as concurrent chunks and merges the results.
+
+        PDFs are split into documents of `pages_per_chunk` pages (this requires the optional
+        pypdf package) and WAV recordings into windows of `window_seconds`, optionally
+        overlapping by `overlap_seconds`. Chunks are created lazily and analyzed with
+        `analyze_many`, so at most `max_in_flight` of them are held in memory. A failed chunk
+        is retried up to `chunk_retries` times without redoing the others. Page numbers,
+        spans, timestamps and element references in the merged result refer to the whole
+        file, see `merge_chunk_results`.
+
+        Args:
+            analyzer_id (str): The ID of the analyzer to use.
+            file_path (str): The path to a local .pdf or .wav file.
+            pages_per_chunk (int, optional): The number of pages per PDF chunk. Defaults to 10.
+            window_seconds (float, optional): The duration of each WAV chunk. Defaults to 300.
+            overlap_seconds (float, optional): The audio shared by consecutive WAV chunks. Defaults to 0.
+            max_in_flight (int, optional): The maximum number of chunks analyzed concurrently. Defaults to 4.
+            chunk_retries (int, optional): The number of times a failed chunk is retried. Defaults to 2.
+            timeout_seconds (int, optional): The maximum number of seconds to wait for each chunk. Defaults to 600.
+
+        Returns:
+            dict: The merged result, in the same shape as `poll_result` returns.
+
+        Raises:
+            ValueError: If the file is not a PDF or WAV file.
+            RuntimeError: If a chunk still fails after its retries.
+        """
+        from .chunking import merge_chunk_results, split_file
+
+        chunks = {}
+
+        def chunk_data():
+            for chunk in split_file(file_path, pages_per_chunk, window_seconds, overlap_seconds):
+                # The bytes are owned by analyze_many from here on; only the offsets are kept.
+                data, chunk.data = chunk.data, None
+                chunks[chunk.index] = chunk
+                yield data
+
+        results = {}
+        pending, chunk_indexes = chunk_data(), None
+        for attempt in range(chunk_retries + 1):
+            failed = []
+            for item in self.analyze_many(
+                analyzer_id, pending, max_in_flight=max_in_flight, timeout_seconds=timeout_seconds
+            ):
+                index = item.index if chunk_indexes is None else chunk_indexes[item.index]
+                if item.succeeded:
+                    results[index] = item.result
+                else:
+                    failed.append((index, item))
+            if not failed:
+                break
+            self._logger.warning(
+                f"{len(failed)} of {len(chunks)} chunks of {file_path} failed (attempt {attempt + 1})."
+            )
+            chunk_indexes = [index for index, _ in failed]
+            pending = [item.location for _, item in failed]
+        else:
+            raise RuntimeError(
+                f"Chunks {sorted(chunk_indexes)} of {file_path} failed after {chunk_retries} retries."
+            ) from failed[0][1].error
+
+        return merge_chunk_results((chunks[index], results[index]) for index in sorted(results))
@@ -0,0 +1,140 @@
+import base64
+import json
+import logging
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+
+_logger = logging.getLogger(__name__)
+
+
+def _get_jwt_expiry(token):
+    """Returns the `exp` claim of a JWT access token, or None if it cannot be read."""
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        return float(json.loads(base64.urlsafe_b64decode(payload))["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+def _get_origin(url):
+    parts = urlsplit(url)
+    return parts.scheme.lower(), (parts.hostname or "").lower(), parts.port
+
+
+class CachedTokenProvider:
+    """Caches the bearer token of a token provider and refreshes it ahead of expiry.
+
+    The wrapped provider is a callable returning either a token string (as
+    returned by azure.identity's `get_bearer_token_provider`) or an object with
+    `token` and `expires_on` attributes (an azure.core AccessToken). The expiry
+    of a string token is read from its JWT `exp` claim, falling back to
+    `default_lifetime_seconds` when the token is not a JWT.
+
+    Reading the cached token takes no lock. Once the token is within
+    `refresh_margin_seconds` of expiry, the first reader starts a refresh on a
+    background thread and every reader keeps using the current token until the
+    new one arrives; callers only wait on the provider when there is no valid
+    token at all. One instance can be shared by several clients, threads and
+    event loops.
+    """
+
+    def __init__(
+        self,
+        token_provider: callable,
+        refresh_margin_seconds: float = 300,
+        default_lifetime_seconds: float = 600,
+        retry_interval_seconds: float = 10,
+    ):
+        if not callable(token_provider):
+            raise ValueError("The token provider must be callable.")
+        self._token_provider = token_provider
+        self._refresh_margin_seconds = refresh_margin_seconds
+        self._default_lifetime_seconds = default_lifetime_seconds
+        self._retry_interval_seconds = retry_interval_seconds
+        # (token, expires_at, refresh_at) replaced as a whole, so readers never see a torn update.
+        self._state = (None, 0.0, 0.0)
+        self._lock = threading.Lock()
+        self._refreshing = False
+
+    def __call__(self):
+        return self.get_token()
+
+    def get_token(self):
+        """Returns a valid token, blocking on the provider only if there is none."""
+        token = self.peek()
+        if token is not None:
+            return token
+        with self._lock:
+            # Another thread may have refreshed the token while this one waited.
+            token, expires_at, _ = self._state
+            if token is not None and time.time() < expires_at:
+                return token
+            return self._refresh()
+
+    def peek(self):
+        """Returns the cached token without blocking, or None if there is no valid token.
+
+        A background refresh is started when the token is close to expiry.
+        """
+        token, expires_at, refresh_at = self._state
+        now = time.time()
+        if token is None or now >= expires_at:
+            return None
+        if now >= refresh_at and not self._refreshing:
+            self._start_background_refresh()
+        return token
+
+    def invalidate(self):
+        """Drops the cached token, e.g. after the service rejected it."""
+        self._state = (None, 0.0, 0.0)
+
+    def _refresh(self):
+        value = self._token_provider()
+        if hasattr(value, "token") and hasattr(value, "expires_on"):
+            token, expires_at = value.token, float(value.expires_on)
+        else:
+            token = value
+            expires_at = _get_jwt_expiry(token) or time.time() + self._default_lifetime_seconds
+        # Short-lived tokens are refreshed halfway through their lifetime instead.
+        margin = min(self._refresh_margin_seconds, (expires_at - time.time()) / 2)
+        self._state = (token, expires_at, expires_at - margin)
+        return token
+
+    def _start_background_refresh(self):
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+        threading.Thread(target=self._background_refresh, name="token-refresh", daemon=True).start()
+
+    def _background_refresh(self):
+        try:
+            with self._lock:
+                self._refresh()
+        except Exception:
+            _logger.warning("Token refresh failed; the current token is used until it expires.", exc_info=True)
+            token, expires_at, _ = self._state
+            self._state = (token, expires_at, time.time() + self._retry_interval_seconds)
+        finally:
+            self._refreshing = False
+
+
+class BearerTokenAuth(requests.auth.AuthBase):
+    """Sets the Authorization header of requests to one service from a CachedTokenProvider.
+
+    The token is only sent to the scheme and host of `endpoint`, so requests the
+    same session makes to other hosts (e.g. content URLs) never carry it.
+    """
+
+    def __init__(self, token_provider: CachedTokenProvider, endpoint: str):
+        self._token_provider = token_provider
+        self._origin = _get_origin(endpoint)
+
+    def __call__(self, request):
+        if _get_origin(request.url) == self._origin:
+            request.headers["Authorization"] = f"Bearer {self._token_provider.get_token()}"
+        return request
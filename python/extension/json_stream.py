@@ -0,0 +1,139 @@
+import json
+import re
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_STRUCTURAL = re.compile(r'[\[\]{}"]')
+_STRING_TAIL = re.compile(r'(?:[^"\\]|\\.)*"', re.DOTALL)
+
+
+class JsonStreamReader:
+    """Incremental reader over a JSON document in a text file object.
+
+    Only the part of the document being looked at is kept in memory: objects
+    can be walked key by key, arrays element by element, and values that are
+    not needed are skipped without being decoded.
+    """
+
+    def __init__(self, fp, chunk_size: int = 1 << 16):
+        self._fp = fp
+        self._chunk_size = chunk_size
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self):
+        """Reads the next chunk, dropping what has already been consumed. Returns False at EOF."""
+        if self._eof:
+            return False
+        chunk = self._fp.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def _peek(self):
+        """Returns the next non-whitespace character without consuming it, or '' at EOF."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ""
+
+    def _expect(self, char):
+        found = self._peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} but found {found or 'end of input'!r}.")
+        self._pos += 1
+
+    def read_value(self):
+        """Decodes and returns the next value."""
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number that ends with the buffer may continue in the next chunk.
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def skip_value(self):
+        """Consumes the next value without building it."""
+        char = self._peek()
+        if char == '"':
+            self._pos += 1
+            self._skip_string_tail()
+        elif char in "[{":
+            depth = 0
+            while True:
+                match = _STRUCTURAL.search(self._buffer, self._pos)
+                if match is None:
+                    self._pos = len(self._buffer)
+                    if not self._fill():
+                        raise ValueError("Unexpected end of input.")
+                    continue
+                self._pos = match.end()
+                token = match.group()
+                if token == '"':
+                    self._skip_string_tail()
+                elif token in "[{":
+                    depth += 1
+                else:
+                    depth -= 1
+                    if depth == 0:
+                        return
+        else:
+            self.read_value()
+
+    def _skip_string_tail(self):
+        while True:
+            match = _STRING_TAIL.match(self._buffer, self._pos)
+            if match is not None:
+                self._pos = match.end()
+                return
+            if not self._fill():
+                raise ValueError("Unterminated string.")
+
+    def iter_object_keys(self):
+        """Walks the members of the next object and yields each key.
+
+        After each key, the caller must consume its value with read_value,
+        skip_value, iter_array or iter_object_keys before resuming the iteration.
+        """
+        self._expect("{")
+        if self._peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self.read_value()
+            self._expect(":")
+            yield key
+            char = self._peek()
+            self._pos += 1
+            if char == "}":
+                return
+            if char != ",":
+                raise ValueError(f"Expected ',' or '}}' but found {char or 'end of input'!r}.")
+
+    def iter_array(self):
+        """Decodes the next array one element at a time."""
+        self._expect("[")
+        if self._peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self.read_value()
+            char = self._peek()
+            self._pos += 1
+            if char == "]":
+                return
+            if char != ",":
+                raise ValueError(f"Expected ',' or ']' but found {char or 'end of input'!r}.")
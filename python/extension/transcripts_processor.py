@@ -1,14 +1,93 @@
+import io
 import os
 import json
-import warnings
+import time
 from abc import ABC, abstractmethod
+from itertools import islice
+from operator import add
+from pathlib import Path
 
-warnings.filterwarnings("ignore")
+from .json_stream import JsonStreamReader
+
+DEFAULT_OUTPUT_DIR = os.path.join("..", "data", "transcripts_processor_output")
+
+_TIMESTAMP_FORMAT = "%02d:%02d:%02d.%03d"
+_CUE_FORMAT = "\n%s --> %s\n<v Speaker %s>%s\n"
+_CUE_BLOCK_SIZE = 4096
+
+
+def _get_numpy():
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _to_int64(numpy, values):
+    """Returns `values` as an int64 array, rounding floats like `round(x)`."""
+    values = numpy.asarray(values)
+    if values.dtype.kind == "f":
+        values = numpy.rint(values)
+    return values.astype(numpy.int64)
+
+
+def format_timestamps(milliseconds, use_numpy=True):
+    """Formats a sequence of millisecond offsets as WebVTT timestamps in one vectorized pass.
+
+    The hour/minute/second split runs on a NumPy array when NumPy is installed
+    (and `use_numpy` is true); otherwise each value is formatted directly.
+    Fractional offsets are rounded to the nearest millisecond on both paths.
+    """
+    numpy = _get_numpy() if use_numpy else None
+    if numpy is None:
+        return [
+            _TIMESTAMP_FORMAT % (value // 3600000, value // 60000 % 60, value // 1000 % 60, value % 1000)
+            for value in map(round, milliseconds)
+        ]
+    seconds, ms = numpy.divmod(_to_int64(numpy, milliseconds), 1000)
+    minutes, seconds = numpy.divmod(seconds, 60)
+    hours, minutes = numpy.divmod(minutes, 60)
+    return list(map(_TIMESTAMP_FORMAT.__mod__, zip(hours.tolist(), minutes.tolist(), seconds.tolist(), ms.tolist())))
+
+
+def format_time_ranges(offsets, durations, units_per_ms=1, use_numpy=True):
+    """Formats the start (offset) and end (offset + duration) timestamps of many cues at once.
+
+    Args:
+        offsets (sequence): The cue start offsets.
+        durations (sequence): The cue durations, in the same unit as `offsets`.
+        units_per_ms (int, optional): The number of offset units per millisecond, e.g. 10000 for ticks.
+
+    Returns:
+        tuple: The list of start timestamps and the list of end timestamps.
+    """
+    numpy = _get_numpy() if use_numpy else None
+    if numpy is None:
+        starts = list(map(round, offsets))
+        ends = list(map(add, starts, map(round, durations)))
+        if units_per_ms != 1:
+            starts = [start // units_per_ms for start in starts]
+            ends = [end // units_per_ms for end in ends]
+        return format_timestamps(starts, False), format_timestamps(ends, False)
+    starts = _to_int64(numpy, offsets)
+    ends = starts + _to_int64(numpy, durations)
+    count = len(starts)
+    timestamps = format_timestamps(numpy.concatenate((starts, ends)) // units_per_ms, use_numpy)
+    return timestamps[:count], timestamps[count:]
 
 class TranscriptProcessorBase(ABC):
+    # The top-level key of the phrase array; None for formats that cannot be streamed.
+    phrases_key = None
+
     def __init__(self, name):
         self.name = name
 
+    @property
+    def supports_streaming(self):
+        """Whether transcripts of this type can be converted with process_transcript_stream."""
+        return self.phrases_key is not None
+
     @abstractmethod
     def process_transcript(self,  transcript_result):
         pass
@@ -18,74 +97,90 @@ class TranscriptProcessorBase(ABC):
         pass
     
     # @abstractmethod
-    def format_timestamp(self, time):
+    def format_cues(self, phrases):
         pass
 
+    def format_cue(self, phrase):
+        return self.format_cues([phrase])[0]
+
+    def write_transcript(self, phrases, output):
+        """Writes phrases as WebVTT cues to a text stream, a block of cues at a time.
+
+        `phrases` may be any iterable, e.g. JsonStreamReader.iter_array; only one
+        block of phrases is held in memory. Returns the number of cues written.
+        """
+        output.write("WEBVTT\n")
+        phrases = iter(phrases)
+        count = 0
+        while block := list(islice(phrases, _CUE_BLOCK_SIZE)):
+            output.write("".join(self.format_cues(block)))
+            count += len(block)
+        return count
+
+    def process_transcript_stream(self, input_stream, output):
+        """Converts a transcript JSON text stream to WebVTT without loading it whole.
+
+        Top-level members other than the phrase array are skipped unparsed.
+        Returns the number of cues written.
+        """
+        if not self.supports_streaming:
+            raise ValueError(f"{self.name} transcripts cannot be converted as a stream.")
+        reader = JsonStreamReader(input_stream)
+        for key in reader.iter_object_keys():
+            if key == self.phrases_key:
+                return self.write_transcript(reader.iter_array(), output)
+            reader.skip_value()
+        return self.write_transcript([], output)
+
 class BatchTranscriptionProcessor(TranscriptProcessorBase):
+    phrases_key = "recognizedPhrases"
+
     def __init__(self):
         super().__init__(name="BatchTranscriptionProcessor")
 
     def get_phrases(self, fast_transcription_result):
-        return fast_transcription_result.get("recognizedPhrases", [])
+        return fast_transcription_result.get(self.phrases_key, [])
         
 
-    def format_timestamp(self, time):
-        ticks_per_ms = 10000
-        milliseconds = int(time / ticks_per_ms)
-        
-        seconds, ms = divmod(milliseconds, 1000)
-        minutes, seconds = divmod(seconds, 60)
-        hours, minutes = divmod(minutes, 60)
-        return f"{hours:02}:{minutes:02}:{seconds:02}.{ms:03}"
+    def format_cues(self, phrases):
+        start_times, end_times = format_time_ranges(
+            [phrase["offsetInTicks"] for phrase in phrases],
+            [phrase["durationInTicks"] for phrase in phrases],
+            units_per_ms=10000,
+        )
+        return [
+            _CUE_FORMAT % (start_time, end_time, phrase.get("speaker", "Unknown"), phrase['nBest'][0]['display'])
+            for start_time, end_time, phrase in zip(start_times, end_times, phrases)
+        ]
 
-    
     def process_transcript(self, fast_transcription_result):
-        webvtt_string = ["WEBVTT\n"]
-
-        phrases = self.get_phrases(fast_transcription_result)
-
-        for phrase in phrases:
-
-            start_time = self.format_timestamp(phrase["offsetInTicks"])
-            end_time = self.format_timestamp(phrase["durationInTicks"])
-
-            speaker = phrase.get("speaker", "Unknown")
-            text = phrase['nBest'][0]['display']
-            webvtt_string.append(f"{start_time} --> {end_time}")
-            webvtt_string.append(f"<v Speaker {speaker}>{text}")
-            webvtt_string.append("")
-
-        return "\n".join(webvtt_string)
+        output = io.StringIO()
+        self.write_transcript(self.get_phrases(fast_transcription_result), output)
+        return output.getvalue()
     
 class FastTranscriptionProcessor(TranscriptProcessorBase):
+    phrases_key = "phrases"
+
     def __init__(self):
         super().__init__(name="FastTranscriptionProcessor")
 
     def get_phrases(self, fast_transcription_result):
-        return fast_transcription_result.get("phrases", [])
+        return fast_transcription_result.get(self.phrases_key, [])
         
-    # convert milliseconds to VTT timestamp format
-    def format_timestamp(self, milliseconds):
-        seconds, ms = divmod(milliseconds, 1000)
-        minutes, seconds = divmod(seconds, 60)
-        hours, minutes = divmod(minutes, 60)
-        return f"{hours:02}:{minutes:02}:{seconds:02}.{ms:03}"
-    
-    def process_transcript(self, fast_transcription_result):
-        webvtt_string = ["WEBVTT\n"]
-
-        phrases = self.get_phrases(fast_transcription_result)
+    def format_cues(self, phrases):
+        start_times, end_times = format_time_ranges(
+            [phrase["offsetMilliseconds"] for phrase in phrases],
+            [phrase["durationMilliseconds"] for phrase in phrases],
+        )
+        return [
+            _CUE_FORMAT % (start_time, end_time, phrase.get("speaker", "Unknown"), phrase.get("text"))
+            for start_time, end_time, phrase in zip(start_times, end_times, phrases)
+        ]
 
-        for phrase in phrases:
-            start_time = self.format_timestamp(phrase["offsetMilliseconds"])
-            end_time = self.format_timestamp(phrase["offsetMilliseconds"] + phrase["durationMilliseconds"])
-            speaker = phrase.get("speaker", "Unknown")
-            text = phrase.get("text")
-            webvtt_string.append(f"{start_time} --> {end_time}")
-            webvtt_string.append(f"<v Speaker {speaker}>{text}")
-            webvtt_string.append("")
-
-        return "\n".join(webvtt_string)
+    def process_transcript(self, fast_transcription_result):
+        output = io.StringIO()
+        self.write_transcript(self.get_phrases(fast_transcription_result), output)
+        return output.getvalue()
     
 class CUTranscriptionProcessor(TranscriptProcessorBase):
     def __init__(self):
@@ -133,40 +228,188 @@ class TranscriptsProcessor:
         print("CU to WebVTT Conversion completed.")
         return result
 
-    def convert_file(self, file_path):
+    def detect_format(self, transcripts):
+        """Returns the transcript type of a loaded transcript by peeking at its top-level keys.
+
+        Only the top-level keys (and, for Content Understanding results, the markdown
+        of the first content, which is the one CUTranscriptionProcessor converts) are
+        inspected; the document is never re-serialized. Returns None for anything else,
+        including JSON whose top level is not an object.
+        """
+        if not isinstance(transcripts, dict):
+            return None
+        if "combinedRecognizedPhrases" in transcripts:
+            return "batch_transcription"
+        if "combinedPhrases" in transcripts:
+            return "fast_transcription"
+        result = transcripts.get("result")
+        contents = result.get("contents") if isinstance(result, dict) else None
+        if isinstance(contents, list) and contents and isinstance(contents[0], dict):
+            if "WEBVTT" in (contents[0].get("markdown") or ""):
+                return "cu_markdown"
+        return None
+
+    def convert_file(self, file_path, output_dir=None):
         converted_text = ''
         converted_text_filepath = ''
         transcripts = self.load_transcription_fromLocal(file_path)
-        if "combinedRecognizedPhrases" in transcripts:
+        transcripts_type = self.detect_format(transcripts)
+        if transcripts_type == "batch_transcription":
             print("Processing a batch transcription file.")
             converted_text = self.convertBTtoWebVTT(transcripts)
-            converted_text_filepath = self.save_converted_file(converted_text, file_path)
-        elif "combinedPhrases" in transcripts:
+            converted_text_filepath = self.save_converted_file(converted_text, file_path, output_dir)
+        elif transcripts_type == "fast_transcription":
             print("processing a fast transcription file.")
             converted_text = self.convertFTtoWebVTT(transcripts)
-            converted_text_filepath = self.save_converted_file(converted_text, file_path)
-        elif "WEBVTT" in str(transcripts):
+            converted_text_filepath = self.save_converted_file(converted_text, file_path, output_dir)
+        elif transcripts_type == "cu_markdown":
             print("processing a CU transcription file.")
             converted_text = self.extractCUWebVTT(transcripts)
-            converted_text_filepath = self.save_converted_file(converted_text, file_path)
+            converted_text_filepath = self.save_converted_file(converted_text, file_path, output_dir)
         else:
             print("No supported conversation transcription found. Skipping conversion.")
             # raise ValueError("An error occurred during the conversion process")
         
         return converted_text, converted_text_filepath
-    
-    def save_converted_file(self, converted_text, file_path):
-        temp_file = os.path.join("..", "data", "transcripts_processor_output", f"{os.path.basename(file_path)}.convertedTowebVTT.txt")
-        output_dir = os.path.dirname(temp_file)
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir, exist_ok=True)
- 
+
+    def get_output_path(self, file_path, output_dir=None):
+        output_dir = DEFAULT_OUTPUT_DIR if output_dir is None else output_dir
+        return os.path.join(output_dir, f"{os.path.basename(file_path)}.convertedTowebVTT.txt")
+
+    def write_converted_file(self, converted_text, file_path, output_dir=None):
+        """Writes the converted text next to the other outputs and returns its path; raises on failure."""
+        temp_file = self.get_output_path(file_path, output_dir)
+        os.makedirs(os.path.dirname(temp_file) or ".", exist_ok=True)
+        with open(temp_file, 'w', encoding='utf-8') as file:
+            file.write(str(converted_text))
+        return temp_file
+
+    def save_converted_file(self, converted_text, file_path, output_dir=None):
         try:
-            with open(temp_file, 'w', encoding='utf-8') as file:
-                file.write(str(converted_text))
+            temp_file = self.write_converted_file(converted_text, file_path, output_dir)
             print(f"Conversion completed. The result has been saved to '{temp_file}'")
             return temp_file
         except Exception as e:
             print(f"An error occurred during the conversion process: {e}")
             return None
-        
+
+    def stream_convert_file(self, file_path, output=None, output_dir=None):
+        """Converts a batch or fast transcription file to WebVTT in constant memory.
+
+        The phrase array is parsed one element at a time and each cue is written
+        straight to `output` as soon as it is formatted. The transcript type is
+        recognized from the phrase array key ("recognizedPhrases" or "phrases").
+
+        Args:
+            file_path (str): The transcript JSON file.
+            output (str | text stream, optional): A path or a writable text stream, e.g. an
+                open file or `socket.makefile("w")`. Defaults to the output directory.
+            output_dir (str, optional): The output directory used when `output` is None.
+
+        Returns:
+            tuple: The transcript type and the output path (None for streams).
+        """
+        processors = {
+            processor.phrases_key: (transcripts_type, processor)
+            for transcripts_type, processor in self.transcripts.items()
+            if processor.supports_streaming
+        }
+        output_path = None
+        if output is None:
+            output = output_path = self.get_output_path(file_path, output_dir)
+            os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+        elif isinstance(output, (str, os.PathLike)):
+            output_path = output
+
+        with open(file_path, "r", encoding="utf-8") as input_stream:
+            reader = JsonStreamReader(input_stream)
+            for key in reader.iter_object_keys():
+                if key not in processors:
+                    reader.skip_value()
+                    continue
+                transcripts_type, processor = processors[key]
+                if output_path is not None:
+                    with open(output_path, "w", encoding="utf-8") as output_stream:
+                        processor.write_transcript(reader.iter_array(), output_stream)
+                else:
+                    processor.write_transcript(reader.iter_array(), output)
+                return transcripts_type, output_path
+        raise ValueError(f"No streamable transcription found in '{file_path}'.")
+
+    def convert_file_quietly(self, file_path, output_dir=None):
+        """Converts one file without printing progress.
+
+        Returns:
+            ConversionResult: The outcome, including the error if the conversion failed.
+        """
+        start_time = time.perf_counter()
+        transcripts_type = None
+        try:
+            with open(file_path, "r", encoding="utf-8") as f:
+                transcripts = json.load(f)
+            transcripts_type = self.detect_format(transcripts)
+            if transcripts_type is None:
+                raise ValueError("No supported conversation transcription found.")
+            converted_text = self.get_transcriptionProcessor(transcripts_type).process_transcript(transcripts)
+            output_path = self.write_converted_file(converted_text, file_path, output_dir)
+            return ConversionResult(file_path, transcripts_type, output_path, time.perf_counter() - start_time)
+        except Exception as e:
+            return ConversionResult(file_path, transcripts_type, None, time.perf_counter() - start_time, error=repr(e))
+
+    def convert_many(self, file_paths, output_dir=None, max_workers=None, chunksize=16):
+        """Converts many transcript files in parallel across a process pool.
+
+        Args:
+            file_paths (iterable): The transcript JSON files to convert.
+            output_dir (str, optional): The output directory. Defaults to DEFAULT_OUTPUT_DIR.
+            max_workers (int, optional): The number of worker processes. Defaults to the CPU count;
+                1 converts in the current process.
+            chunksize (int, optional): The number of files handed to a worker at a time. Defaults to 16.
+
+        Returns:
+            list: A ConversionResult per file, in input order, with timings and errors.
+        """
+        file_paths = [str(file_path) for file_path in file_paths]
+        if max_workers == 1 or len(file_paths) <= 1:
+            results = [self.convert_file_quietly(file_path, output_dir) for file_path in file_paths]
+        else:
+            # Imported here: multiprocessing is slow to import and only needed for parallel runs.
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(
+                    _convert_file_worker,
+                    file_paths,
+                    [output_dir] * len(file_paths),
+                    chunksize=chunksize,
+                ))
+        failed = sum(1 for result in results if not result.succeeded)
+        print(f"Converted {len(results) - failed} of {len(results)} files, {failed} failed.")
+        return results
+
+    def convert_directory(self, directory, output_dir=None, pattern="*.json", max_workers=None):
+        """Converts every transcript in a directory matching `pattern`; see convert_many."""
+        return self.convert_many(sorted(Path(directory).glob(pattern)), output_dir, max_workers)
+
+
+class ConversionResult:
+    __slots__ = ("file_path", "transcripts_type", "output_path", "seconds", "error")
+
+    def __init__(self, file_path, transcripts_type, output_path, seconds, error=None):
+        self.file_path = file_path
+        self.transcripts_type = transcripts_type
+        self.output_path = output_path
+        self.seconds = seconds
+        self.error = error
+
+    @property
+    def succeeded(self):
+        return self.error is None
+
+    def __repr__(self):
+        status = self.output_path if self.succeeded else f"failed: {self.error}"
+        return f"ConversionResult({self.file_path!r}, {self.transcripts_type}, {self.seconds * 1000:.1f} ms, {status})"
+
+
+def _convert_file_worker(file_path, output_dir):
+    return TranscriptsProcessor().convert_file_quietly(file_path, output_dir)
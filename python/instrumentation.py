@@ -0,0 +1,228 @@
+import datetime
+import time
+
+# Status payload timestamps from which the service-side queueing time is read.
+_CREATED_AT_KEY = "createdAt"
+_STARTED_AT_KEY = "startedAt"
+
+
+def _parse_timestamp(value):
+    """Returns the time.time() value of an ISO 8601 timestamp, or None if it cannot be read."""
+    if not isinstance(value, str):
+        return None
+    try:
+        timestamp = datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=datetime.timezone.utc)
+    return timestamp.timestamp()
+
+
+class OperationMetrics:
+    """Timings and counters of one analyze operation, from upload to final status.
+
+    Attributes:
+        analyzer_id (str): The ID of the analyzer used.
+        content_type (str): The guessed MIME type of the analyzed content.
+        operation_id (str): The service operation ID, once known.
+        started_at (float): The time.time() at which the upload started.
+        upload_bytes (int): The size of the request body, or None if it was streamed without a length.
+        upload_seconds (float): The time taken to send the analyze request and receive its response.
+        queue_seconds (float): The time the operation waited in the service queue, from the
+            `createdAt` and `startedAt` timestamps of the status payload; None when the service
+            does not report them. Use `last_queued_at` and `first_started_at` instead then.
+        last_queued_at (float): The time.time() of the last poll that saw the operation "NotStarted",
+            or None if no poll did.
+        first_started_at (float): The time.time() of the first poll that saw the operation started.
+            The operation left the queue between `last_queued_at` (or the submission) and this time,
+            so the width of that interval is the resolution of the polling, not queueing.
+        polls (int): The number of status requests made.
+        retries (int): The number of HTTP requests retried, across upload and polling.
+        throttles (int): The number of 429 responses received, across upload and polling.
+        total_seconds (float): The time from the start of the upload to the final status.
+        status (str): "succeeded", "failed" or "timeout" once the operation has ended.
+        error (Exception): The error the operation ended with, if any.
+    """
+
+    __slots__ = (
+        "analyzer_id",
+        "content_type",
+        "operation_id",
+        "started_at",
+        "upload_bytes",
+        "upload_seconds",
+        "queue_seconds",
+        "last_queued_at",
+        "first_started_at",
+        "polls",
+        "retries",
+        "throttles",
+        "total_seconds",
+        "status",
+        "error",
+    )
+
+    def __init__(self, analyzer_id, content_type, started_at=None):
+        self.analyzer_id = analyzer_id
+        self.content_type = content_type
+        self.operation_id = None
+        self.started_at = time.time() if started_at is None else started_at
+        self.upload_bytes = None
+        self.upload_seconds = None
+        self.queue_seconds = None
+        self.last_queued_at = None
+        self.first_started_at = None
+        self.polls = 0
+        self.retries = 0
+        self.throttles = 0
+        self.total_seconds = None
+        self.status = None
+        self.error = None
+
+    def record_retries(self, history):
+        """Adds the retried attempts of one request, given their HTTP status codes."""
+        for status in history:
+            self.retries += 1
+            if status == 429:
+                self.throttles += 1
+
+    def record_status(self, status, payload, polled_at):
+        """Records the queueing of the operation from one status response.
+
+        Args:
+            status (str): The lowercase operation status.
+            payload (dict): The JSON of the status response.
+            polled_at (float): The time.time() at which the status was received.
+        """
+        if status == "notstarted":
+            self.last_queued_at = polled_at
+            return
+        if self.first_started_at is None:
+            self.first_started_at = polled_at
+        if self.queue_seconds is None and isinstance(payload, dict):
+            created_at = _parse_timestamp(payload.get(_CREATED_AT_KEY))
+            started_at = _parse_timestamp(payload.get(_STARTED_AT_KEY))
+            if created_at is not None and started_at is not None:
+                self.queue_seconds = max(0.0, started_at - created_at)
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"OperationMetrics({fields})"
+
+
+class Instrumentation:
+    """Receives telemetry from the Content Understanding clients.
+
+    The hooks do nothing by default; subclass and override the ones you need.
+    When a client has no instrumentation, no metrics are collected at all.
+    Hooks run on the thread (or event loop) that observed the event, so they
+    should return quickly; exceptions they raise are logged and ignored.
+    """
+
+    def on_operation_end(self, metrics: OperationMetrics):
+        """Called once when an analyze operation succeeds, fails or times out."""
+
+
+class CallbackInstrumentation(Instrumentation):
+    """Forwards the metrics of every finished operation to a callable."""
+
+    def __init__(self, on_operation_end):
+        self._on_operation_end = on_operation_end
+
+    def on_operation_end(self, metrics):
+        self._on_operation_end(metrics)
+
+
+class OpenTelemetryInstrumentation(Instrumentation):
+    """Reports each analyze operation as an OpenTelemetry span and histogram samples.
+
+    Requires the optional `opentelemetry-api` package; without an SDK configured
+    the OpenTelemetry calls are no-ops. Spans are named "content_understanding.analyze"
+    and carry every OperationMetrics field as a `content_understanding.*` attribute.
+    Metrics are tagged with the analyzer ID, content type and status only, to keep
+    their cardinality low.
+    """
+
+    def __init__(self, tracer=None, meter=None):
+        try:
+            from opentelemetry import metrics, trace
+        except ImportError as e:
+            raise ImportError(
+                "OpenTelemetryInstrumentation requires the opentelemetry-api package."
+            ) from e
+        self._status_error = trace.Status(trace.StatusCode.ERROR)
+        self._tracer = tracer or trace.get_tracer(__name__)
+        meter = meter or metrics.get_meter(__name__)
+        self._operation_duration = meter.create_histogram(
+            "content_understanding.operation.duration", unit="s",
+            description="Time from the start of the upload to the final status.",
+        )
+        self._upload_duration = meter.create_histogram(
+            "content_understanding.upload.duration", unit="s",
+            description="Time taken by the analyze request.",
+        )
+        self._upload_size = meter.create_histogram(
+            "content_understanding.upload.size", unit="By",
+            description="Size of the analyze request body.",
+        )
+        self._queue_duration = meter.create_histogram(
+            "content_understanding.queue.duration", unit="s",
+            description="Time the operation waited in the service queue, as reported by the service.",
+        )
+        self._polls = meter.create_histogram(
+            "content_understanding.polls", unit="{request}",
+            description="Status requests per operation.",
+        )
+        self._retries = meter.create_counter(
+            "content_understanding.retries", unit="{request}",
+            description="Retried HTTP requests.",
+        )
+        self._throttles = meter.create_counter(
+            "content_understanding.throttles", unit="{request}",
+            description="HTTP 429 responses.",
+        )
+
+    def on_operation_end(self, metrics):
+        attributes = {
+            "content_understanding.analyzer_id": metrics.analyzer_id,
+            "content_understanding.content_type": metrics.content_type,
+            "content_understanding.status": metrics.status,
+        }
+        span_attributes = dict(attributes)
+        for name in ("operation_id", "upload_bytes", "upload_seconds", "queue_seconds",
+                     "polls", "retries", "throttles", "total_seconds"):
+            value = getattr(metrics, name)
+            if value is not None:
+                span_attributes[f"content_understanding.{name}"] = value
+
+        start_ns = int(metrics.started_at * 1e9)
+        span = self._tracer.start_span(
+            "content_understanding.analyze", start_time=start_ns, attributes=span_attributes
+        )
+        if metrics.upload_seconds is not None:
+            span.add_event("uploaded", timestamp=start_ns + int(metrics.upload_seconds * 1e9))
+        if metrics.last_queued_at is not None:
+            span.add_event("last_seen_queued", timestamp=int(metrics.last_queued_at * 1e9))
+        if metrics.first_started_at is not None:
+            span.add_event("first_seen_started", timestamp=int(metrics.first_started_at * 1e9))
+        if metrics.error is not None:
+            span.record_exception(metrics.error)
+            span.set_status(self._status_error)
+        span.end(end_time=start_ns + int((metrics.total_seconds or 0) * 1e9))
+
+        self._operation_duration.record(metrics.total_seconds, attributes)
+        if metrics.upload_seconds is not None:
+            self._upload_duration.record(metrics.upload_seconds, attributes)
+        if metrics.upload_bytes is not None:
+            self._upload_size.record(metrics.upload_bytes, attributes)
+        if metrics.queue_seconds is not None:
+            self._queue_duration.record(metrics.queue_seconds, attributes)
+        self._polls.record(metrics.polls, attributes)
+        if metrics.retries:
+            self._retries.add(metrics.retries, attributes)
+        if metrics.throttles:
+            self._throttles.add(metrics.throttles, attributes)
@@ -0,0 +1,184 @@
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+SUBMITTED = "submitted"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+
+class JobRecord:
+    """One journaled analyze job.
+
+    Attributes:
+        analyzer_id (str): The ID of the analyzer used.
+        location (str): The file path or URL analyzed.
+        status (str): "submitted", "succeeded" or "failed".
+        operation_location (str): The URL to poll for the result, once submitted.
+        attempts (int): The number of times the location was submitted.
+        error (str): The last error, for failed jobs.
+        submitted_at (float): The time.time() of the last submission.
+        completed_at (float): The time.time() at which the job succeeded or failed.
+    """
+
+    __slots__ = (
+        "analyzer_id",
+        "location",
+        "status",
+        "operation_location",
+        "attempts",
+        "error",
+        "submitted_at",
+        "completed_at",
+    )
+
+    def __init__(self, analyzer_id, location, status, operation_location, attempts, error, submitted_at, completed_at):
+        self.analyzer_id = analyzer_id
+        self.location = location
+        self.status = status
+        self.operation_location = operation_location
+        self.attempts = attempts
+        self.error = error
+        self.submitted_at = submitted_at
+        self.completed_at = completed_at
+
+    def __repr__(self):
+        return f"JobRecord(analyzer_id={self.analyzer_id!r}, location={self.location!r}, status={self.status!r})"
+
+
+class JobProgress:
+    """Counts of journaled jobs by status."""
+
+    __slots__ = ("submitted", "succeeded", "failed")
+
+    def __init__(self, submitted=0, succeeded=0, failed=0):
+        self.submitted = submitted
+        self.succeeded = succeeded
+        self.failed = failed
+
+    @property
+    def total(self):
+        return self.submitted + self.succeeded + self.failed
+
+    @property
+    def completed(self):
+        return self.succeeded + self.failed
+
+    def __repr__(self):
+        return (
+            f"JobProgress(submitted={self.submitted}, succeeded={self.succeeded}, "
+            f"failed={self.failed}, total={self.total})"
+        )
+
+
+class JobJournal:
+    """Durable record of analyze submissions, for backfills that must survive restarts.
+
+    Every submission is written with its operation URL before it is polled, and
+    its final status once it completes, in a SQLite database. A restarted run
+    can then poll the operations still in flight instead of submitting them
+    again, and skip the ones already done. The database may be read by another
+    process, e.g. to monitor `progress()`, while a run is writing it.
+    """
+
+    _COLUMNS = (
+        "analyzer_id, location, status, operation_location, attempts, error, submitted_at, completed_at"
+    )
+
+    def __init__(self, path: str):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            os.fspath(path), check_same_thread=False, isolation_level=None
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        # Each write is its own transaction; NORMAL is durable across process crashes in WAL mode.
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            " analyzer_id TEXT NOT NULL,"
+            " location TEXT NOT NULL,"
+            " status TEXT NOT NULL,"
+            " operation_location TEXT,"
+            " attempts INTEGER NOT NULL DEFAULT 0,"
+            " error TEXT,"
+            " submitted_at REAL,"
+            " completed_at REAL,"
+            " PRIMARY KEY (analyzer_id, location))"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS jobs_status ON jobs (analyzer_id, status)"
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def get(self, analyzer_id: str, location: str):
+        """Returns the JobRecord of a location, or None if it was never submitted."""
+        with self._lock:
+            row = self._connection.execute(
+                f"SELECT {self._COLUMNS} FROM jobs WHERE analyzer_id = ? AND location = ?",
+                (analyzer_id, location),
+            ).fetchone()
+        return JobRecord(*row) if row else None
+
+    def get_statuses(self, analyzer_id: str):
+        """Returns the status of every journaled location of an analyzer, by location."""
+        with self._lock:
+            return dict(self._connection.execute(
+                "SELECT location, status FROM jobs WHERE analyzer_id = ?", (analyzer_id,)
+            ))
+
+    def in_flight(self, analyzer_id: str):
+        """Returns the jobs submitted but not completed, oldest first."""
+        with self._lock:
+            rows = self._connection.execute(
+                f"SELECT {self._COLUMNS} FROM jobs WHERE analyzer_id = ? AND status = ?"
+                " ORDER BY submitted_at",
+                (analyzer_id, SUBMITTED),
+            ).fetchall()
+        return [JobRecord(*row) for row in rows]
+
+    def record_submitted(self, analyzer_id: str, location: str, operation_location: str):
+        """Marks a job as submitted, with the URL to poll for its result."""
+        with self._lock:
+            self._connection.execute(
+                "INSERT INTO jobs (analyzer_id, location, status, operation_location, attempts, submitted_at)"
+                " VALUES (?, ?, ?, ?, 1, ?)"
+                " ON CONFLICT (analyzer_id, location) DO UPDATE SET"
+                " status = excluded.status, operation_location = excluded.operation_location,"
+                " attempts = attempts + 1, error = NULL, submitted_at = excluded.submitted_at,"
+                " completed_at = NULL",
+                (analyzer_id, location, SUBMITTED, operation_location, time.time()),
+            )
+
+    def record_completed(self, analyzer_id: str, location: str, error: str = None):
+        """Marks a job as succeeded, or as failed when an error is given."""
+        with self._lock:
+            self._connection.execute(
+                "INSERT INTO jobs (analyzer_id, location, status, error, completed_at)"
+                " VALUES (?, ?, ?, ?, ?)"
+                " ON CONFLICT (analyzer_id, location) DO UPDATE SET"
+                " status = excluded.status, error = excluded.error, completed_at = excluded.completed_at",
+                (analyzer_id, location, FAILED if error else SUCCEEDED, error, time.time()),
+            )
+
+    def progress(self, analyzer_id: str = None):
+        """Returns the JobProgress of an analyzer, or of all analyzers."""
+        query = "SELECT status, COUNT(*) FROM jobs"
+        parameters = ()
+        if analyzer_id is not None:
+            query += " WHERE analyzer_id = ?"
+            parameters = (analyzer_id,)
+        with self._lock:
+            counts = dict(self._connection.execute(query + " GROUP BY status", parameters))
+        return JobProgress(**counts)
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
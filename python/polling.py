@@ -0,0 +1,226 @@
+import heapq
+import itertools
+import random
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+
+
+class PollingStrategy(ABC):
+    """Decides how long to wait before the next status request of an operation."""
+
+    @abstractmethod
+    def get_delay(
+        self,
+        attempt: int,
+        elapsed_seconds: float,
+        retry_after: float = None,
+        expected_seconds: float = None,
+    ) -> float:
+        """Returns the number of seconds to wait before the next status request.
+        Args:
+            attempt (int): The number of status requests already made for the operation.
+            elapsed_seconds (float): The seconds since the operation was submitted.
+            retry_after (float, optional): The Retry-After hint of the last status response, if any.
+            expected_seconds (float, optional): The expected total duration of the operation, if known.
+        Returns:
+            float: The delay in seconds.
+        """
+
+
+class FixedIntervalPolling(PollingStrategy):
+    """Polls immediately and then every `interval_seconds`, like the original poll loop."""
+
+    def __init__(self, interval_seconds: float = 2):
+        self.interval_seconds = interval_seconds
+
+    def get_delay(self, attempt, elapsed_seconds, retry_after=None, expected_seconds=None):
+        return 0.0 if attempt == 0 else self.interval_seconds
+
+
+class ExponentialBackoffPolling(PollingStrategy):
+    """Starts with short intervals and grows them geometrically up to a cap.
+
+    Short operations are picked up quickly, while long ones (e.g. multi-hour
+    videos) settle at `max_interval_seconds` instead of thousands of requests.
+    A Retry-After hint from the service is never undercut.
+    """
+
+    def __init__(
+        self,
+        initial_interval_seconds: float = 0.25,
+        multiplier: float = 2,
+        max_interval_seconds: float = 30,
+        jitter: float = 0.1,
+        respect_retry_after: bool = True,
+    ):
+        self.initial_interval_seconds = initial_interval_seconds
+        self.multiplier = multiplier
+        self.max_interval_seconds = max_interval_seconds
+        self.jitter = jitter
+        self.respect_retry_after = respect_retry_after
+
+    def _backoff(self, attempt):
+        delay = min(
+            self.max_interval_seconds,
+            self.initial_interval_seconds * (self.multiplier**attempt),
+        )
+        return delay * (1 + random.uniform(-self.jitter, self.jitter))
+
+    def get_delay(self, attempt, elapsed_seconds, retry_after=None, expected_seconds=None):
+        delay = self._backoff(attempt)
+        if self.respect_retry_after and retry_after:
+            delay = max(delay, retry_after)
+        return delay
+
+
+class AdaptivePolling(ExponentialBackoffPolling):
+    """Exponential backoff that first waits for the expected duration of the operation.
+
+    When an estimate is available (see DurationEstimator), the first status
+    request is sent shortly before the operation is expected to finish, and
+    backoff restarts from the initial interval after that point.
+    """
+
+    def __init__(self, lead_fraction: float = 0.9, **kwargs):
+        super().__init__(**kwargs)
+        self.lead_fraction = lead_fraction
+
+    def get_delay(self, attempt, elapsed_seconds, retry_after=None, expected_seconds=None):
+        if not expected_seconds:
+            return super().get_delay(attempt, elapsed_seconds, retry_after)
+        remaining = expected_seconds * self.lead_fraction - elapsed_seconds
+        if remaining > self.initial_interval_seconds:
+            delay = min(self.max_interval_seconds, remaining)
+        else:
+            # The wait for the expected duration used up the first attempt.
+            delay = self._backoff(max(0, attempt - 1))
+        if self.respect_retry_after and retry_after:
+            delay = max(delay, retry_after)
+        return delay
+
+
+class DurationEstimator:
+    """Learns the expected duration of operations from past completions.
+
+    Durations are tracked per key, e.g. (analyzer id, content type), as an
+    exponentially weighted moving average.
+    """
+
+    def __init__(self, smoothing: float = 0.3, max_keys: int = 1024):
+        self._smoothing = smoothing
+        self._max_keys = max_keys
+        self._estimates = {}
+        self._lock = threading.Lock()
+
+    def observe(self, key, duration_seconds: float):
+        """Records the duration of a completed operation.
+
+        Callers should pass their best estimate of when the operation actually
+        finished, not when completion was noticed; otherwise polling lag feeds
+        back into the estimate and it drifts upwards.
+        """
+        with self._lock:
+            estimate = self._estimates.pop(key, None)
+            if estimate is None:
+                estimate = duration_seconds
+            else:
+                estimate += self._smoothing * (duration_seconds - estimate)
+            # Re-inserting keeps the dict in least-recently-updated order.
+            self._estimates[key] = estimate
+            if len(self._estimates) > self._max_keys:
+                del self._estimates[next(iter(self._estimates))]
+
+    def estimate(self, key) -> float:
+        """Returns the expected duration in seconds for the key, or None if unknown."""
+        return self._estimates.get(key)
+
+
+class PollScheduler:
+    """Runs delayed callbacks for many operations from a single timer thread.
+
+    Due callbacks are kept in a heap and handed to a small worker pool, so any
+    number of in-flight operations share one timer instead of one sleeping
+    loop per operation. Callbacks that have not run when the scheduler is
+    closed get their `on_cancel` called instead, so nothing waits on them forever.
+    """
+
+    def __init__(self, max_workers: int = 4):
+        self._heap = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="cu-poll"
+        )
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="cu-poll-scheduler", daemon=True
+        )
+        self._thread.start()
+
+    def schedule(self, delay_seconds: float, callback, on_cancel=None):
+        """Runs `callback()` on a worker thread after `delay_seconds`.
+
+        If the scheduler is closed first, `on_cancel(error)` is called instead
+        with a RuntimeError describing why.
+        """
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Poll scheduler is closed.")
+            heapq.heappush(
+                self._heap,
+                (time.monotonic() + max(0.0, delay_seconds), next(self._sequence), callback, on_cancel),
+            )
+            if self._heap[0][2] is callback:
+                self._condition.notify()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._closed:
+                    if not self._heap:
+                        self._condition.wait()
+                        continue
+                    timeout = self._heap[0][0] - time.monotonic()
+                    if timeout <= 0:
+                        break
+                    self._condition.wait(timeout)
+                if self._closed:
+                    return
+                now = time.monotonic()
+                # Submitted under the lock, so close() cannot shut the pool down in between.
+                while self._heap and self._heap[0][0] <= now:
+                    _, _, callback, on_cancel = heapq.heappop(self._heap)
+                    try:
+                        self._executor.submit(self._dispatch, callback, on_cancel)
+                    except RuntimeError as e:
+                        self._cancel(on_cancel, e)
+
+    def _dispatch(self, callback, on_cancel):
+        if self._closed:
+            self._cancel(on_cancel, self._closed_error())
+        else:
+            callback()
+
+    @staticmethod
+    def _closed_error():
+        return RuntimeError("The client was closed before the operation completed.")
+
+    @staticmethod
+    def _cancel(on_cancel, error):
+        if on_cancel is not None:
+            on_cancel(error)
+
+    def close(self):
+        """Stops the timer thread and cancels the callbacks that have not run yet."""
+        with self._condition:
+            self._closed = True
+            pending = [entry[3] for entry in self._heap]
+            self._heap.clear()
+            self._condition.notify()
+        self._thread.join()
+        for on_cancel in pending:
+            self._cancel(on_cancel, self._closed_error())
+        # Callbacks already handed to the pool see the closed flag and cancel themselves.
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,50 @@
+import threading
+import time
+
+
+class TokenBucket:
+    """Thread-safe token bucket rate limiter.
+
+    Tokens are added continuously at `rate` per second up to `capacity`; every
+    `acquire` consumes one token and blocks until one is available.
+    """
+
+    def __init__(self, rate: float, capacity: float = None):
+        if rate <= 0:
+            raise ValueError("Rate must be greater than zero.")
+        self._rate = rate
+        self._capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self._capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self._tokens = min(
+            self._capacity, self._tokens + (now - self._updated_at) * self._rate
+        )
+        self._updated_at = now
+
+    def try_acquire(self, tokens: float = 1) -> float:
+        """Takes `tokens` if available.
+        Args:
+            tokens (float, optional): The number of tokens to take. Defaults to 1.
+        Returns:
+            float: 0 if the tokens were taken, otherwise the seconds to wait before retrying.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+            return (tokens - self._tokens) / self._rate
+
+    def acquire(self, tokens: float = 1):
+        """Blocks until `tokens` are available and takes them.
+        Args:
+            tokens (float, optional): The number of tokens to take. Defaults to 1.
+        """
+        while True:
+            wait_seconds = self.try_acquire(tokens)
+            if not wait_seconds:
+                return
+            time.sleep(wait_seconds)
@@ -0,0 +1,189 @@
+import hashlib
+import json
+import os
+import threading
+import time
+import zlib
+from pathlib import Path
+
+# Fields the service adds or updates on its own; they do not change what an
+# analyzer extracts, so they are left out of the definition hash.
+_VOLATILE_ANALYZER_FIELDS = frozenset(
+    ["analyzerId", "status", "createdAt", "lastModifiedAt", "warnings", "tags"]
+)
+
+
+def hash_content(content, block_size: int = 1 << 20) -> str:
+    """Returns the SHA-256 hex digest of content, reading it in blocks.
+
+    Args:
+        content (str | PathLike | bytes | memoryview | file-like): A local file path, a
+            bytes-like object, or a binary file-like object. A seekable file-like object
+            is rewound to where it started, so it can be uploaded afterwards.
+        block_size (int, optional): The number of bytes read at a time. Defaults to 1 MiB.
+
+    Returns:
+        str: The hex digest.
+    """
+    digest = hashlib.sha256()
+    if isinstance(content, (str, os.PathLike)):
+        with open(content, "rb") as file:
+            while block := file.read(block_size):
+                digest.update(block)
+    elif hasattr(content, "read"):
+        start = content.tell()
+        while block := content.read(block_size):
+            digest.update(block)
+        content.seek(start)
+    else:
+        digest.update(memoryview(content).cast("B"))
+    return digest.hexdigest()
+
+
+def hash_analyzer_definition(definition: dict) -> str:
+    """Returns a stable hash of an analyzer definition, ignoring service-managed fields."""
+    normalized = {
+        key: value
+        for key, value in definition.items()
+        if key not in _VOLATILE_ANALYZER_FIELDS
+    }
+    payload = json.dumps(normalized, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def make_cache_key(content_key: str, analyzer_id: str, analyzer_hash: str, api_version: str) -> str:
+    """Combines everything that determines an analyze result into one cache key."""
+    payload = "\0".join([content_key, analyzer_id, analyzer_hash or "", api_version])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class CacheStats:
+    """Hit/miss counters of a ResultCache."""
+
+    __slots__ = ("hits", "misses", "stores", "evictions")
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __repr__(self):
+        return (
+            f"CacheStats(hits={self.hits}, misses={self.misses}, stores={self.stores}, "
+            f"evictions={self.evictions}, hit_rate={self.hit_rate:.2%})"
+        )
+
+
+class ResultCache:
+    """Local on-disk cache of completed analyze results.
+
+    Results are stored zlib-compressed in a SQLite database. Entries older
+    than `max_age_seconds` are dropped, and the least recently used entries
+    are evicted once the stored size exceeds `max_size_bytes`.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_size_bytes: int = 1 << 30,
+        max_age_seconds: float = None,
+    ):
+        # Imported on first use: the client imports this module even when no cache is configured.
+        import sqlite3
+
+        Path(directory).mkdir(parents=True, exist_ok=True)
+        self._max_size_bytes = max_size_bytes
+        self._max_age_seconds = max_age_seconds
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            os.path.join(directory, "results.sqlite"),
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            " key TEXT PRIMARY KEY,"
+            " value BLOB NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " accessed_at REAL NOT NULL)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS results_accessed_at ON results (accessed_at)"
+        )
+        self.stats = CacheStats()
+
+    def get(self, key: str):
+        """Returns the cached result for the key, or None on a miss."""
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value, created_at FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            if row and self._max_age_seconds is not None and now - row[1] > self._max_age_seconds:
+                self._connection.execute("DELETE FROM results WHERE key = ?", (key,))
+                self.stats.evictions += 1
+                row = None
+            if row is None:
+                self.stats.misses += 1
+                return None
+            self._connection.execute(
+                "UPDATE results SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            self.stats.hits += 1
+        return json.loads(zlib.decompress(row[0]))
+
+    def put(self, key: str, result: dict):
+        """Stores a result and evicts old entries if the cache is over its limits."""
+        value = zlib.compress(json.dumps(result, separators=(",", ":")).encode("utf-8"))
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO results (key, value, size, created_at, accessed_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (key, value, len(value), now, now),
+            )
+            self.stats.stores += 1
+            self._evict(now)
+
+    def _evict(self, now):
+        if self._max_age_seconds is not None:
+            cursor = self._connection.execute(
+                "DELETE FROM results WHERE created_at < ?", (now - self._max_age_seconds,)
+            )
+            self.stats.evictions += cursor.rowcount
+        total_size = self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM results"
+        ).fetchone()[0]
+        if total_size <= self._max_size_bytes:
+            return
+        evicted = []
+        for key, size in self._connection.execute(
+            "SELECT key, size FROM results ORDER BY accessed_at"
+        ):
+            if total_size <= self._max_size_bytes:
+                break
+            evicted.append((key,))
+            total_size -= size
+        self._connection.executemany("DELETE FROM results WHERE key = ?", evicted)
+        self.stats.evictions += len(evicted)
+
+    def clear(self):
+        """Removes every cached result."""
+        with self._lock:
+            self._connection.execute("DELETE FROM results")
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self):
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM results").fetchone()[0]
@@ -0,0 +1,274 @@
+import datetime
+import gzip
+import json
+import os
+from pathlib import Path
+
+from .analyze_result import _VALUE_KEYS
+
+# Columns describing where each row comes from, ahead of the field columns.
+_ROW_COLUMNS = (
+    ("key", "string"),
+    ("content_index", "integer"),
+    ("kind", "string"),
+    ("start_time_ms", "integer"),
+    ("end_time_ms", "integer"),
+)
+
+
+class _Column:
+    """One output column: a top-level field, or a property of an object field."""
+
+    __slots__ = ("name", "path", "definition")
+
+    def __init__(self, name, path, definition):
+        self.name = name
+        self.path = path
+        self.definition = definition
+
+    def find(self, fields):
+        """Returns the field result of the column in a content's fields, or None."""
+        field = fields.get(self.path[0])
+        for name in self.path[1:]:
+            if not isinstance(field, dict):
+                return None
+            field = (field.get("valueObject") or {}).get(name)
+        return field if isinstance(field, dict) else None
+
+
+def _field_value(field, definition, for_arrow):
+    """Returns the plain value of a field result, shaped like its schema definition."""
+    if not isinstance(field, dict):
+        return None
+    field_type = definition.get("type")
+    if field_type == "array":
+        items = definition.get("items", {})
+        return [_field_value(item, items, for_arrow) for item in field.get("valueArray") or ()]
+    if field_type == "object":
+        properties = definition.get("properties", {})
+        value = field.get("valueObject") or {}
+        return {name: _field_value(value.get(name), properties[name], for_arrow) for name in properties}
+    value = field.get(_VALUE_KEYS.get(field_type, ""))
+    if field_type == "date" and for_arrow and isinstance(value, str):
+        try:
+            return datetime.date.fromisoformat(value)
+        except ValueError:
+            return None
+    if field_type not in _VALUE_KEYS and value is None:
+        # Unknown field types are kept as JSON so no data is lost.
+        return json.dumps(field)
+    return value
+
+
+def _arrow_type(pa, definition):
+    field_type = definition.get("type")
+    if field_type == "array":
+        return pa.list_(_arrow_type(pa, definition.get("items", {})))
+    if field_type == "object":
+        return pa.struct([
+            pa.field(name, _arrow_type(pa, prop))
+            for name, prop in definition.get("properties", {}).items()
+        ])
+    return {
+        "number": pa.float64(),
+        "integer": pa.int64(),
+        "boolean": pa.bool_(),
+        "date": pa.date32(),
+    }.get(field_type, pa.string())
+
+
+def _get_columns(field_schema):
+    """Returns the output columns of an analyzer's fieldSchema.
+
+    Object fields are flattened to one column per property, named
+    "Field.property", so queries can read them independently. Array fields stay
+    single list columns, of structs when their items are objects.
+    """
+    columns = []
+
+    def add(name, path, definition):
+        if definition.get("type") == "object" and definition.get("properties"):
+            for property_name, prop in definition["properties"].items():
+                add(f"{name}.{property_name}", path + (property_name,), prop)
+        else:
+            columns.append(_Column(name, path, definition))
+
+    for field_name, definition in (field_schema or {}).get("fields", {}).items():
+        add(field_name, (field_name,), definition)
+    return columns
+
+
+class ResultExporter:
+    """Writes the extracted fields of analyze results to a Parquet or gzipped JSON Lines file.
+
+    Each content with fields becomes one row: a `key` column identifying the
+    source (e.g. the analyzed file), the content's index, kind and time range,
+    then one column per field of the analyzer's fieldSchema. Fields missing
+    from a result are null and fields not in the schema are ignored, so every
+    row has the same columns.
+
+    Rows are written incrementally in batches of `batch_size`, so any number of
+    results can be exported with bounded memory. Parquet requires the optional
+    pyarrow package; by default it is used when installed, and gzipped JSON
+    Lines otherwise.
+
+    Example:
+        with ResultExporter.from_template("analyzer_templates/invoice.json", "invoices.parquet") as exporter:
+            for item in client.analyze_many(analyzer_id, files):
+                if item.succeeded:
+                    exporter.write(item.result, key=str(item.location))
+    """
+
+    def __init__(
+        self,
+        path,
+        field_schema: dict,
+        format: str = None,
+        batch_size: int = 10000,
+        compression: str = "zstd",
+        include_confidence: bool = False,
+    ):
+        """
+        Args:
+            path (str): The file to write; it is replaced if it exists.
+            field_schema (dict): The fieldSchema of the analyzer template.
+            format (str, optional): "parquet" or "jsonl.gz". Defaults to "parquet" when pyarrow
+                is installed, otherwise "jsonl.gz".
+            batch_size (int, optional): The number of rows buffered per write. Defaults to 10000.
+            compression (str, optional): The Parquet compression codec. Defaults to "zstd".
+            include_confidence (bool, optional): Add a "<column>.confidence" column for every
+                column that is not an array. Defaults to False.
+        """
+        if format is None:
+            try:
+                import pyarrow  # noqa: F401
+                format = "parquet"
+            except ImportError:
+                format = "jsonl.gz"
+        if format not in ("parquet", "jsonl.gz"):
+            raise ValueError("format must be 'parquet' or 'jsonl.gz'.")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1.")
+
+        self.path = Path(path)
+        self.format = format
+        self.rows_written = 0
+        self._columns = _get_columns(field_schema)
+        self._include_confidence = include_confidence
+        self._batch_size = batch_size
+        self._compression = compression
+        self._rows = []
+        self._writer = None
+        self._schema = None
+        self._closed = False
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        if format == "parquet":
+            try:
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+            except ImportError as e:
+                raise ImportError("Parquet export requires the pyarrow package.") from e
+            self._pa = pa
+            self._pq = pq
+            schema_fields = [
+                pa.field(name, _arrow_type(pa, {"type": field_type})) for name, field_type in _ROW_COLUMNS
+            ]
+            for column in self._columns:
+                schema_fields.append(pa.field(column.name, _arrow_type(pa, column.definition)))
+                if self._has_confidence(column):
+                    schema_fields.append(pa.field(f"{column.name}.confidence", pa.float64()))
+            self._schema = pa.schema(schema_fields)
+        else:
+            self._writer = gzip.open(self.path, "wt", encoding="utf-8", compresslevel=6)
+
+    @classmethod
+    def from_template(cls, template, path, **kwargs):
+        """Creates an exporter for the fieldSchema of an analyzer template, given as a dict or a JSON file path."""
+        if isinstance(template, (str, os.PathLike)):
+            with open(template, "r") as file:
+                template = json.load(file)
+        return cls(path, template.get("fieldSchema", {}), **kwargs)
+
+    @property
+    def column_names(self):
+        if self._schema is not None:
+            return list(self._schema.names)
+        names = [name for name, _ in _ROW_COLUMNS]
+        for column in self._columns:
+            names.append(column.name)
+            if self._has_confidence(column):
+                names.append(f"{column.name}.confidence")
+        return names
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _has_confidence(self, column):
+        return self._include_confidence and column.definition.get("type") != "array"
+
+    def write(self, result: dict, key: str = None):
+        """Adds the rows of one analyze result.
+
+        Args:
+            result (dict): The JSON returned by `poll_result`, or its "result" member.
+            key (str, optional): The value of the `key` column of the rows, e.g. the analyzed file.
+
+        Returns:
+            int: The number of rows added.
+        """
+        result = result.get("result", result)
+        for_arrow = self.format == "parquet"
+        added = 0
+        for index, content in enumerate(result.get("contents", [])):
+            fields = content.get("fields")
+            if not fields:
+                continue
+            row = [key, index, content.get("kind"), content.get("startTimeMs"), content.get("endTimeMs")]
+            for column in self._columns:
+                field = column.find(fields)
+                row.append(_field_value(field, column.definition, for_arrow))
+                if self._has_confidence(column):
+                    row.append(field.get("confidence") if field else None)
+            self._rows.append(row)
+            added += 1
+        if len(self._rows) >= self._batch_size:
+            self.flush()
+        return added
+
+    def flush(self):
+        """Writes the buffered rows."""
+        if not self._rows:
+            return
+        if self.format == "parquet":
+            pa = self._pa
+            table = pa.Table.from_arrays(
+                [pa.array(values, type=field.type) for values, field in zip(zip(*self._rows), self._schema)],
+                schema=self._schema,
+            )
+            if self._writer is None:
+                self._writer = self._pq.ParquetWriter(self.path, self._schema, compression=self._compression)
+            self._writer.write_table(table)
+        else:
+            names = self.column_names
+            self._writer.writelines(
+                json.dumps(dict(zip(names, row)), ensure_ascii=False, separators=(",", ":")) + "\n"
+                for row in self._rows
+            )
+        self.rows_written += len(self._rows)
+        self._rows = []
+
+    def close(self):
+        """Writes the remaining rows and closes the file. A Parquet file is written even with no rows."""
+        if self._closed:
+            return
+        self._closed = True
+        self.flush()
+        if self._writer is None and self.format == "parquet":
+            self._writer = self._pq.ParquetWriter(self.path, self._schema, compression=self._compression)
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
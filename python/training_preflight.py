@@ -0,0 +1,370 @@
+import hashlib
+import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from .analyze_result import _VALUE_KEYS
+
+ERROR = "error"
+WARNING = "warning"
+
+_LABELS_SUFFIX = ".labels.json"
+_RESULT_SUFFIX = ".result.json"
+_LFS_POINTER_PREFIX = b"version https://git-lfs.github.com/spec/"
+_SOURCE = re.compile(r"^D\((\d+)((?:,-?\d+(?:\.\d+)?)*)\)$")
+# Polygon points may fall slightly outside the page after deskewing.
+_SOURCE_TOLERANCE = 0.02
+_HASH_CHUNK_SIZE = 1 << 20
+
+
+class PreflightIssue:
+    """One problem found in a training folder.
+
+    Attributes:
+        severity (str): "error" for problems that break training, "warning" otherwise.
+        document (str): The name of the document the issue belongs to.
+        path (str): The labeled field, e.g. "Items[1].Price", or None for file-level issues.
+        message (str): What is wrong.
+    """
+
+    __slots__ = ("severity", "document", "path", "message")
+
+    def __init__(self, severity, document, path, message):
+        self.severity = severity
+        self.document = document
+        self.path = path
+        self.message = message
+
+    def __str__(self):
+        location = f"{self.document}: {self.path}" if self.path else self.document
+        return f"{self.severity}: {location}: {self.message}"
+
+    def __repr__(self):
+        return (
+            f"PreflightIssue(severity={self.severity!r}, document={self.document!r}, "
+            f"path={self.path!r}, message={self.message!r})"
+        )
+
+
+class PreflightReport:
+    """The outcome of `preflight_training_data`.
+
+    Attributes:
+        documents (list): The names of the training documents, sorted.
+        issues (list): The PreflightIssue found, errors first.
+        manifest (dict): {"digest": str, "files": {name: {"sha256": str, "size": int}}} of every
+            file of the folder; the digest changes whenever any file is added, removed or modified.
+    """
+
+    __slots__ = ("documents", "issues", "manifest")
+
+    def __init__(self, documents, issues, manifest):
+        self.documents = documents
+        self.issues = issues
+        self.manifest = manifest
+
+    @property
+    def errors(self):
+        return [issue for issue in self.issues if issue.severity == ERROR]
+
+    @property
+    def warnings(self):
+        return [issue for issue in self.issues if issue.severity == WARNING]
+
+    @property
+    def ok(self):
+        """Whether the folder has no errors."""
+        return not self.errors
+
+    @property
+    def digest(self):
+        return self.manifest["digest"]
+
+    def is_unchanged(self, previous_manifest):
+        """Whether the folder is identical to the one described by a previous manifest."""
+        return bool(previous_manifest) and previous_manifest.get("digest") == self.digest
+
+    def diff(self, previous_manifest):
+        """Compares the folder to a previous manifest.
+
+        Returns:
+            tuple: (changed, removed) sorted lists of file names; `changed` holds the new and
+                modified files to upload, `removed` the files to delete from the container.
+        """
+        previous_files = (previous_manifest or {}).get("files", {})
+        files = self.manifest["files"]
+        changed = [name for name, entry in files.items() if previous_files.get(name) != entry]
+        removed = [name for name in previous_files if name not in files]
+        return sorted(changed), sorted(removed)
+
+    def write_manifest(self, path):
+        """Saves the manifest as JSON, e.g. next to the folder after a successful upload."""
+        with open(path, "w") as file:
+            json.dump(self.manifest, file, indent=2, sort_keys=True)
+
+    def __repr__(self):
+        return (
+            f"PreflightReport(documents={len(self.documents)}, errors={len(self.errors)}, "
+            f"warnings={len(self.warnings)}, digest={self.digest[:12]!r})"
+        )
+
+
+def load_manifest(path):
+    """Loads a manifest saved by `PreflightReport.write_manifest`, or returns None if there is none."""
+    try:
+        with open(path, "r") as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return None
+
+
+def _hash_file(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(_HASH_CHUNK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _load_json(path, name, issues):
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            return json.load(file)
+    except (OSError, ValueError) as e:
+        issues.append(PreflightIssue(ERROR, name, None, f"Cannot read {Path(path).name}: {e}"))
+        return None
+
+
+def _get_document_content(result):
+    """Returns the document content of an OCR result file, as written by the labeling tool."""
+    contents = (result.get("result") or {}).get("contents") or []
+    for content in contents:
+        if content.get("kind", "document") == "document":
+            return content
+    return None
+
+
+class _LabelChecker:
+    """Checks the fieldLabels of one document against the schema and its OCR result."""
+
+    def __init__(self, name, field_schema, content, issues):
+        self._name = name
+        self._fields = field_schema.get("fields", {})
+        self._issues = issues
+        self._markdown = content.get("markdown", "") if content else None
+        self._pages = {page.get("pageNumber"): page for page in content.get("pages", [])} if content else None
+
+    def _report(self, severity, path, message):
+        self._issues.append(PreflightIssue(severity, self._name, path, message))
+
+    def check(self, field_labels):
+        for field_name, label in field_labels.items():
+            definition = self._fields.get(field_name)
+            if definition is None:
+                self._report(ERROR, field_name, "The field is not in the analyzer's fieldSchema.")
+                continue
+            self._check_label(field_name, label, definition)
+
+    def _check_label(self, path, label, definition):
+        if not isinstance(label, dict):
+            self._report(ERROR, path, "The label is not a JSON object.")
+            return
+        expected_type = definition.get("type")
+        label_type = label.get("type")
+        if expected_type and label_type != expected_type:
+            self._report(ERROR, path, f"The label type is {label_type!r} but the schema type is {expected_type!r}.")
+            return
+
+        if label_type == "array":
+            items = definition.get("items", {})
+            for index, item in enumerate(label.get("valueArray") or ()):
+                self._check_label(f"{path}[{index}]", item, items)
+            return
+        if label_type == "object":
+            properties = definition.get("properties", {})
+            for name, item in (label.get("valueObject") or {}).items():
+                if name not in properties:
+                    self._report(ERROR, f"{path}.{name}", "The property is not in the analyzer's fieldSchema.")
+                else:
+                    self._check_label(f"{path}.{name}", item, properties[name])
+            return
+
+        value = label.get(_VALUE_KEYS.get(label_type, ""))
+        if value is None:
+            self._report(WARNING, path, f"The label has no {_VALUE_KEYS.get(label_type, 'value')}.")
+        allowed = definition.get("enum")
+        if allowed and value is not None and value not in allowed:
+            self._report(ERROR, path, f"{value!r} is not one of the schema's enum values.")
+        self._check_spans(path, label, value)
+        self._check_source(path, label.get("source"))
+
+    def _check_spans(self, path, label, value):
+        spans = label.get("spans")
+        if not spans or self._markdown is None:
+            return
+        texts = []
+        for span in spans:
+            offset, length = span.get("offset", -1), span.get("length", -1)
+            if offset < 0 or length < 0 or offset + length > len(self._markdown):
+                self._report(
+                    ERROR, path,
+                    f"The span (offset={offset}, length={length}) is outside the OCR result "
+                    f"of {len(self._markdown)} characters.",
+                )
+                return
+            texts.append(self._markdown[offset:offset + length])
+        # Corrected labels may legitimately differ from the text they point to.
+        if label.get("kind") == "confirmed" and isinstance(value, str):
+            if "".join(" ".join(texts).split()) != "".join(value.split()):
+                self._report(WARNING, path, f"The spans cover {' '.join(texts)!r}, not the labeled value {value!r}.")
+
+    def _check_source(self, path, source):
+        if not source or self._pages is None:
+            return
+        for region in source.split(";"):
+            match = _SOURCE.match(region.strip())
+            if not match:
+                self._report(ERROR, path, f"{region!r} is not a D(page,x1,y1,...) source.")
+                continue
+            page_number = int(match.group(1))
+            page = self._pages.get(page_number)
+            if page is None:
+                self._report(ERROR, path, f"The source points to page {page_number}, which is not in the OCR result.")
+                continue
+            coordinates = [float(value) for value in match.group(2).split(",")[1:]]
+            if len(coordinates) < 4 or len(coordinates) % 2:
+                self._report(ERROR, path, f"{region!r} does not hold a polygon of x,y points.")
+                continue
+            width, height = page.get("width"), page.get("height")
+            if not width or not height:
+                continue
+            x_slack, y_slack = width * _SOURCE_TOLERANCE, height * _SOURCE_TOLERANCE
+            xs, ys = coordinates[0::2], coordinates[1::2]
+            if (
+                min(xs) < -x_slack or max(xs) > width + x_slack
+                or min(ys) < -y_slack or max(ys) > height + y_slack
+            ):
+                self._report(ERROR, path, f"{region!r} falls outside page {page_number} ({width}x{height}).")
+
+
+def _check_document(folder, name, files, field_schema):
+    """Checks one document and its labels; returns (issues, {file name: manifest entry})."""
+    issues = []
+    entries = {}
+    for file_name in files.values():
+        path = folder / file_name
+        entries[file_name] = {"sha256": _hash_file(path), "size": path.stat().st_size}
+
+    document = files.get("document")
+    if document is None:
+        issues.append(PreflightIssue(ERROR, name, None, "The labels or OCR result have no document file."))
+    else:
+        with open(folder / document, "rb") as file:
+            head = file.read(len(_LFS_POINTER_PREFIX))
+        if entries[document]["size"] == 0:
+            issues.append(PreflightIssue(ERROR, name, None, "The document file is empty."))
+        elif head == _LFS_POINTER_PREFIX:
+            issues.append(PreflightIssue(ERROR, name, None, "The document is a Git LFS pointer; run `git lfs pull`."))
+
+    if "labels" not in files:
+        if document is not None:
+            issues.append(PreflightIssue(WARNING, name, None, "The document has no labels file."))
+        return issues, entries
+    if "result" not in files:
+        issues.append(PreflightIssue(ERROR, name, None, "The labels have no OCR result file."))
+
+    labels = _load_json(folder / files["labels"], name, issues)
+    result = _load_json(folder / files["result"], name, issues) if "result" in files else None
+    content = _get_document_content(result) if result else None
+    if result and content is None:
+        issues.append(PreflightIssue(ERROR, name, None, "The OCR result has no document content."))
+    if labels is not None:
+        field_labels = labels.get("fieldLabels")
+        if not isinstance(field_labels, dict):
+            issues.append(PreflightIssue(ERROR, name, None, "The labels file has no fieldLabels."))
+        else:
+            _LabelChecker(name, field_schema, content, issues).check(field_labels)
+    return issues, entries
+
+
+def preflight_training_data(folder, field_schema, max_workers: int = 8):
+    """
+    Validates a labeled training folder locally before it is uploaded for `begin_create_analyzer`.
+
+    The folder is laid out like data/document_training: every document `<name>` comes
+    with `<name>.labels.json` and the OCR result `<name>.result.json` the labels point
+    into. Documents are checked in parallel for:
+    - documents, labels or OCR results missing their counterparts, empty documents and
+      Git LFS pointers committed in place of documents;
+    - documents with identical content;
+    - labeled fields and properties that are not in the fieldSchema, or whose type or
+      enum value does not match it;
+    - spans outside the OCR markdown, and confirmed labels whose spans cover other text;
+    - "D(page,x1,y1,...)" sources on pages missing from the OCR result or outside them.
+
+    The report also holds a content-hash manifest of the folder: compare it to the
+    manifest of the last upload to skip uploading and retraining an unchanged dataset.
+
+    Args:
+        folder (str): The training folder.
+        field_schema (dict | str): The fieldSchema, or an analyzer template given as a dict or JSON file path.
+        max_workers (int, optional): The number of documents checked concurrently. Defaults to 8.
+
+    Returns:
+        PreflightReport: The documents, issues and manifest of the folder.
+    """
+    if isinstance(field_schema, (str, os.PathLike)):
+        with open(field_schema, "r") as file:
+            field_schema = json.load(file)
+    field_schema = field_schema.get("fieldSchema", field_schema)
+
+    folder = Path(folder)
+    if not folder.is_dir():
+        raise ValueError(f"Training folder '{folder}' does not exist.")
+
+    # Group the files of each document: "<name>", "<name>.labels.json" and "<name>.result.json".
+    documents = {}
+    for path in folder.rglob("*"):
+        if not path.is_file() or any(part.startswith(".") for part in path.relative_to(folder).parts):
+            continue
+        file_name = path.relative_to(folder).as_posix()
+        if file_name.endswith(_LABELS_SUFFIX):
+            documents.setdefault(file_name[:-len(_LABELS_SUFFIX)], {})["labels"] = file_name
+        elif file_name.endswith(_RESULT_SUFFIX):
+            documents.setdefault(file_name[:-len(_RESULT_SUFFIX)], {})["result"] = file_name
+        else:
+            documents.setdefault(file_name, {})["document"] = file_name
+
+    names = sorted(documents)
+    issues = []
+    files = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        outcomes = executor.map(
+            lambda name: _check_document(folder, name, documents[name], field_schema), names
+        )
+        for document_issues, entries in outcomes:
+            issues.extend(document_issues)
+            files.update(entries)
+
+    first_by_hash = {}
+    for name in names:
+        document = documents[name].get("document")
+        if document is None:
+            continue
+        digest = files[document]["sha256"]
+        if digest in first_by_hash:
+            issues.append(PreflightIssue(WARNING, name, None, f"The document is a duplicate of {first_by_hash[digest]}."))
+        else:
+            first_by_hash[digest] = name
+
+    files = dict(sorted(files.items()))
+    manifest = {
+        "digest": hashlib.sha256(json.dumps(files, sort_keys=True).encode("utf-8")).hexdigest(),
+        "files": files,
+    }
+    issues.sort(key=lambda issue: (issue.severity != ERROR, issue.document))
+    return PreflightReport(
+        [name for name in names if "document" in documents[name]], issues, manifest
+    )
@@ -0,0 +1,115 @@
+"""Runs the synchronous and async clients against the local mock service.
+
+Usage:
+    python -m pytest tests
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT_DIR))
+
+from benchmarks.mock_service import MockContentUnderstandingService, MockServiceConfig  # noqa: E402
+from python.content_understanding_async_client import AsyncContentUnderstandingClient  # noqa: E402
+from python.content_understanding_client import AzureContentUnderstandingClient  # noqa: E402
+from python.polling import FixedIntervalPolling  # noqa: E402
+
+API_VERSION = "2024-12-01-preview"
+ANALYZER_ID = "test-analyzer"
+CLIENT_OPTIONS = {
+    "subscription_key": "test",
+    "backoff_factor": 0.01,
+    "polling_strategy": FixedIntervalPolling(0.05),
+}
+
+
+@pytest.fixture
+def service_factory():
+    services = []
+
+    def start(**config):
+        config.setdefault("processing_seconds", 0.1)
+        config.setdefault("processing_jitter", 0.0)
+        service = MockContentUnderstandingService(MockServiceConfig(**config)).start()
+        services.append(service)
+        return service
+
+    yield start
+    for service in services:
+        service.stop()
+
+
+def test_sync_analyze_and_poll(service_factory):
+    service = service_factory()
+    with AzureContentUnderstandingClient(service.endpoint, API_VERSION, **CLIENT_OPTIONS) as client:
+        response = client.begin_analyze(ANALYZER_ID, b"%PDF-1.7 test")
+        result = client.poll_result(response, timeout_seconds=10)
+    assert result["status"] == "Succeeded"
+    assert result["result"]["analyzerId"] == ANALYZER_ID
+    assert service.stats["analyze"] == 1
+    assert service.stats["get_result"] >= 1
+
+
+def test_async_analyze_and_poll(service_factory):
+    service = service_factory()
+
+    async def run():
+        async with AsyncContentUnderstandingClient(service.endpoint, API_VERSION, **CLIENT_OPTIONS) as client:
+            response = await client.begin_analyze(ANALYZER_ID, b"%PDF-1.7 test")
+            return await client.poll_result(response, timeout_seconds=10)
+
+    result = asyncio.run(run())
+    assert result["status"] == "Succeeded"
+    assert result["result"]["analyzerId"] == ANALYZER_ID
+    assert service.stats["analyze"] == 1
+    assert service.stats["get_result"] >= 1
+
+
+def test_sync_retries_throttled_requests(service_factory):
+    # One request per second: the second submission is throttled and retried after Retry-After.
+    service = service_factory(throttle_rps=1, retry_after_seconds=1)
+    with AzureContentUnderstandingClient(service.endpoint, API_VERSION, **CLIENT_OPTIONS) as client:
+        responses = [client.begin_analyze(ANALYZER_ID, b"%PDF-1.7 test") for _ in range(2)]
+    assert [response.status_code for response in responses] == [202, 202]
+    assert service.stats["throttled"] >= 1
+    assert service.stats["analyze"] == 2 + service.stats["throttled"]
+
+
+def test_async_retries_throttled_requests(service_factory):
+    service = service_factory(throttle_rps=1, retry_after_seconds=1)
+
+    async def run():
+        async with AsyncContentUnderstandingClient(service.endpoint, API_VERSION, **CLIENT_OPTIONS) as client:
+            return [await client.begin_analyze(ANALYZER_ID, b"%PDF-1.7 test") for _ in range(2)]
+
+    responses = asyncio.run(run())
+    assert [response.status for response in responses] == [202, 202]
+    assert service.stats["throttled"] >= 1
+    assert service.stats["analyze"] == 2 + service.stats["throttled"]
+
+
+def test_sync_close_fails_pending_polls(service_factory):
+    service = service_factory(processing_seconds=30)
+    client = AzureContentUnderstandingClient(service.endpoint, API_VERSION, **CLIENT_OPTIONS)
+    future = client.begin_poll(client.begin_analyze(ANALYZER_ID, b"%PDF-1.7 test"))
+    client.close()
+    with pytest.raises(RuntimeError, match="closed"):
+        future.result(timeout=5)
+
+
+def test_async_close_releases_the_session(service_factory):
+    service = service_factory()
+
+    async def run():
+        client = AsyncContentUnderstandingClient(service.endpoint, API_VERSION, **CLIENT_OPTIONS)
+        await client.get_all_analyzers()
+        session = client._session
+        await client.close()
+        return client, session
+
+    client, session = asyncio.run(run())
+    assert session.closed
+    assert client._session is None